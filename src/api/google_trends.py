@@ -0,0 +1,191 @@
+# src/api/google_trends.py
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
+
+import pandas as pd
+
+from src.api.naver_datalab_async import backoff_delay
+from src.api.naver_datalab_cache import DatalabCache
+
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # 프로젝트 루트
+GOOGLE_TRENDS_CACHE_DIR = BASE_DIR / "data" / "cache" / "google_trends"
+
+# 구글 트렌드 비교 요청 한 번에 넣을 수 있는 키워드 최대 개수
+MAX_KEYWORDS = 5
+
+# 구글 트렌드 카테고리 (47 = 자동차)
+CATEGORY_AUTOS = 47
+
+# pytrends tz: UTC 오프셋(분)을 부호를 뒤집어 넣는다 (JS getTimezoneOffset 과 같은 규칙)
+# KST = UTC+9 → -540
+KST_TZ = -540
+
+
+class TrendsBackend(Protocol):
+    """
+    구글 트렌드 조회 백엔드.
+    반환: 날짜 인덱스 + 키워드별 컬럼(0~100) DataFrame
+    (테스트에서는 같은 형태를 돌려주는 stub 으로 바꿔 끼운다)
+    """
+
+    def interest_over_time(
+        self, keywords: List[str], timeframe: str, geo: str, cat: int
+    ) -> pd.DataFrame: ...
+
+
+class PytrendsBackend:
+    """
+    pytrends(TrendReq) 기반 백엔드. pytrends 는 실제로 쓸 때만 import 한다.
+    """
+
+    def __init__(self, hl: str = "ko", tz: int = KST_TZ, timeout: tuple = (10, 25)):
+        from pytrends.request import TrendReq
+
+        self._trend_req = TrendReq(hl=hl, tz=tz, timeout=timeout)
+        self._lock = threading.Lock()
+
+    def interest_over_time(
+        self, keywords: List[str], timeframe: str, geo: str, cat: int
+    ) -> pd.DataFrame:
+        # TrendReq 는 payload 를 객체에 들고 있으므로 요청 단위로 잠근다
+        with self._lock:
+            self._trend_req.build_payload(keywords, cat=cat, timeframe=timeframe, geo=geo)
+            return self._trend_req.interest_over_time()
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """
+    429 (TooManyRequestsError 등) 여부
+    """
+    return "429" in str(error) or "TooManyRequests" in type(error).__name__
+
+
+class RateLimiter:
+    """
+    여러 스레드가 공유하는 요청 간격 제한.
+    직전 요청 이후 min_interval_sec + [0, jitter_sec) 가 지나야 다음 요청을 보낸다.
+    """
+
+    def __init__(self, min_interval_sec: float, jitter_sec: float = 0.0):
+        self.min_interval_sec = min_interval_sec
+        self.jitter_sec = jitter_sec
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.min_interval_sec + random.uniform(0, self.jitter_sec)
+        delay = start_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def frame_to_response(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    interest_over_time DataFrame → 캐시에 저장할 JSON
+      {"dates": ["YYYY-MM-DD", ...], "values": {keyword: [값, ...]}}
+    (pytrends 가 붙이는 isPartial 컬럼은 버린다)
+    """
+    df = df.drop(columns=["isPartial"], errors="ignore")
+    dates = [pd.Timestamp(d).strftime("%Y-%m-%d") for d in df.index]
+    values = {
+        str(col): [None if pd.isna(v) else float(v) for v in df[col]] for col in df.columns
+    }
+    return {"dates": dates, "values": values}
+
+
+class GoogleTrendsClient:
+    """
+    구글 트렌드 조회 클라이언트 (스레드 여러 개에서 같이 사용)
+
+    - RateLimiter 로 요청 간격 제한 (구글은 짧은 간격으로 몰아서 보내면 429)
+    - 실패 시 지수 백오프(jitter) 재시도, 429 는 더 길게 대기
+    - cache 가 있으면 요청 내용(키워드/기간/지역/카테고리) 해시로 응답을 저장하고 재사용
+      → 중간에 멈춰도 다시 실행하면 끝난 그룹은 요청하지 않는다(재개)
+    """
+
+    def __init__(
+        self,
+        backend: Optional[TrendsBackend] = None,
+        min_interval_sec: float = 5.0,
+        jitter_sec: float = 2.0,
+        max_retries: int = 3,
+        backoff_base: float = 5.0,
+        backoff_max: float = 180.0,
+        cache: Optional[DatalabCache] = None,
+    ):
+        self.backend = backend or PytrendsBackend()
+        self.limiter = RateLimiter(min_interval_sec, jitter_sec)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.cache = cache
+
+        # 실제로 보낸 요청 수 (재시도 포함) / 재시도 횟수
+        self.call_count = 0
+        self.retry_count = 0
+        self._count_lock = threading.Lock()
+
+    def fetch(
+        self,
+        keywords: List[str],
+        start_date: str,
+        end_date: str,
+        geo: str = "KR",
+        cat: int = CATEGORY_AUTOS,
+    ) -> Dict[str, Any]:
+        """
+        키워드 최대 5개를 한 번에 비교 조회. 반환 형식은 frame_to_response 참고.
+        """
+        if not keywords or len(keywords) > MAX_KEYWORDS:
+            raise ValueError(f"키워드는 1~{MAX_KEYWORDS}개여야 합니다: {keywords}")
+
+        body = {
+            "source": "google_trends",
+            "keywords": list(keywords),
+            "startDate": start_date,
+            "endDate": end_date,
+            "geo": geo,
+            "cat": cat,
+        }
+        if self.cache is not None:
+            cached = self.cache.get(body)
+            if cached is not None:
+                return cached
+
+        timeframe = f"{start_date} {end_date}"
+        attempt = 0
+        while True:
+            self.limiter.wait()
+            with self._count_lock:
+                self.call_count += 1
+            try:
+                df = self.backend.interest_over_time(list(keywords), timeframe, geo, cat)
+                break
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                base = self.backoff_base * (4 if is_rate_limited(e) else 1)
+                delay = backoff_delay(attempt, base, self.backoff_max)
+                attempt += 1
+                with self._count_lock:
+                    self.retry_count += 1
+                print(
+                    f"[WARN] 구글 트렌드 재시도 {attempt}/{self.max_retries} "
+                    f"({type(e).__name__}), {delay:.1f}s 대기: {keywords}"
+                )
+                time.sleep(delay)
+
+        data = frame_to_response(df)
+        if self.cache is not None:
+            self.cache.put(body, data)
+        return data
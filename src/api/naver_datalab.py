@@ -6,12 +6,139 @@ from typing import List, Dict, Any, Optional
 import os
 import requests
 
+from src.api.naver_datalab_cache import DatalabCache
+
+
+# 데이터랩 검색 API 한 번에 보낼 수 있는 keywordGroups 최대 개수
+MAX_KEYWORD_GROUPS = 5
+
+
+def chunk_keywords(
+    keywords: List[str], anchor_keyword: str, size: int = MAX_KEYWORD_GROUPS - 1
+) -> List[List[str]]:
+    """
+    앵커 자리 1개를 남기고 키워드를 size 개씩 묶는다.
+    중복 키워드와 앵커와 같은 키워드는 한 번만 요청한다.
+    """
+    unique: List[str] = []
+    seen = {anchor_keyword}
+    for kw in keywords:
+        if kw in seen:
+            continue
+        seen.add(kw)
+        unique.append(kw)
+    return [unique[i : i + size] for i in range(0, len(unique), size)]
+
+
+def anchored_groups(keywords: List[str], anchor_keyword: str) -> List[Dict[str, Any]]:
+    """
+    키워드 최대 4개 + 앵커 키워드 1개의 keywordGroups 를 만든다.
+    """
+    if len(keywords) > MAX_KEYWORD_GROUPS - 1:
+        raise ValueError(
+            f"앵커 포함 최대 {MAX_KEYWORD_GROUPS}개 그룹: keywords={len(keywords)}"
+        )
+    groups = [{"groupName": kw, "keywords": [kw]} for kw in keywords]
+    groups.append({"groupName": anchor_keyword, "keywords": [anchor_keyword]})
+    return groups
+
+
+def build_request_body(
+    keyword_groups: List[Dict[str, Any]],
+    start_date: str,
+    end_date: str,
+    time_unit: str = "month",
+    ages: Optional[List[str]] = None,
+    device: Optional[str] = None,
+    gender: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    데이터랩 검색 API 요청 body. (동기/비동기 클라이언트 공용)
+    """
+    if len(keyword_groups) > MAX_KEYWORD_GROUPS:
+        raise ValueError(
+            f"keywordGroups 는 최대 {MAX_KEYWORD_GROUPS}개까지 가능합니다: {len(keyword_groups)}"
+        )
+
+    body: Dict[str, Any] = {
+        "startDate": start_date,
+        "endDate": end_date,
+        "timeUnit": time_unit,  # "date", "week", "month"
+        "keywordGroups": keyword_groups,
+    }
+
+    if ages:
+        body["ages"] = ages
+    if device:
+        body["device"] = device
+    if gender:
+        body["gender"] = gender
+    return body
+
+
+def parse_results(data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    응답 JSON → {groupName: [{"period": ..., "ratio": ...}, ...]}
+    """
+    return {r.get("title"): r.get("data", []) for r in (data.get("results") or [])}
+
+
+def rescale_values_to_anchor(
+    values: Dict[str, List[Optional[float]]], anchor_keyword: str, ndigits: int = 5
+) -> Optional[Dict[str, List[Optional[float]]]]:
+    """
+    {키워드: 값 목록} 을 앵커 키워드의 기간 내 최고값 = 100 기준으로 다시 스케일한다.
+    (네이버 데이터랩 / 구글 트렌드 공통. None 값은 None 으로 둔다)
+
+    앵커 데이터가 없거나 0 이면 스케일할 수 없으므로 None.
+    """
+    anchor_max = max(
+        (float(v) for v in values.get(anchor_keyword) or [] if v is not None), default=0.0
+    )
+    if anchor_max <= 0:
+        return None
+
+    factor = 100.0 / anchor_max
+    return {
+        keyword: [None if v is None else round(float(v) * factor, ndigits) for v in series]
+        for keyword, series in values.items()
+        if keyword != anchor_keyword
+    }
+
+
+def rescale_to_anchor(
+    results: Dict[str, List[Dict[str, Any]]], anchor_keyword: str
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    데이터랩은 요청마다 (요청 안의 모든 그룹 중 최고값 = 100) 으로 정규화한다.
+    같은 앵커 키워드를 모든 배치에 넣고, 앵커의 기간 내 최고값이 100 이 되도록
+    배치별 ratio 를 다시 스케일하면 배치가 달라도 같은 기준으로 비교할 수 있다.
+
+    앵커 데이터가 없거나 0 이면 스케일할 수 없으므로 None.
+    """
+    scaled = rescale_values_to_anchor(
+        {keyword: [p.get("ratio") for p in points] for keyword, points in results.items()},
+        anchor_keyword,
+    )
+    if scaled is None:
+        return None
+
+    return {
+        keyword: [
+            {**p, "ratio": ratio} for p, ratio in zip(results[keyword], ratios) if ratio is not None
+        ]
+        for keyword, ratios in scaled.items()
+    }
+
 
 class NaverDatalabClient:
     BASE_URL = "https://openapi.naver.com/v1/datalab/search"
 
     def __init__(
-        self, client_id: Optional[str] = None, client_secret: Optional[str] = None
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        cache: Optional[DatalabCache] = None,
     ):
         self.client_id = client_id or os.getenv("NAVER_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("NAVER_CLIENT_SECRET")
@@ -21,46 +148,138 @@ class NaverDatalabClient:
                 "NAVER_DATALAB_CLIENT_ID / NAVER_DATALAB_CLIENT_SECRET 환경변수가 필요합니다."
             )
 
-    def fetch_trend(
+        # 네트워크 호출 전에 먼저 확인하는 응답 캐시 (None 이면 사용 안 함)
+        self.cache = cache
+
+        # 실제로 보낸 API 요청 수 (수집 스크립트 요약 출력용)
+        self.call_count = 0
+
+    def fetch_trend_groups(
         self,
-        keyword: str,
+        keyword_groups: List[Dict[str, Any]],
         start_date: str,
         end_date: str,
         time_unit: str = "month",
         ages: Optional[List[str]] = None,
         device: Optional[str] = None,
         gender: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        단일 키워드에 대해 네이버 데이터랩 검색 트렌드를 가져온다.
-        반환값은 [{"period": "YYYY-MM-DD", "ratio": float}, ...] 형태의 리스트.
+        최대 5개의 keywordGroups 를 한 번의 요청으로 가져온다.
+        keyword_groups: [{"groupName": "...", "keywords": ["...", ...]}, ...]
+        반환값은 {groupName: [{"period": "YYYY-MM-DD", "ratio": float}, ...]} 형태.
         """
+        if not keyword_groups:
+            return {}
+
         headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret,
         }
 
-        body: Dict[str, Any] = {
-            "startDate": start_date,
-            "endDate": end_date,
-            "timeUnit": time_unit,  # "date", "week", "month"
-            "keywordGroups": [{"groupName": keyword, "keywords": [keyword]}],
-        }
+        body = build_request_body(
+            keyword_groups, start_date, end_date, time_unit, ages, device, gender
+        )
 
-        if ages:
-            body["ages"] = ages
-        if device:
-            body["device"] = device
-        if gender:
-            body["gender"] = gender
+        if self.cache is not None:
+            cached = self.cache.get(body)
+            if cached is not None:
+                return parse_results(cached)
 
+        self.call_count += 1
         resp = requests.post(self.BASE_URL, headers=headers, json=body, timeout=10)
         resp.raise_for_status()
         data = resp.json()
 
-        results = data.get("results") or []
-        if not results:
-            return []
+        if self.cache is not None:
+            self.cache.put(body, data)
+        return parse_results(data)
+
+    def fetch_trend(
+        self,
+        keyword: str,
+        start_date: str,
+        end_date: str,
+        time_unit: str = "month",
+        ages: Optional[List[str]] = None,
+        device: Optional[str] = None,
+        gender: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        단일 키워드에 대해 네이버 데이터랩 검색 트렌드를 가져온다.
+        반환값은 [{"period": "YYYY-MM-DD", "ratio": float}, ...] 형태의 리스트.
+        """
+        results = self.fetch_trend_groups(
+            [{"groupName": keyword, "keywords": [keyword]}],
+            start_date=start_date,
+            end_date=end_date,
+            time_unit=time_unit,
+            ages=ages,
+            device=device,
+            gender=gender,
+        )
+        return results.get(keyword, [])
+
+    def fetch_trend_anchored(
+        self,
+        keywords: List[str],
+        anchor_keyword: str,
+        start_date: str,
+        end_date: str,
+        time_unit: str = "month",
+        ages: Optional[List[str]] = None,
+        device: Optional[str] = None,
+        gender: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        키워드 최대 4개 + 앵커 키워드 1개를 한 번에 요청하고,
+        앵커 기준(앵커 최고값 = 100)으로 다시 스케일한 결과를 반환한다.
+        (배치 나누기는 chunk_keywords 사용)
+
+        앵커로 스케일할 수 없으면 RuntimeError.
+        """
+        results = self.fetch_trend_groups(
+            anchored_groups(keywords, anchor_keyword),
+            start_date=start_date,
+            end_date=end_date,
+            time_unit=time_unit,
+            ages=ages,
+            device=device,
+            gender=gender,
+        )
+
+        rescaled = rescale_to_anchor(results, anchor_keyword)
+        if rescaled is None:
+            raise RuntimeError(f"앵커 키워드 데이터가 없어 스케일 불가: {anchor_keyword}")
+        return rescaled
 
-        # 기본적으로 첫 번째 그룹만 사용
-        return results[0].get("data", [])
+    def fetch_trend_batched(
+        self,
+        keywords: List[str],
+        anchor_keyword: str,
+        start_date: str,
+        end_date: str,
+        time_unit: str = "month",
+        ages: Optional[List[str]] = None,
+        device: Optional[str] = None,
+        gender: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        키워드 목록 전체를 (4개 + 앵커) 배치로 나눠 요청하고
+        앵커 기준으로 같은 스케일에 맞춘 결과를 합쳐서 반환한다.
+        """
+        merged: Dict[str, List[Dict[str, Any]]] = {}
+        for batch in chunk_keywords(keywords, anchor_keyword):
+            merged.update(
+                self.fetch_trend_anchored(
+                    batch,
+                    anchor_keyword,
+                    start_date=start_date,
+                    end_date=end_date,
+                    time_unit=time_unit,
+                    ages=ages,
+                    device=device,
+                    gender=gender,
+                )
+            )
+        return merged
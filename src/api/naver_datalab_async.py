@@ -0,0 +1,283 @@
+# src/api/naver_datalab_async.py
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import os
+import random
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.api.naver_datalab import (
+    NaverDatalabClient,
+    anchored_groups,
+    build_request_body,
+    parse_results,
+    rescale_to_anchor,
+)
+from src.api.naver_datalab_cache import DatalabCache
+
+
+# 네이버 데이터랩 검색 API 기본 한도 (애플리케이션당 하루 1,000회)
+DEFAULT_DAILY_QUOTA = 1000
+
+# 재시도 대상 HTTP 상태 (429 Too Many Requests, 5xx)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class QuotaExceededError(RuntimeError):
+    """일일 호출 한도를 다 써서 더 이상 요청할 수 없음."""
+
+
+class TokenBucket:
+    """
+    초당 호출 수(rate_per_sec) + 일일 한도(daily_quota) 토큰 버킷.
+    - burst: 한 번에 몰아서 쓸 수 있는 최대 토큰 수
+    - 날짜가 바뀌면 일일 사용량을 0으로 되돌린다.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: int = 1,
+        daily_quota: Optional[int] = DEFAULT_DAILY_QUOTA,
+    ):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec 는 0보다 커야 합니다.")
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(1, burst)
+        self.daily_quota = daily_quota
+
+        self._tokens = float(self.burst)
+        self._updated_at: Optional[float] = None
+        self._day = datetime.date.today()
+        self.used_today = 0
+        self._lock = asyncio.Lock()
+
+    def _consume_daily(self) -> None:
+        today = datetime.date.today()
+        if today != self._day:
+            self._day = today
+            self.used_today = 0
+
+        if self.daily_quota is not None and self.used_today >= self.daily_quota:
+            raise QuotaExceededError(
+                f"일일 호출 한도 초과: {self.used_today}/{self.daily_quota}"
+            )
+        self.used_today += 1
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._consume_daily()
+
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated_at is None:
+                    self._updated_at = now
+                elapsed = now - self._updated_at
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_sec)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_sec)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    지수 백오프 + full jitter: [0, min(cap, base * 2^attempt)] 에서 랜덤.
+    """
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+class AsyncNaverDatalabClient:
+    """
+    asyncio 용 데이터랩 클라이언트.
+
+    - requests.Session 하나를 재사용 (HTTPAdapter 커넥션 풀 = concurrency)
+      실제 요청은 asyncio.to_thread 로 스레드에서 실행한다.
+    - TokenBucket 으로 초당 호출 수 / 일일 한도 제한
+    - 429 / 5xx / 연결 오류는 지수 백오프(jitter)로 재시도, Retry-After 헤더가 있으면 우선
+    - 동시에 진행 중인 요청 수는 concurrency 로 제한
+    - cache 가 있으면 토큰/네트워크를 쓰기 전에 먼저 캐시를 확인
+
+    base_url 을 바꾸면 로컬 stub 서버(tests/datalab_stub_server.py)를 상대로 테스트할 수 있다.
+
+    사용 예:
+        async with AsyncNaverDatalabClient(concurrency=4) as client:
+            results = await client.fetch_trend_anchored([...], "자동차", ...)
+    """
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        base_url: Optional[str] = None,
+        concurrency: int = 4,
+        rate_per_sec: float = 5.0,
+        daily_quota: Optional[int] = DEFAULT_DAILY_QUOTA,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0,
+        cache: Optional[DatalabCache] = None,
+    ):
+        self.client_id = client_id or os.getenv("NAVER_CLIENT_ID")
+        self.client_secret = client_secret or os.getenv("NAVER_CLIENT_SECRET")
+
+        if not self.client_id or not self.client_secret:
+            raise RuntimeError(
+                "NAVER_DATALAB_CLIENT_ID / NAVER_DATALAB_CLIENT_SECRET 환경변수가 필요합니다."
+            )
+
+        self.base_url = base_url or NaverDatalabClient.BASE_URL
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+        self.bucket = TokenBucket(
+            rate_per_sec=rate_per_sec, burst=self.concurrency, daily_quota=daily_quota
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._session: Optional[requests.Session] = None
+        self.cache = cache
+
+        # 실제로 보낸 API 요청 수 (재시도 포함) / 재시도 횟수
+        self.call_count = 0
+        self.retry_count = 0
+
+    async def __aenter__(self) -> "AsyncNaverDatalabClient":
+        self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def open(self) -> None:
+        if self._session is not None:
+            return
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {
+                "X-Naver-Client-Id": self.client_id,
+                "X-Naver-Client-Secret": self.client_secret,
+            }
+        )
+        self._session = session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def _post(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        if self._session is None:
+            self.open()
+
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+
+            async with self._semaphore:
+                self.call_count += 1
+                try:
+                    resp = await asyncio.to_thread(
+                        self._session.post, self.base_url, json=body, timeout=self.timeout
+                    )
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    resp = None
+                    error: Exception = e
+
+            if resp is not None and resp.status_code not in RETRY_STATUS:
+                resp.raise_for_status()
+                return resp.json()
+
+            if attempt >= self.max_retries:
+                if resp is not None:
+                    resp.raise_for_status()
+                raise error
+
+            delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+            if resp is not None:
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = min(self.backoff_max, float(retry_after))
+                reason = f"HTTP {resp.status_code}"
+            else:
+                reason = type(error).__name__
+
+            attempt += 1
+            self.retry_count += 1
+            print(
+                f"[WARN] 데이터랩 재시도 {attempt}/{self.max_retries} ({reason}), {delay:.2f}s 대기"
+            )
+            await asyncio.sleep(delay)
+
+    async def fetch_trend_groups(
+        self,
+        keyword_groups: List[Dict[str, Any]],
+        start_date: str,
+        end_date: str,
+        time_unit: str = "month",
+        ages: Optional[List[str]] = None,
+        device: Optional[str] = None,
+        gender: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        NaverDatalabClient.fetch_trend_groups 의 비동기 버전.
+        """
+        if not keyword_groups:
+            return {}
+
+        body = build_request_body(
+            keyword_groups, start_date, end_date, time_unit, ages, device, gender
+        )
+
+        if self.cache is not None:
+            cached = self.cache.get(body)
+            if cached is not None:
+                return parse_results(cached)
+
+        data = await self._post(body)
+        if self.cache is not None:
+            self.cache.put(body, data)
+        return parse_results(data)
+
+    async def fetch_trend_anchored(
+        self,
+        keywords: List[str],
+        anchor_keyword: str,
+        start_date: str,
+        end_date: str,
+        time_unit: str = "month",
+        ages: Optional[List[str]] = None,
+        device: Optional[str] = None,
+        gender: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        NaverDatalabClient.fetch_trend_anchored 의 비동기 버전.
+        """
+        results = await self.fetch_trend_groups(
+            anchored_groups(keywords, anchor_keyword),
+            start_date=start_date,
+            end_date=end_date,
+            time_unit=time_unit,
+            ages=ages,
+            device=device,
+            gender=gender,
+        )
+
+        rescaled = rescale_to_anchor(results, anchor_keyword)
+        if rescaled is None:
+            raise RuntimeError(f"앵커 키워드 데이터가 없어 스케일 불가: {anchor_keyword}")
+        return rescaled
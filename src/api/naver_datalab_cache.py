@@ -0,0 +1,108 @@
+# src/api/naver_datalab_cache.py
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # 프로젝트 루트
+DATALAB_CACHE_DIR = BASE_DIR / "data" / "cache" / "naver_datalab"
+
+DEFAULT_TTL_HOURS = 24.0
+
+
+def body_hash(body: Dict[str, Any]) -> str:
+    """
+    요청 body 의 내용 해시 (키 순서와 무관하게 같은 요청이면 같은 값)
+    """
+    canonical = json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def is_closed_period(body: Dict[str, Any], fetched_on: datetime.date) -> bool:
+    """
+    요청 기간(endDate)이 응답을 받은 달(fetched_on) 이전에 끝났으면 확정된 데이터 → 만료 없음.
+    오늘 기준으로 판단하면 월 중간에 받은 이번 달 응답이 다음 달부터 영구 캐시가 되므로
+    반드시 캐시에 저장된 시각을 넘긴다.
+    """
+    try:
+        end_date = datetime.date.fromisoformat(body["endDate"])
+    except (KeyError, ValueError):
+        return False
+    return end_date < fetched_on.replace(day=1)
+
+
+class DatalabCache:
+    """
+    데이터랩 응답 디스크 캐시 (요청 body 해시 기준)
+
+      data/cache/naver_datalab/<hash 앞 2자리>/<hash>.json
+        {"body": 요청 body, "response": 응답 JSON, "cached_at": epoch 초}
+
+    - 받은 시점(cached_at) 기준 지난달까지로 끝나는 요청은 만료되지 않는다.
+    - 받은 달이 포함된 요청은 ttl_hours 가 지나면 만료. (이후 달이 바뀌어도 마찬가지)
+    - refresh=True 면 읽기는 건너뛰고(항상 miss) 새 응답으로 덮어쓴다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        refresh: bool = False,
+    ):
+        self.cache_dir = cache_dir or DATALAB_CACHE_DIR
+        self.ttl_sec = ttl_hours * 3600
+        self.refresh = refresh
+
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self.refresh:
+            self.misses += 1
+            return None
+
+        path = self.path_for(body_hash(body))
+        if not path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 캐시 읽기 실패, 무시: {path}, error={e}")
+            self.misses += 1
+            return None
+
+        cached_at = entry.get("cached_at", 0)
+        expired = time.time() - cached_at > self.ttl_sec
+        fetched_on = datetime.date.fromtimestamp(cached_at)
+        if expired and not is_closed_period(body, fetched_on):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry["response"]
+
+    def put(self, body: Dict[str, Any], response: Dict[str, Any]) -> None:
+        path = self.path_for(body_hash(body))
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {"body": body, "response": response, "cached_at": time.time()},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, path)
@@ -215,11 +215,11 @@ def render():
     st.dataframe(summary_df, height=400)
 
     # --------------------------------------------------
-    # 5) 네이버 디테일 지표 (device / gender)
+    # 5) 네이버 디테일 지표 (device / gender / age)
     # --------------------------------------------------
     st.markdown("---")
     st.markdown(
-        '<div class="section-title">네이버 상세 지표 (디바이스·성별)</div>',
+        '<div class="section-title">네이버 상세 지표 (디바이스·성별·연령대)</div>',
         unsafe_allow_html=True,
     )
 
@@ -236,6 +236,11 @@ def render():
     with st.expander("RAW 데이터 보기 (model_monthly_interest_detail)", expanded=False):
         st.dataframe(detail_df, height=400)
 
+    # 연령대별 행(run_naver_age_crawl)은 별도 기준이라 디바이스×성별 합산에서 분리
+    has_age = detail_df["age_group"].fillna("") != ""
+    age_df = detail_df[has_age]
+    detail_df = detail_df[~has_age]
+
     # 모델 × (device, gender) 피벗 집계
     pivot_df = detail_df.pivot_table(
         index=["brand_name", "model_name_kr"],
@@ -257,6 +262,30 @@ def render():
     )
     st.dataframe(pivot_df, height=500)
 
+    # 모델 × 연령대 (device×gender 평균)
+    st.markdown(
+        '<div class="section-subtitle">모델별 연령대 검색 지수 (디바이스×성별 평균)</div>',
+        unsafe_allow_html=True,
+    )
+    if age_df.empty:
+        st.info(
+            "해당 월의 연령대별 데이터가 아직 없습니다. "
+            "run_naver_age_crawl.py 가 판매량 상위 모델부터 날마다 나눠서 채웁니다."
+        )
+        return
+
+    age_pivot = age_df.pivot_table(
+        index=["brand_name", "model_name_kr"],
+        columns="age_group",
+        values="ratio",
+        aggfunc="mean",
+    )
+    # '0-12', '13-18', ..., '60+' 순서로 정렬
+    age_pivot = age_pivot[
+        sorted(age_pivot.columns, key=lambda a: int(str(a).split("-")[0].rstrip("+")))
+    ].round(2)
+    st.dataframe(age_pivot.reset_index(), height=500)
+
 
 if __name__ == "__main__":
     render()
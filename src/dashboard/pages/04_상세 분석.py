@@ -27,6 +27,27 @@ def strip_tags(html: Optional[str]) -> str:
     return re.sub(clean, "", html).strip()
 
 
+def _render_trend_table(df: pd.DataFrame, kind: str) -> None:
+    """blog_token_trend 한 종류(kind)를 표로 표시 (비중은 % 단위)"""
+    if df.empty:
+        st.caption("전월 데이터가 없습니다." if kind != "tfidf" else "데이터가 없습니다.")
+        return
+
+    display = pd.DataFrame(
+        {
+            "순위": df["token_rank"],
+            "키워드": df["token"],
+            "비중(%)": (df["share"] * 100).round(1),
+        }
+    )
+    if kind == "tfidf":
+        display["점수"] = df["score"].round(3)
+    else:
+        display["전월(%)"] = (df["prev_share"] * 100).round(1)
+        display["변화(%p)"] = (df["score"] * 100).round(1)
+    st.dataframe(display, width="stretch", hide_index=True, height=300)
+
+
 def render():
     load_global_css()
     page_header(
@@ -223,6 +244,7 @@ def render():
         tokens_df = queries.get_model_blog_tokens(model_id, selected_month)
         articles_df = queries.get_model_blog_articles(model_id, selected_month)
         image_path = queries.get_blog_wordcloud_image_path(model_id, selected_month)
+        trends_df = queries.get_model_token_trends(model_id, selected_month)
 
         col_t, col_w = st.columns([2, 1])
 
@@ -253,6 +275,24 @@ def render():
                 else:
                     st.info("워드클라우드 이미지가 없습니다.")
 
+        with section(title="🚀 떠오르는 키워드", spacing=False):
+            if trends_df.empty:
+                st.info("해당 월의 키워드 트렌드 데이터가 없습니다. (build_token_trends.py 실행 필요)")
+            else:
+                st.caption(
+                    "비중 = 상위 키워드 빈도 합 대비 비율. 급상승/하락은 전월 대비 비중 변화, "
+                    "특징 키워드는 같은 달 다른 모델에는 드문 키워드(TF-IDF)입니다."
+                )
+                col_up, col_down, col_tfidf = st.columns(3)
+                for col, kind, label in (
+                    (col_up, "rising", "급상승"),
+                    (col_down, "falling", "하락"),
+                    (col_tfidf, "tfidf", "특징 키워드"),
+                ):
+                    with col:
+                        st.markdown(f"**{label}**")
+                        _render_trend_table(trends_df[trends_df["kind"] == kind], kind)
+
         with section(title="📄 블로그 상위 3개 글", spacing=False):
             if articles_df.empty:
                 st.info("해당 월의 블로그 글 데이터가 없습니다.")
@@ -261,16 +301,20 @@ def render():
                     title = strip_tags(row["title"])
                     url = row["url"]
                     summary = strip_tags(row.get("summary"))
-                    content = strip_tags(row.get("content_plain"))
                     posted_at = row.get("posted_at")
                     posted_at_str = (
-                        posted_at.strftime("%Y-%m-%d") if posted_at else "알 수 없음"
+                        posted_at.strftime("%Y-%m-%d") if pd.notna(posted_at) else "알 수 없음"
                     )
 
                     st.markdown(f"**[{title}]({url})**")
                     st.caption(f"게시일: {posted_at_str}")
 
-                    preview_text = summary if summary else (content[:300] + "...")
+                    if summary:
+                        preview_text = summary
+                    else:
+                        # 요약이 없는 글만 본문을 읽는다 (압축 해제)
+                        content = strip_tags(queries.get_blog_article_body(row["article_id"]))
+                        preview_text = content[:300] + "..."
                     st.write(preview_text)
                     st.divider()
 
@@ -72,7 +72,7 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
             {
                 "key": "danawa_load",
                 "label": "정규화 CSV → DB 반영",
-                "description": "load_danawa_sales_to_db.py – normalized CSV를 model_monthly_sales에 적재",
+                "description": "load_danawa_sales_to_db.py – Parquet staging 판매량을 model_monthly_sales에 적재",
                 "script": "src/etl/sales/load_danawa_sales_to_db.py",
                 "params": [
                     {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
@@ -114,7 +114,23 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
                     {"name": "time_unit", "label": "timeUnit", "type": "select", "arg": "--time-unit", "options": ["month", "week", "date"], "default": "month"},
                     {"name": "brands", "label": "대상 브랜드명 (쉼표/공백 구분)", "type": "text", "arg": "--brands", "default": "현대,기아", "split": True},
                     {"name": "limit_models", "label": "모델 제한 (0=전체)", "type": "int", "arg": "--limit-models", "default": 0, "min_value": 0, "skip_if": lambda v: v is None or int(v) <= 0},
-                    {"name": "sleep_sec", "label": "API 대기(초)", "type": "float", "arg": "--sleep-sec", "default": 0.3, "min_value": 0.0, "step": 0.1},
+                    {"name": "concurrency", "label": "동시 요청 수", "type": "int", "arg": "--concurrency", "default": 4, "min_value": 1, "max_value": 16},
+                    {"name": "rate_per_sec", "label": "초당 호출 수", "type": "float", "arg": "--rate-per-sec", "default": 5.0, "min_value": 0.1, "step": 0.5},
+                    {"name": "stream", "label": "스트리밍 적재 (수집 → detail 적재 → 집계 한 번에)", "type": "checkbox", "default": False, "flag_when_true": "--stream"},
+                    {"name": "tee_raw_csv", "label": "스트리밍 시 raw CSV도 보관", "type": "checkbox", "default": False, "flag_when_true": "--tee-raw-csv"},
+                ],
+            },
+            {
+                "key": "naver_age",
+                "label": "연령대별 수집 (일일 분할)",
+                "description": "run_naver_age_crawl.py – 판매량 상위 모델부터 일일 한도 안에서 device×gender×연령대 수집 → detail 테이블",
+                "script": "src/etl/interest/run_naver_age_crawl.py",
+                "params": [
+                    {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
+                    {"name": "start_date", "label": "시작일", "type": "date", "arg": "--start-date", "default": _default_month_start},
+                    {"name": "end_date", "label": "종료일", "type": "date", "arg": "--end-date", "default": lambda: datetime.today().date()},
+                    {"name": "reserve_calls", "label": "다른 수집용 예비 호출 수", "type": "int", "arg": "--reserve-calls", "default": 100, "min_value": 0},
+                    {"name": "plan_only", "label": "계획만 출력", "type": "checkbox", "default": False, "flag_when_true": "--plan-only"},
                 ],
             },
             {
@@ -131,7 +147,9 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
                 "label": "detail → interest 집계",
                 "description": "aggregate_naver_interest.py – model_monthly_interest_detail → model_monthly_interest 집계",
                 "script": "src/etl/interest/aggregate_naver_interest.py",
-                "params": [],
+                "params": [
+                    {"name": "run_id", "label": "Run ID (비우면 전체 재집계)", "type": "text", "arg": "--run-id", "default": "", "help": "해당 run detail CSV의 월/모델만 다시 집계"},
+                ],
             },
         ],
     },
@@ -146,11 +164,26 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
             }
         ],
         "steps": [
+            "pytrends 수집 (모델 4개 + 앵커 키워드) → wide CSV",
             "CSV 헤더 매핑 → 모델 매칭",
             "주간 데이터를 월 단위로 변환",
             "google_trend_index upsert",
         ],
         "commands": [
+            {
+                "key": "google_crawl",
+                "label": "구글 트렌드 수집",
+                "description": "run_google_trend_crawl.py – car_model 기준 구글 트렌드 수집 → 브랜드별 wide CSV 저장",
+                "script": "src/etl/interest/run_google_trend_crawl.py",
+                "params": [
+                    {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
+                    {"name": "start_date", "label": "시작일", "type": "date", "arg": "--start-date", "default": _default_month_start},
+                    {"name": "end_date", "label": "종료일", "type": "date", "arg": "--end-date", "default": lambda: datetime.today().date()},
+                    {"name": "brands", "label": "대상 브랜드명 (쉼표/공백 구분)", "type": "text", "arg": "--brands", "default": "현대,기아", "split": True},
+                    {"name": "workers", "label": "동시 요청 스레드 수", "type": "int", "arg": "--workers", "default": 2, "min_value": 1, "max_value": 8},
+                    {"name": "min_interval_sec", "label": "요청 간격(초)", "type": "float", "arg": "--min-interval-sec", "default": 5.0, "min_value": 0.0, "step": 1.0},
+                ],
+            },
             {
                 "key": "google_trend",
                 "label": "구글 트렌드 반영",
@@ -186,6 +219,7 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
             "본문 크롤링 + 형태소 분석",
             "blog_article/blog_token_monthly 저장",
             "blog_token 기반 워드클라우드 이미지 생성",
+            "blog_token 기반 키워드 트렌드(TF-IDF/급상승) 계산",
         ],
         "commands": [
             {
@@ -215,6 +249,18 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
                     {"name": "max_words", "label": "최대 단어 수", "type": "int", "arg": "--max-words", "default": 100, "min_value": 10},
                 ],
             },
+            {
+                "key": "blog_token_trends",
+                "label": "키워드 트렌드 계산",
+                "description": "build_token_trends.py – blog_token_monthly 기반 TF-IDF/전월 대비 급상승·하락 키워드를 blog_token_trend에 저장",
+                "script": "src/etl/blog/build_token_trends.py",
+                "params": [
+                    {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
+                    {"name": "month", "label": "기준 월 (비우면 전체 월)", "type": "text", "arg": "--month", "default": ""},
+                    {"name": "top_k", "label": "종류별 키워드 수", "type": "int", "arg": "--top-k", "default": 10, "min_value": 1},
+                    {"name": "min_count", "label": "최소 등장 횟수", "type": "int", "arg": "--min-count", "default": 2, "min_value": 1},
+                ],
+            },
         ],
     },
 ]
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 from sqlalchemy import text
 
+from db.article_body import decompress_body
 from db.connection import get_engine
 
 Params = Optional[Dict[str, Any]]
@@ -338,18 +339,20 @@ def get_blog_articles_for_model_month(
 ) -> pd.DataFrame:
     """
     blog_article에서 해당 모델/월 기준 상위 N개 블로그 글 정보 반환.
+    (여러 모델이 같은 글을 공유할 수 있어서 blog_article_model 매핑 기준)
     """
     sql = """
         SELECT
-            title,
-            url,
-            summary,
-            posted_at,
-            search_rank
-        FROM blog_article
-        WHERE model_id = :model_id
-          AND month = :month
-        ORDER BY search_rank ASC
+            a.title,
+            a.url,
+            a.summary,
+            a.posted_at,
+            m.search_rank
+        FROM blog_article_model m
+        JOIN blog_article a ON a.article_id = m.article_id
+        WHERE m.model_id = :model_id
+          AND m.month = :month
+        ORDER BY m.search_rank ASC
         LIMIT :limit
         """
     rows = _fetch_all(
@@ -558,21 +561,45 @@ def get_model_blog_tokens(model_id: int, month: DateType) -> pd.DataFrame:
     return _read_df(sql, params={"model_id": model_id, "month": month})
 
 
-def get_model_blog_articles(model_id: int, month: DateType) -> pd.DataFrame:
+def get_model_token_trends(model_id: int, month: DateType) -> pd.DataFrame:
     """
-    blog_article에서 특정 모델/월의 상위 3개 글 조회.
-    (search_rank 기준)
+    blog_token_trend 에서 특정 모델/월의 키워드 트렌드 조회. (build_token_trends.py 가 미리 계산)
+    kind: tfidf / rising / falling
     """
     sql = """
         SELECT
-            search_rank,
-            title,
-            url,
-            summary
-        FROM blog_article
+            kind,
+            token_rank,
+            token,
+            score,
+            share,
+            prev_share
+        FROM blog_token_trend
         WHERE model_id = :model_id
           AND month = :month
-        ORDER BY search_rank ASC
+        ORDER BY kind, token_rank ASC
+        """
+    return _read_df(sql, params={"model_id": model_id, "month": month})
+
+
+def get_model_blog_articles(model_id: int, month: DateType) -> pd.DataFrame:
+    """
+    blog_article에서 특정 모델/월의 상위 3개 글 조회.
+    (blog_article_model 매핑의 search_rank 기준, 본문은 get_blog_article_body 로 따로)
+    """
+    sql = """
+        SELECT
+            a.article_id,
+            m.search_rank,
+            a.title,
+            a.url,
+            a.summary,
+            a.posted_at
+        FROM blog_article_model m
+        JOIN blog_article a ON a.article_id = m.article_id
+        WHERE m.model_id = :model_id
+          AND m.month = :month
+        ORDER BY m.search_rank ASC
         LIMIT 3
         """
     return _read_df(sql, params={"model_id": model_id, "month": month})
@@ -607,36 +634,53 @@ def get_model_wordcloud_path(model_id: int, month: DateType) -> Optional[str]:
 def load_blog_articles(model_id: int, month: date) -> pd.DataFrame:
     """
     blog_article 테이블에서 모델별 상위 3개 블로그 글을 반환.
+    (blog_article_model 매핑 기준, 본문은 get_blog_article_body 로 따로)
     """
     sql = """
         SELECT
-            article_id,
-            model_id,
-            month,
-            search_keyword,
-            search_rank,
-            title,
-            url,
-            summary,
-            content_plain,
-            posted_at,
-            collected_at
-        FROM blog_article
-        WHERE model_id = :model_id
-          AND month = :month
-        ORDER BY search_rank ASC
+            a.article_id,
+            m.model_id,
+            m.month,
+            m.search_keyword,
+            m.search_rank,
+            a.title,
+            a.url,
+            a.summary,
+            a.posted_at,
+            a.collected_at
+        FROM blog_article_model m
+        JOIN blog_article a ON a.article_id = m.article_id
+        WHERE m.model_id = :model_id
+          AND m.month = :month
+        ORDER BY m.search_rank ASC
         LIMIT 3
     """
 
     return _read_df(sql, params={"model_id": model_id, "month": month})
 
 
+def get_blog_article_body(article_id: int) -> str:
+    """
+    글 하나의 본문 (blog_article_body 압축 해제). 없으면 빈 문자열.
+    목록 조회에는 본문을 넣지 않고, 화면에서 본문이 필요할 때만 호출한다.
+    """
+    blob = _fetch_value(
+        """
+        SELECT content_z
+        FROM blog_article_body
+        WHERE article_id = :article_id
+        """,
+        {"article_id": int(article_id)},
+    )
+    return decompress_body(blob)
+
+
 def get_model_blog_months(model_id: int) -> List[date]:
     """해당 모델에 대해 블로그 글이 저장된 month 목록을 오래된 순으로 반환."""
     rows = _fetch_all(
         """
         SELECT DISTINCT month
-        FROM blog_article
+        FROM blog_article_model
         WHERE model_id = :model_id
         ORDER BY month
         """,
@@ -0,0 +1,33 @@
+# src/db/article_body.py
+"""
+blog_article_body.content_z 압축 형식 (MySQL COMPRESS() 와 같은 형식)
+
+    4바이트 원문 길이(little-endian) + zlib 스트림
+
+같은 형식이라 SQL 에서도 UNCOMPRESS(content_z) 로 바로 읽을 수 있고,
+기존 content_plain 을 옮길 때도 COMPRESS() 로 채울 수 있다. (init_schema.sql 13번)
+"""
+import struct
+import zlib
+from typing import Optional
+
+# 블로그 본문은 한 번 쓰고 가끔 읽으므로 기본 레벨(6)보다 조금 더 줄인다
+COMPRESS_LEVEL = 9
+
+
+def compress_body(content: str) -> bytes:
+    """본문 문자열 → content_z. 빈 문자열은 빈 바이트 (MySQL COMPRESS('') 와 동일)"""
+    raw = content.encode("utf-8")
+    if not raw:
+        return b""
+    return struct.pack("<I", len(raw) & 0x3FFFFFFF) + zlib.compress(raw, COMPRESS_LEVEL)
+
+
+def decompress_body(blob: Optional[bytes]) -> str:
+    """
+    content_z → 본문 문자열. NULL / 빈 값은 빈 문자열.
+    (MySQL COMPRESS() 는 원문이 공백으로 끝나면 끝에 '.' 을 붙이는데, zlib 스트림 뒤라서 무시된다)
+    """
+    if not blob:
+        return ""
+    return zlib.decompress(bytes(blob)[4:]).decode("utf-8")
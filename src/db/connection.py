@@ -24,9 +24,11 @@ def load_env():
         pass
 
 
-def get_engine(echo: bool = False) -> Engine:
+def get_engine(echo: bool = False, local_infile: bool = False) -> Engine:
     """
     SQLAlchemy Engine 생성
+    local_infile=True 면 LOAD DATA LOCAL INFILE 을 허용하는 연결을 만든다.
+    (서버 쪽 local_infile 설정도 켜져 있어야 함)
     """
     load_env()
 
@@ -39,9 +41,12 @@ def get_engine(echo: bool = False) -> Engine:
     # mysql+pymysql URL 구성
     url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{db_name}?charset=utf8mb4"
 
+    connect_args = {"local_infile": True} if local_infile else {}
+
     engine = create_engine(
         url,
         echo=echo,       # True로 두면 실행되는 SQL 출력
         future=True,     # SQLAlchemy 2.x 스타일
+        connect_args=connect_args,
     )
     return engine
\ No newline at end of file
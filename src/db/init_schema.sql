@@ -162,12 +162,149 @@ CREATE TABLE model_monthly_interest_detail (
     device VARCHAR(10) NULL COMMENT 'pc 또는 mobile',
     gender VARCHAR(10) NULL COMMENT 'male 또는 female',
     age_group VARCHAR(10) NULL COMMENT '연령대 필터 예: 10,20,30… 필요 시 확장',
-    ratio FLOAT NOT NULL COMMENT '네이버 검색 지수 (해당 모델 기간 내 최고값=100 기반 비율)',
+    ratio FLOAT NOT NULL COMMENT '네이버 검색 지수 (앵커 키워드 기간 내 최고값=100 기준 비율)',
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '레코드 생성 시각',
     UNIQUE KEY uk_model_month_filter (model_id, month, device, gender, age_group),
     KEY idx_model_month (model_id, month),
     CONSTRAINT fk_interest_detail_model FOREIGN KEY (model_id) REFERENCES car_model(model_id)
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT = '네이버 검색량 상세 지표 (디바이스/성별/연령대 단위 RAW)';
 
+-- =====================================================
+-- 10. blog_wordcloud: 토큰 fingerprint 추가 (토큰이 그대로면 재생성 스킵)
+-- =====================================================
+ALTER TABLE
+    blog_wordcloud
+ADD
+    COLUMN token_fingerprint CHAR(40) NULL COMMENT '토큰 빈도 + 렌더링 옵션 SHA-1 (generate_wordcloud.token_fingerprint)'
+AFTER
+    image_path;
+
+-- =====================================================
+-- 11. blog_article_model: 모델 ↔ 블로그 글 다대다 매핑
+--     (비슷한 모델 검색 결과에 같은 글이 나와도 글은 한 번만 저장하고 매핑만 추가)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS blog_article_model (
+    article_id INT UNSIGNED NOT NULL COMMENT 'FK → blog_article.article_id',
+    model_id INT UNSIGNED NOT NULL COMMENT 'FK → car_model.model_id',
+    month DATE NOT NULL COMMENT '분석 기준 월',
+    search_keyword VARCHAR(200) NOT NULL COMMENT '검색 키워드',
+    search_rank INT NOT NULL COMMENT '이 모델 검색 결과 내 순위 (1~3)',
+    PRIMARY KEY (model_id, month, article_id),
+    KEY idx_bam_article (article_id),
+    CONSTRAINT fk_bam_article FOREIGN KEY (article_id) REFERENCES blog_article(article_id) ON DELETE CASCADE,
+    CONSTRAINT fk_bam_model FOREIGN KEY (model_id) REFERENCES car_model(model_id) ON DELETE CASCADE
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT '모델별 블로그 글 매핑';
+
+-- 기존 blog_article 의 (model_id, month, 순위) 를 매핑으로 옮겨 둔다
+INSERT IGNORE INTO blog_article_model (article_id, model_id, month, search_keyword, search_rank)
+SELECT
+    article_id,
+    model_id,
+    month,
+    search_keyword,
+    search_rank
+FROM
+    blog_article;
+
+-- =====================================================
+-- 12. blog_token_trend: 키워드 트렌드 사전 계산 결과 (build_token_trends.py)
+--     kind = tfidf(다른 모델 대비 특징 키워드) / rising(전월 대비 급상승) / falling(급하락)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS blog_token_trend (
+    model_id INT UNSIGNED NOT NULL COMMENT 'FK → car_model.model_id',
+    month DATE NOT NULL COMMENT '기준 월',
+    kind VARCHAR(10) NOT NULL COMMENT 'tfidf / rising / falling',
+    token_rank TINYINT UNSIGNED NOT NULL COMMENT '종류 내 순위 (1 = 최상위)',
+    token VARCHAR(100) NOT NULL COMMENT '단어(명사)',
+    score FLOAT NOT NULL COMMENT 'tfidf: TF-IDF 점수, rising/falling: 비중 변화 (share - prev_share)',
+    share FLOAT NOT NULL COMMENT '이번 달 비중 (빈도 / 상위 키워드 빈도 합)',
+    prev_share FLOAT NULL COMMENT '전월 비중 (tfidf 는 NULL)',
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시각',
+    PRIMARY KEY (model_id, month, kind, token_rank),
+    KEY idx_trend_month (month),
+    CONSTRAINT fk_trend_model FOREIGN KEY (model_id) REFERENCES car_model(model_id) ON DELETE CASCADE
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT '월간 블로그 키워드 트렌드';
+
+-- =====================================================
+-- 13. blog_article_body: 블로그 본문을 압축해서 별도 테이블로 분리
+--     content_z = MySQL COMPRESS() 형식 (4바이트 원문 길이 + zlib, src/db/article_body.py)
+--     → 목록 조회(blog_article)는 본문을 읽지 않고, 본문은 필요할 때만 UNCOMPRESS / decompress_body
+-- =====================================================
+CREATE TABLE IF NOT EXISTS blog_article_body (
+    article_id INT UNSIGNED NOT NULL PRIMARY KEY COMMENT 'FK → blog_article.article_id',
+    content_z MEDIUMBLOB NOT NULL COMMENT '정제된 본문 텍스트 (COMPRESS 형식)',
+    content_bytes INT UNSIGNED NOT NULL COMMENT '압축 전 본문 크기 (UTF-8 바이트)',
+    CONSTRAINT fk_body_article FOREIGN KEY (article_id) REFERENCES blog_article(article_id) ON DELETE CASCADE
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT '블로그 본문 (압축)';
+
+-- 기존 blog_article.content_plain 을 압축해서 옮기고 컬럼 삭제
+INSERT IGNORE INTO blog_article_body (article_id, content_z, content_bytes)
+SELECT
+    article_id,
+    COMPRESS(content_plain),
+    LENGTH(content_plain)
+FROM
+    blog_article
+WHERE
+    content_plain IS NOT NULL;
+
+ALTER TABLE
+    blog_article DROP COLUMN content_plain;
+
+-- =====================================================
+-- 14. model_monthly_interest_detail: 필터 컬럼 NULL → '' (NOT NULL)
+--     UNIQUE KEY 는 NULL 끼리 같은 값으로 보지 않아서 age_group(device/gender) 이 NULL 인 행은
+--     ON DUPLICATE KEY UPDATE 가 덮어쓰지 않고 매번 새 행이 쌓였다.
+--     → 같은 필터 조합 중 가장 나중에 들어간 행(id 최대)만 남기고 '' 로 바꾼 뒤 NOT NULL 로 변경
+--     (필터 없음 = 빈 문자열, 적재는 load_naver_interest_detail.parse_detail_row)
+--     중복 행이 섞인 채 집계된 model_monthly_interest.naver_search_index 도 틀렸으므로
+--     아래 변경 후 범위 없이 다시 집계한다: python -m src.etl.interest.aggregate_naver_interest
+-- =====================================================
+DELETE d
+FROM
+    model_monthly_interest_detail d
+    JOIN (
+        SELECT
+            model_id,
+            month,
+            COALESCE(device, '') AS device,
+            COALESCE(gender, '') AS gender,
+            COALESCE(age_group, '') AS age_group,
+            MAX(id) AS keep_id
+        FROM
+            model_monthly_interest_detail
+        GROUP BY
+            model_id,
+            month,
+            COALESCE(device, ''),
+            COALESCE(gender, ''),
+            COALESCE(age_group, '')
+    ) k ON k.model_id = d.model_id
+    AND k.month = d.month
+    AND k.device = COALESCE(d.device, '')
+    AND k.gender = COALESCE(d.gender, '')
+    AND k.age_group = COALESCE(d.age_group, '')
+    AND d.id < k.keep_id;
+
+UPDATE
+    model_monthly_interest_detail
+SET
+    device = COALESCE(device, ''),
+    gender = COALESCE(gender, ''),
+    age_group = COALESCE(age_group, '')
+WHERE
+    device IS NULL
+    OR gender IS NULL
+    OR age_group IS NULL;
+
+ALTER TABLE
+    model_monthly_interest_detail
+MODIFY
+    device VARCHAR(10) NOT NULL DEFAULT '' COMMENT 'pc 또는 mobile ('' = 필터 없음)',
+MODIFY
+    gender VARCHAR(10) NOT NULL DEFAULT '' COMMENT 'male 또는 female ('' = 필터 없음)',
+MODIFY
+    age_group VARCHAR(10) NOT NULL DEFAULT '' COMMENT '연령대 라벨 예: 19-24 ('' = 연령 필터 없음)';
+
 SET
     FOREIGN_KEY_CHECKS = 1;
\ No newline at end of file
@@ -0,0 +1,129 @@
+# src/etl/blog/bench_blog_extract.py
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from src.etl.blog.blog_extract import (
+    EXTRACTORS,
+    HtmlExtractor,
+    SoupExtractor,
+    extract_blog_text,
+)
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "bench_fixtures"
+
+
+def load_fixtures(fixtures_dir: Path) -> Tuple[List[str], Dict[str, str]]:
+    """
+    fixtures_dir/manifest.json
+      {"articles": [글 URL, ...], "pages": {URL: 저장된 HTML 파일명}}
+    반환: (글 URL 목록, {URL: HTML})
+    """
+    with (fixtures_dir / "manifest.json").open("r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    pages = {
+        url: (fixtures_dir / name).read_text(encoding="utf-8")
+        for url, name in manifest["pages"].items()
+    }
+    return manifest["articles"], pages
+
+
+def run_pipeline(
+    articles: List[str],
+    pages: Dict[str, str],
+    extractor: HtmlExtractor,
+    rewrite_postview: bool,
+) -> Tuple[List[str], int]:
+    """
+    저장된 페이지로 글마다 extract_blog_text 실행. 반환: (본문 목록, 페이지 요청 수)
+    """
+    fetches = 0
+
+    def _fetch(url: str) -> str:
+        nonlocal fetches
+        fetches += 1
+        if url not in pages:
+            raise KeyError(f"fixture 없음: {url}")
+        return pages[url]
+
+    texts = [extract_blog_text(url, _fetch, extractor, rewrite_postview) for url in articles]
+    return texts, fetches
+
+
+def _time(fn: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def run_benchmark(fixtures_dir: Path, repeat: int) -> None:
+    articles, pages = load_fixtures(fixtures_dir)
+    n_bytes = sum(len(html.encode("utf-8")) for html in pages.values())
+    print(f"[INFO] fixture: 글 {len(articles)}개, 페이지 {len(pages)}개 ({n_bytes / 1024:,.0f} KB)")
+
+    # 기준값: 기존 방식 (전체 트리 파싱 + 껍데기 페이지 → iframe 순서로 요청)
+    baseline = SoupExtractor(strain=False)
+    t_base, (base_texts, base_fetches) = _time(
+        lambda: run_pipeline(articles, pages, baseline, rewrite_postview=False), repeat
+    )
+    expected = [_normalize(t) for t in base_texts]
+
+    print("\n[SUMMARY] 블로그 본문 추출 벤치마크 (best of {})".format(repeat))
+    print(f"  {'bs4 (기존)':<22} {t_base * 1000:8.1f}ms  요청 {base_fetches}회")
+
+    mismatched = []
+    for name, factory in EXTRACTORS.items():
+        if name == "bs4":
+            continue
+        try:
+            extractor = factory()
+        except ImportError:
+            print(f"  {name + ' + PostView':<22} (설치 안 됨, 스킵)")
+            continue
+
+        t, (texts, fetches) = _time(
+            lambda: run_pipeline(articles, pages, extractor, rewrite_postview=True), repeat
+        )
+        same = sum(1 for a, b in zip(expected, texts) if a == _normalize(b))
+        if same != len(articles):
+            mismatched.append(name)
+        print(
+            f"  {name + ' + PostView':<22} {t * 1000:8.1f}ms  요청 {fetches}회  "
+            f"x{t_base / t:.2f}  본문 일치 {same}/{len(articles)}"
+        )
+
+    if mismatched:
+        raise SystemExit(f"[ERROR] 기존 방식과 본문이 다른 추출기: {', '.join(mismatched)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블로그 본문 추출: 기존 bs4 vs 빠른 추출기 벤치마크")
+    parser.add_argument(
+        "--fixtures-dir",
+        type=str,
+        default=str(FIXTURES_DIR),
+        help="manifest.json + 저장된 HTML 이 있는 디렉토리 (기본: bench_fixtures)",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    run_benchmark(Path(args.fixtures_dir), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
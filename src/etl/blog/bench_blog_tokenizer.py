@@ -0,0 +1,172 @@
+# src/etl/blog/bench_blog_tokenizer.py
+
+from __future__ import annotations
+
+import argparse
+import collections
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import text
+
+from src.db.article_body import decompress_body
+from src.db.connection import get_engine
+from src.etl.blog.blog_tokenizer import (
+    DEFAULT_NUM_WORKERS,
+    count_tokens_by_key,
+    get_kiwi,
+    sort_token_counts,
+)
+
+
+SENTENCES = [
+    "{model} 출고 후 한 달 동안 출퇴근용으로 타 본 후기입니다.",
+    "{model} 실내 공간이 넓어서 가족 여행에 만족스러웠어요.",
+    "연비는 고속도로에서 리터당 15km 정도 나왔고 시내 주행은 조금 아쉬웠습니다.",
+    "{model} 하이브리드 모델의 승차감과 정숙성이 생각보다 좋습니다.",
+    "옵션 구성과 가격을 비교해 보니 {model} 쪽이 가성비가 괜찮았습니다.",
+    "디자인은 호불호가 갈리지만 실물은 사진보다 훨씬 낫네요.",
+    "스마트 크루즈 컨트롤과 차로 유지 보조 기능 덕분에 장거리 운전이 편합니다.",
+    "2열 시트 폴딩이 쉬워서 캠핑 짐을 싣기에 좋았습니다.",
+    "트렁크 용량과 적재 공간은 동급 대비 여유 있는 편입니다.",
+    "대기 기간이 길어서 계약 후 넉 달 만에 차량을 인도받았습니다.",
+]
+
+MODEL_NAMES = ["카니발", "스포티지", "쏘렌토", "아반떼", "그랜저", "아이오닉 5", "EV3"]
+
+
+def make_synthetic_docs(n_docs: int, sentences_per_doc: int, seed: int = 42) -> List[Tuple[int, str]]:
+    """
+    모델별 블로그 본문을 흉내 낸 합성 문서 (key = 모델 인덱스)
+    """
+    rng = random.Random(seed)
+    docs: List[Tuple[int, str]] = []
+    for i in range(n_docs):
+        key = i % len(MODEL_NAMES)
+        model = MODEL_NAMES[key]
+        body = "\n".join(
+            rng.choice(SENTENCES).format(model=model) for _ in range(sentences_per_doc)
+        )
+        docs.append((key, body))
+    return docs
+
+
+def load_docs_from_db(limit: int) -> List[Tuple[int, str]]:
+    """
+    blog_article_body 에 저장된 실제 본문 (key = model_id)
+    """
+    engine = get_engine(echo=False)
+    sql = text(
+        """
+        SELECT a.model_id, b.content_z
+        FROM blog_article_body b
+        JOIN blog_article a ON a.article_id = b.article_id
+        WHERE b.content_bytes > 0
+        ORDER BY b.article_id DESC
+        LIMIT :limit
+        """
+    )
+    with engine.connect() as conn:
+        rows = conn.execute(sql, {"limit": limit}).all()
+    return [(row[0], decompress_body(row[1])) for row in rows]
+
+
+def count_per_text(docs: List[Tuple[int, str]]) -> Dict[int, List[Tuple[str, int]]]:
+    """
+    기존 방식: 글마다 kiwi.tokenize(text) → 평평한 토큰 리스트 → Counter
+    """
+    kiwi = get_kiwi(0)
+    texts_by_key: Dict[int, List[str]] = collections.defaultdict(list)
+    for key, t in docs:
+        texts_by_key[key].append(t)
+
+    out: Dict[int, List[Tuple[str, int]]] = {}
+    for key, texts in texts_by_key.items():
+        all_tokens: List[str] = []
+        for t in texts:
+            for w in kiwi.tokenize(t):
+                if w.tag.startswith("N"):
+                    form = w.form.strip()
+                    if len(form) > 1 and not form.isdigit():
+                        all_tokens.append(form)
+        out[key] = sorted(collections.Counter(all_tokens).items(), key=lambda x: (-x[1], x[0]))
+    return out
+
+
+def count_batched(docs: List[Tuple[int, str]], num_workers: int) -> Dict[int, List[Tuple[str, int]]]:
+    """
+    배치 방식: count_tokens_by_key (Kiwi 배치 API + 멀티스레드)
+    """
+    counters = count_tokens_by_key(docs, num_workers=num_workers)
+    return {key: sort_token_counts(c) for key, c in counters.items()}
+
+
+def _time(fn: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_benchmark(docs: List[Tuple[int, str]], repeat: int, num_workers: int) -> None:
+    n_chars = sum(len(t) for _, t in docs)
+    print(f"[INFO] 문서 {len(docs)}개, {n_chars:,}자")
+
+    # 모델 로딩 시간은 빼고 잰다
+    get_kiwi(0)
+    get_kiwi(num_workers)
+
+    t_per_text, per_text = _time(lambda: count_per_text(docs), repeat)
+    t_batch, batched = _time(lambda: count_batched(docs, num_workers), repeat)
+
+    identical = per_text == batched
+
+    print("\n[SUMMARY] Kiwi 토큰화 벤치마크 (best of {})".format(repeat))
+    print(f"  docs: {len(docs)}")
+    print(f"  per-text: {t_per_text:.3f}s ({len(docs) / t_per_text:,.1f} docs/s)")
+    print(
+        f"  batched:  {t_batch:.3f}s ({len(docs) / t_batch:,.1f} docs/s, num_workers={num_workers})"
+    )
+    print(f"  speedup: x{t_per_text / t_batch:.2f}")
+    print(f"  identical counts: {identical}")
+
+    if not identical:
+        raise SystemExit("[ERROR] 글 단위 / 배치 토큰 빈도가 다릅니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블로그 토큰화: 글 단위 vs Kiwi 배치 벤치마크")
+    parser.add_argument("--docs", type=int, default=450, help="합성 문서 수 (기본 450 = 모델 150 × 3)")
+    parser.add_argument("--sentences", type=int, default=40, help="합성 문서당 문장 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=DEFAULT_NUM_WORKERS,
+        help="배치 방식 Kiwi 스레드 수 (-1 = 모든 코어)",
+    )
+    parser.add_argument(
+        "--from-db",
+        action="store_true",
+        help="합성 문서 대신 blog_article_body 의 본문 최근 --docs 개 사용",
+    )
+    args = parser.parse_args()
+
+    if args.from_db:
+        docs = load_docs_from_db(args.docs)
+    else:
+        docs = make_synthetic_docs(args.docs, args.sentences)
+
+    if not docs:
+        print("[WARN] 벤치마크할 문서가 없습니다.")
+        return
+
+    run_benchmark(docs, args.repeat, args.num_workers)
+
+
+if __name__ == "__main__":
+    main()
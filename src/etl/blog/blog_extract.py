@@ -0,0 +1,332 @@
+# src/etl/blog/blog_extract.py
+
+from __future__ import annotations
+
+import re
+from typing import Callable, Dict, List, Optional, Protocol, Tuple
+from urllib.parse import parse_qs, urljoin, urlsplit
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# 블로그 본문 영역 (앞에서부터 먼저 찾은 것 사용)
+PAGE_SELECTORS: List[Tuple[str, str, str]] = [
+    # (태그, 속성, 값)
+    ("div", "class", "se-main-container"),  # 최신 스마트에디터 3.0 구조
+    ("div", "id", "content"),  # 구형 블로그 에디터 구조
+]
+
+# iframe(PostView) 본문 영역
+POST_SELECTORS: List[Tuple[str, str, str]] = [
+    ("div", "class", "se-main-container"),
+    ("div", "id", "postViewArea"),
+    ("div", "id", "contentArea"),
+]
+
+NAVER_BLOG_HOSTS = {"blog.naver.com", "m.blog.naver.com"}
+
+# blog.naver.com/<blogId>/<logNo>
+_NAVER_POST_PATH_RE = re.compile(r"^/([A-Za-z0-9_-]+)/(\d+)/?$")
+
+
+def _css(tag: str, attr: str, value: str) -> str:
+    return f"{tag}.{value}" if attr == "class" else f"{tag}#{value}"
+
+
+def naver_post_id(url: str) -> Optional[Tuple[str, str]]:
+    """
+    네이버 블로그 글 URL → (blogId, logNo). 네이버 블로그 글이 아니면 None.
+      blog.naver.com/<id>/<no>, m.blog.naver.com/<id>/<no>, PostView.naver?blogId=..&logNo=..
+    """
+    parts = urlsplit(url)
+    if parts.netloc.lower() not in NAVER_BLOG_HOSTS:
+        return None
+
+    m = _NAVER_POST_PATH_RE.match(parts.path)
+    if m:
+        return m.group(1), m.group(2)
+
+    if parts.path.lower() in ("/postview.naver", "/postview.nhn"):
+        qs = parse_qs(parts.query)
+        blog_id = (qs.get("blogId") or [""])[0]
+        log_no = (qs.get("logNo") or [""])[0]
+        if blog_id and log_no.isdigit():
+            return blog_id, log_no
+    return None
+
+
+def postview_url(url: str) -> Optional[str]:
+    """
+    네이버 블로그 글 URL → 본문이 바로 들어 있는 PostView URL.
+    blog.naver.com/<id>/<no> 는 iframe#mainFrame 껍데기 페이지라서
+    PostView 를 바로 요청하면 껍데기 요청/파싱을 건너뛸 수 있다. 네이버 블로그가 아니면 None.
+    """
+    post_id = naver_post_id(url)
+    if post_id is None:
+        return None
+    blog_id, log_no = post_id
+    return f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+
+
+class HtmlExtractor(Protocol):
+    """
+    본문 추출 백엔드.
+      - extract_page: 글 페이지 → (본문, None) / (None, iframe 절대 URL) / (None, None = 못 찾음)
+      - extract_post: PostView 페이지 → 본문 (영역이 없으면 None)
+      - full_text: 본문 영역을 못 찾았을 때 쓰는 전체 텍스트
+    """
+
+    name: str
+
+    def extract_page(self, html: str) -> Tuple[Optional[str], Optional[str]]: ...
+
+    def extract_post(self, html: str) -> Optional[str]: ...
+
+    def full_text(self, html: str) -> str: ...
+
+
+class _TargetStrainer(SoupStrainer):
+    """
+    본문 영역 div / iframe#mainFrame 만 트리로 만든다. (그 밖의 태그/문자열은 파싱 중에 버림)
+    bs4 4.13+ 의 allow_tag_creation 훅 사용.
+    """
+
+    def __init__(self, selectors: List[Tuple[str, str, str]], with_iframe: bool):
+        super().__init__()
+        self.selectors = selectors
+        self.with_iframe = with_iframe
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        if self.with_iframe and name == "iframe" and attrs.get("id") == "mainFrame":
+            return True
+        for tag, attr, value in self.selectors:
+            if name != tag:
+                continue
+            raw = attrs.get(attr) or ""
+            if attr == "class":
+                if value in raw.split():
+                    return True
+            elif raw == value:
+                return True
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+class SoupExtractor:
+    """
+    BeautifulSoup(html.parser) 백엔드. strain=True 면 본문 영역만 파싱 (SoupStrainer).
+    strain=False 는 기존 방식(전체 트리) — 벤치마크 기준값.
+    """
+
+    def __init__(self, strain: bool = True):
+        self.strain = strain
+        self.name = "bs4-strainer" if strain else "bs4"
+        self._page_only = _TargetStrainer(PAGE_SELECTORS, with_iframe=True)
+        self._post_only = _TargetStrainer(POST_SELECTORS, with_iframe=False)
+
+    def _soup(self, html: str, parse_only: SoupStrainer) -> BeautifulSoup:
+        return BeautifulSoup(html, "html.parser", parse_only=parse_only if self.strain else None)
+
+    @staticmethod
+    def _first_text(soup: BeautifulSoup, selectors: List[Tuple[str, str, str]]) -> Optional[str]:
+        for selector in selectors:
+            area = soup.select_one(_css(*selector))
+            if area:
+                return area.get_text(separator="\n")
+        return None
+
+    def extract_page(self, html: str) -> Tuple[Optional[str], Optional[str]]:
+        soup = self._soup(html, self._page_only)
+        text = self._first_text(soup, PAGE_SELECTORS)
+        if text is not None:
+            return text, None
+
+        iframe = soup.select_one("iframe#mainFrame")
+        if iframe and iframe.has_attr("src"):
+            return None, urljoin("https://blog.naver.com", iframe["src"])
+        return None, None
+
+    def extract_post(self, html: str) -> Optional[str]:
+        return self._first_text(self._soup(html, self._post_only), POST_SELECTORS)
+
+    def full_text(self, html: str) -> str:
+        return BeautifulSoup(html, "html.parser").get_text(separator="\n")
+
+
+class LxmlExtractor:
+    """
+    lxml.html 백엔드 (설치되어 있을 때만). XPath 로 본문 영역만 찾는다.
+    script/style 안의 문자열은 bs4 get_text 와 같게 뺀다.
+    """
+
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+
+        self._fromstring = lxml.html.fromstring
+
+    @staticmethod
+    def _xpath(tag: str, attr: str, value: str) -> str:
+        if attr == "class":
+            return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]"
+        return f"//{tag}[@{attr}='{value}']"
+
+    def _doc(self, html: str):
+        try:
+            return self._fromstring(html)
+        except Exception:
+            # 빈 문서 등
+            return None
+
+    @staticmethod
+    def _text(el) -> str:
+        return "\n".join(el.xpath(".//text()[not(ancestor::script) and not(ancestor::style)]"))
+
+    def _first_text(self, doc, selectors: List[Tuple[str, str, str]]) -> Optional[str]:
+        for selector in selectors:
+            found = doc.xpath(self._xpath(*selector))
+            if found:
+                return self._text(found[0])
+        return None
+
+    def extract_page(self, html: str) -> Tuple[Optional[str], Optional[str]]:
+        doc = self._doc(html)
+        if doc is None:
+            return None, None
+        text = self._first_text(doc, PAGE_SELECTORS)
+        if text is not None:
+            return text, None
+
+        found = doc.xpath("//iframe[@id='mainFrame'][@src]")
+        if found:
+            return None, urljoin("https://blog.naver.com", found[0].get("src"))
+        return None, None
+
+    def extract_post(self, html: str) -> Optional[str]:
+        doc = self._doc(html)
+        return None if doc is None else self._first_text(doc, POST_SELECTORS)
+
+    def full_text(self, html: str) -> str:
+        doc = self._doc(html)
+        return "" if doc is None else self._text(doc)
+
+
+class SelectolaxExtractor:
+    """
+    selectolax(Lexbor/Modest) 백엔드 (설치되어 있을 때만). 가장 빠르다.
+    """
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.parser import HTMLParser
+
+        self._parser = HTMLParser
+
+    def _tree(self, html: str):
+        tree = self._parser(html)
+        tree.strip_tags(["script", "style"])
+        return tree
+
+    @staticmethod
+    def _first_text(tree, selectors: List[Tuple[str, str, str]]) -> Optional[str]:
+        for selector in selectors:
+            node = tree.css_first(_css(*selector))
+            if node is not None:
+                return node.text(deep=True, separator="\n", strip=False)
+        return None
+
+    def extract_page(self, html: str) -> Tuple[Optional[str], Optional[str]]:
+        tree = self._tree(html)
+        text = self._first_text(tree, PAGE_SELECTORS)
+        if text is not None:
+            return text, None
+
+        iframe = tree.css_first("iframe#mainFrame")
+        if iframe is not None and iframe.attributes.get("src"):
+            return None, urljoin("https://blog.naver.com", iframe.attributes["src"])
+        return None, None
+
+    def extract_post(self, html: str) -> Optional[str]:
+        return self._first_text(self._tree(html), POST_SELECTORS)
+
+    def full_text(self, html: str) -> str:
+        # bs4 get_text 와 같게 <title> 등 head 문자열도 포함
+        root = self._tree(html).root
+        return "" if root is None else root.text(deep=True, separator="\n", strip=False)
+
+
+# auto 일 때 시도 순서 (빠른 것부터, 없으면 다음)
+EXTRACTORS: Dict[str, Callable[[], HtmlExtractor]] = {
+    "selectolax": SelectolaxExtractor,
+    "lxml": LxmlExtractor,
+    "bs4-strainer": lambda: SoupExtractor(strain=True),
+    "bs4": lambda: SoupExtractor(strain=False),
+}
+
+
+def get_extractor(name: str = "auto") -> HtmlExtractor:
+    """
+    name: auto / selectolax / lxml / bs4-strainer / bs4
+    auto 는 selectolax → lxml → bs4-strainer 순으로 설치된 것을 쓴다.
+    """
+    if name != "auto":
+        if name not in EXTRACTORS:
+            raise ValueError(f"알 수 없는 extractor: {name} (가능: auto, {', '.join(EXTRACTORS)})")
+        return EXTRACTORS[name]()
+
+    for candidate in ("selectolax", "lxml"):
+        try:
+            return EXTRACTORS[candidate]()
+        except ImportError:
+            continue
+    return SoupExtractor(strain=True)
+
+
+def extract_blog_text(
+    url: str,
+    fetch_html: Callable[[str], str],
+    extractor: HtmlExtractor,
+    rewrite_postview: bool = True,
+) -> str:
+    """
+    네이버 블로그(및 외부 블로그)의 본문 텍스트를 추출한다. 실패하면 빈 문자열.
+
+    0차: 네이버 블로그 글이면 PostView URL 을 바로 요청 (rewrite_postview)
+    1차: 직접 HTML에서 본문 영역 찾기
+    2차: iframe#mainFrame 이 있으면 그 src를 다시 요청해서 본문 찾기
+    3차: 그래도 안 되면 전체 텍스트
+    """
+    direct = postview_url(url) if rewrite_postview else None
+    if direct is not None:
+        try:
+            text = extractor.extract_post(fetch_html(direct))
+            if text is not None:
+                return text
+        except Exception as e:
+            print(f"    [WARN] PostView fetch 실패, 원래 URL로 재시도: {direct}, error={e}")
+
+    try:
+        html = fetch_html(url)
+    except Exception as e:
+        print(f"    [WARN] 1차 fetch 실패: {url}, error={e}")
+        return ""
+
+    text, iframe_url = extractor.extract_page(html)
+    if text is not None:
+        return text
+    if iframe_url is None:
+        return extractor.full_text(html)
+
+    try:
+        inner_html = fetch_html(iframe_url)
+    except Exception as e:
+        print(f"    [WARN] iframe fetch 실패: {iframe_url}, error={e}")
+        return ""
+
+    text = extractor.extract_post(inner_html)
+    return text if text is not None else extractor.full_text(inner_html)
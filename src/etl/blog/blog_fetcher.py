@@ -0,0 +1,170 @@
+# src/etl/blog/blog_fetcher.py
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.etl.blog.blog_extract import HtmlExtractor, extract_blog_text, get_extractor
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+# (connect, read) 타임아웃 초
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 10.0)
+
+# 같은 호스트(blog.naver.com 등)로 가는 요청 기본 제한: 동시 2개, 요청 시작 간격 0.5초 (최대 초당 2건)
+# 더 빠르게 받으려면 호출하는 쪽에서 명시적으로 올린다 (run_naver_blog_wordcloud --per-host/--host-interval)
+DEFAULT_MAX_PER_HOST = 2
+DEFAULT_HOST_INTERVAL_SEC = 0.5
+
+
+class HostLimiter:
+    """
+    호스트별 동시 요청 수 제한 + 요청 시작 간격(politeness) 제한.
+    전역 sleep 대신 같은 호스트로 가는 요청끼리만 서로 기다린다.
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        interval_sec: float = DEFAULT_HOST_INTERVAL_SEC,
+    ):
+        self.max_per_host = max(1, max_per_host)
+        self.interval_sec = interval_sec
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_at: Dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, host: str):
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = sem
+
+        sem.acquire()
+        try:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_at.get(host, 0.0))
+                self._next_at[host] = start_at + self.interval_sec
+            if start_at > now:
+                time.sleep(start_at - now)
+            yield
+        finally:
+            sem.release()
+
+
+class BlogFetcher:
+    """
+    블로그 본문 동시 수집기.
+
+    - requests.Session 하나를 모든 스레드가 같이 사용 (HTTPAdapter 커넥션 풀 = max_workers)
+    - HostLimiter 로 호스트별 동시 요청 수(max_per_host) / 요청 간격(host_interval_sec) 제한
+      → blog.naver.com 에는 예의를 지키면서 다른 호스트 글은 동시에 받는다
+    - 요청마다 (connect, read) 타임아웃, 5xx/429 는 urllib3 Retry 로 짧게 재시도
+    - 본문 추출은 blog_extract 의 extractor (auto = selectolax → lxml → bs4-strainer),
+      네이버 블로그 글은 PostView URL 을 바로 요청 (rewrite_postview)
+
+    사용 예:
+        with BlogFetcher() as fetcher:
+            futures = {url: fetcher.submit(url) for url in urls}
+            text = futures[url].result()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        host_interval_sec: float = DEFAULT_HOST_INTERVAL_SEC,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        max_retries: int = 2,
+        extractor: Union[str, HtmlExtractor] = "auto",
+        rewrite_postview: bool = True,
+    ):
+        self.timeout = timeout
+        self.extractor = get_extractor(extractor) if isinstance(extractor, str) else extractor
+        self.rewrite_postview = rewrite_postview
+        self.limiter = HostLimiter(max_per_host=max_per_host, interval_sec=host_interval_sec)
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max_workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+        # 실제로 보낸 HTTP 요청 수
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+
+    def __enter__(self) -> "BlogFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        호스트별 제한을 지키면서 공유 세션으로 GET (검색 API 호출 등에도 사용)
+        """
+        host = urlsplit(url).netloc.lower()
+        kwargs.setdefault("timeout", self.timeout)
+        with self.limiter.slot(host):
+            with self._count_lock:
+                self.request_count += 1
+            return self.session.get(url, **kwargs)
+
+    def fetch_html(self, url: str) -> str:
+        resp = self.get(url)
+        resp.raise_for_status()
+        return resp.text
+
+    def extract_text(self, url: str) -> str:
+        """
+        네이버 블로그(및 외부 블로그)의 본문 텍스트를 추출한다. 실패하면 빈 문자열.
+        (순서는 blog_extract.extract_blog_text 참고)
+        """
+        return extract_blog_text(url, self.fetch_html, self.extractor, self.rewrite_postview)
+
+    def submit(self, url: str) -> Future:
+        """
+        본문 추출 작업을 스레드 풀에 넣는다. Future.result() = 본문 텍스트
+        """
+        return self._pool.submit(self.extract_text, url)
+
+    def extract_many(self, urls) -> Iterator[Tuple[str, str]]:
+        """
+        여러 URL 을 동시에 받아서 입력 순서대로 (url, 본문 텍스트) 를 yield 한다.
+        """
+        futures = [(url, self.submit(url)) for url in urls]
+        for url, fut in futures:
+            yield url, fut.result()
@@ -0,0 +1,191 @@
+# src/etl/blog/blog_search.py
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+from src.etl.blog.blog_extract import naver_post_id
+from src.etl.blog.blog_fetcher import BlogFetcher
+
+
+BLOG_SEARCH_URL = "https://openapi.naver.com/v1/search/blog.json"
+
+# 네이버 검색 API 제한: display 최대 100, start 최대 1000
+MAX_DISPLAY = 100
+MAX_START = 1000
+
+# 글을 구분하지 않는 추적/리다이렉트용 쿼리 파라미터 (정규화 때 제거)
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "from",
+    "redirect",
+    "widgetTypeCall",
+    "directAccess",
+    "trackingCode",
+}
+
+
+def get_naver_credentials() -> Tuple[str, str]:
+    client_id = os.getenv("NAVER_CLIENT_ID")
+    client_secret = os.getenv("NAVER_CLIENT_SECRET")
+
+    if not client_id or not client_secret:
+        raise RuntimeError(
+            "NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경 변수가 없습니다."
+        )
+
+    return client_id, client_secret
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    같은 글이 다른 URL 로 검색되는 경우를 하나로 모은다.
+      - 네이버 블로그: m.blog / PostView.naver?blogId=..&logNo=.. → https://blog.naver.com/<id>/<no>
+      - 그 외: scheme/host 소문자, fragment 제거, 추적용(utm_* 등) 쿼리 파라미터 제거, 끝 '/' 제거
+        (글 번호가 쿼리에 있는 블로그가 있어서 나머지 파라미터는 정렬해서 남긴다)
+    """
+    url = url.strip()
+    post_id = naver_post_id(url)
+    if post_id is not None:
+        blog_id, log_no = post_id
+        return f"https://blog.naver.com/{blog_id}/{log_no}"
+
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host in ("m.blog.naver.com", "blog.naver.com"):
+        # 글 번호가 없는 네이버 블로그 주소 (블로그 홈 등)
+        return urlunsplit(("https", "blog.naver.com", parts.path.rstrip("/"), "", ""))
+
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith("utm_") and k not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(((parts.scheme or "https").lower(), host, path, urlencode(query), ""))
+
+
+def search_naver_blogs_via_api(
+    query: str,
+    max_results: int = 3,
+    sort: str = "sim",
+    fetcher: Optional[BlogFetcher] = None,
+    max_pages: int = 3,
+) -> List[Dict[str, str]]:
+    """
+    네이버 블로그 검색 API 로 정규화 URL 기준 서로 다른 글 max_results 개를 모은다.
+    같은 글이 URL 만 달리 나오면 다음 페이지(start)를 이어서 요청한다. (최대 max_pages 번)
+    반환: [{"title", "url"(정규화 URL)}, ...] 검색 순위 순
+
+    fetcher 를 주면 공유 세션 + 호스트별 요청 간격 제한을 같이 쓴다.
+    """
+    client_id, client_secret = get_naver_credentials()
+    headers = {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret,
+    }
+
+    display = max(1, min(MAX_DISPLAY, max_results))
+    results: List[Dict[str, str]] = []
+    seen = set()
+    start = 1
+
+    for _ in range(max(1, max_pages)):
+        params = {
+            "query": query,
+            "display": display,
+            "start": start,
+            "sort": sort,
+        }
+        if fetcher is not None:
+            resp = fetcher.get(BLOG_SEARCH_URL, headers=headers, params=params, timeout=5)
+        else:
+            resp = requests.get(BLOG_SEARCH_URL, headers=headers, params=params, timeout=5)
+
+        if resp.status_code != 200:
+            print(
+                f"[WARN] 네이버 블로그 검색 API 실패: query={query}, start={start}, status={resp.status_code}"
+            )
+            break
+
+        data = resp.json()
+        items = data.get("items", [])
+
+        for item in items:
+            link = item.get("link", "").strip()
+            if not link:
+                continue
+            canonical = canonicalize_url(link)
+            if canonical in seen:
+                continue
+            seen.add(canonical)
+
+            # title 안의 HTML 태그 제거
+            soup_title = BeautifulSoup(item.get("title", ""), "html.parser")
+            title = soup_title.get_text(" ", strip=True)
+            results.append({"title": title, "url": canonical})
+            if len(results) >= max_results:
+                return results
+
+        start += display
+        total = int(data.get("total") or 0)
+        if len(items) < display or start > min(total, MAX_START):
+            break
+
+    return results
+
+
+@dataclass
+class BlogSearchPlan:
+    """
+    이번 실행의 검색 결과를 URL 기준으로 합친 것.
+
+    - articles: 정규화 URL → {"title", "url"} (실행 전체에서 한 번씩만 받는다)
+    - owners: 정규화 URL → 처음 찾은 model_id (본문 수집 요청은 이 모델 검색 때 한 번만)
+    - links: model_id → [(정규화 URL, 검색어, 검색 순위)] (모델 ↔ 글 다대다 매핑)
+    """
+
+    articles: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    owners: Dict[str, int] = field(default_factory=dict)
+    links: Dict[int, List[Tuple[str, str, int]]] = field(default_factory=dict)
+
+    def add(self, model_id: int, query: str, results: List[Dict[str, str]]) -> List[str]:
+        """
+        모델 하나의 검색 결과를 추가. 반환: 이번에 처음 나온(= 새로 받아야 할) URL 목록
+        """
+        new_urls: List[str] = []
+        links = self.links.setdefault(model_id, [])
+        for rank, a in enumerate(results, start=1):
+            url = a["url"]
+            links.append((url, query, rank))
+            if url not in self.articles:
+                self.articles[url] = a
+                self.owners[url] = model_id
+                new_urls.append(url)
+        return new_urls
+
+    def shared_count(self) -> int:
+        """
+        두 모델 이상에서 검색된 글 수
+        """
+        counts: Dict[str, int] = {}
+        for links in self.links.values():
+            for url, _, _ in links:
+                counts[url] = counts.get(url, 0) + 1
+        return sum(1 for n in counts.values() if n > 1)
+
+    def stats(self) -> Dict[str, Any]:
+        n_links = sum(len(v) for v in self.links.values())
+        return {
+            "models": len(self.links),
+            "links": n_links,
+            "unique_articles": len(self.articles),
+            "shared_articles": self.shared_count(),
+        }
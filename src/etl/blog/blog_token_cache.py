@@ -0,0 +1,120 @@
+# src/etl/blog/blog_token_cache.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+BLOG_TOKEN_CACHE_PATH = BASE_DIR / "data" / "cache" / "blog_tokens" / "token_cache.sqlite"
+
+# 명사 필터 규칙(blog_tokenizer.NOUN_TAGS, 길이/숫자 조건)이 바뀌면 올린다 → 이전 캐시는 안 쓴다
+TOKENIZER_VERSION = 1
+
+
+def content_sha1(content: str) -> str:
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class BlogTokenCache:
+    """
+    블로그 본문 토큰 빈도 캐시 (본문 텍스트의 SHA-1 기준, SQLite)
+
+      data/cache/blog_tokens/token_cache.sqlite
+        token_counts(content_sha1, tokenizer_version, counts = {"명사": 빈도} JSON, cached_at)
+
+    같은 상위 글이 다음 달에도 검색되면 본문이 같으므로 형태소 분석을 다시 하지 않는다.
+    refresh=True 면 읽기는 건너뛰고(항상 miss) 새 결과로 덮어쓴다.
+    """
+
+    def __init__(self, path: Optional[Path] = None, refresh: bool = False):
+        self.path = path or BLOG_TOKEN_CACHE_PATH
+        self.refresh = refresh
+
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS token_counts (
+                content_sha1 TEXT NOT NULL,
+                tokenizer_version INTEGER NOT NULL,
+                counts TEXT NOT NULL,
+                cached_at REAL NOT NULL,
+                PRIMARY KEY (content_sha1, tokenizer_version)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "BlogTokenCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, int]]:
+        """
+        SHA-1 목록 → 캐시에 있는 것만 {sha1: {토큰: 빈도}}. hits/misses 는 키 단위로 센다.
+        """
+        keys = list(dict.fromkeys(keys))
+        if self.refresh:
+            self.misses += len(keys)
+            return {}
+
+        found: Dict[str, Dict[str, int]] = {}
+        # SQLite 바인딩 변수 개수 제한(기본 999) 안쪽으로 나눠 조회
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            placeholders = ", ".join(["?"] * len(chunk))
+            rows = self._conn.execute(
+                f"""
+                SELECT content_sha1, counts
+                FROM token_counts
+                WHERE tokenizer_version = ?
+                  AND content_sha1 IN ({placeholders})
+                """,
+                [TOKENIZER_VERSION] + chunk,
+            ).fetchall()
+            for key, counts in rows:
+                try:
+                    found[key] = json.loads(counts)
+                except ValueError as e:
+                    print(f"[WARN] 토큰 캐시 읽기 실패, 무시: {key}, error={e}")
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries: Dict[str, Dict[str, int]]) -> None:
+        """
+        {sha1: {토큰: 빈도}} 를 한 트랜잭션으로 저장
+        """
+        if not entries:
+            return
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO token_counts (content_sha1, tokenizer_version, counts, cached_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (key, TOKENIZER_VERSION, json.dumps(counts, ensure_ascii=False), now)
+                    for key, counts in entries.items()
+                ],
+            )
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
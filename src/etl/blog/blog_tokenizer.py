@@ -0,0 +1,98 @@
+# src/etl/blog/blog_tokenizer.py
+
+from __future__ import annotations
+
+import collections
+import threading
+from typing import Counter, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from kiwipiepy import Kiwi
+
+from src.etl.blog.blog_token_cache import BlogTokenCache, content_sha1
+
+
+# Kiwi 품사 태그 중 명사류(N*): 일반/고유/의존 명사, 수사, 대명사
+# (매 토큰마다 tag.startswith("N") 를 하지 않고 집합 조회 한 번으로 거른다)
+NOUN_TAGS = frozenset({"NNG", "NNP", "NNB", "NR", "NP"})
+
+# Kiwi 내부 스레드 수 기본값 (-1 = 가용 코어 전부, 0 = 메인 스레드만)
+DEFAULT_NUM_WORKERS = -1
+
+_kiwi_cache: Dict[int, Kiwi] = {}
+_kiwi_lock = threading.Lock()
+
+
+def get_kiwi(num_workers: int = DEFAULT_NUM_WORKERS) -> Kiwi:
+    """
+    num_workers 별로 Kiwi 를 한 번만 만든다. (모델 로딩이 무거워서 재사용)
+    """
+    with _kiwi_lock:
+        kiwi = _kiwi_cache.get(num_workers)
+        if kiwi is None:
+            kiwi = Kiwi(num_workers=num_workers)
+            _kiwi_cache[num_workers] = kiwi
+        return kiwi
+
+
+def iter_nouns(tokens) -> Iterator[str]:
+    """
+    Kiwi 토큰 목록 → 명사 form (두 글자 이상, 숫자만 있는 것은 제외)
+    """
+    for w in tokens:
+        if w.tag in NOUN_TAGS:
+            form = w.form.strip()
+            if len(form) > 1 and not form.isdigit():
+                yield form
+
+
+def count_tokens_by_key(
+    docs: Iterable[Tuple[Hashable, str]],
+    num_workers: int = DEFAULT_NUM_WORKERS,
+    cache: Optional[BlogTokenCache] = None,
+) -> Dict[Hashable, Counter[str]]:
+    """
+    (key, 본문) 목록을 Kiwi 배치 API 로 한 번에 형태소 분석해서 key 별 명사 Counter 로 모은다.
+
+    - kiwi.tokenize(iterable) 은 Kiwi 내부 스레드(num_workers)로 병렬 분석하고 입력 순서대로 결과를 준다
+    - cache 가 있으면 본문 SHA-1 로 저장된 빈도를 그대로 쓰고, 처음 보는 본문만 분석한 뒤 캐시에 저장
+    - 같은 실행 안에서 본문이 같은 글은 한 번만 분석
+    key 는 보통 model_id. 본문이 비어 있는 문서는 건너뛴다.
+    """
+    docs = [(key, content_sha1(t), t) for key, t in docs if t and t.strip()]
+    counters: Dict[Hashable, Counter[str]] = {}
+    if not docs:
+        return counters
+
+    by_hash: Dict[str, Counter[str]] = {}
+    if cache is not None:
+        for h, counts in cache.get_many(h for _, h, _ in docs).items():
+            by_hash[h] = collections.Counter(counts)
+
+    pending: Dict[str, str] = {}
+    for _, h, t in docs:
+        if h not in by_hash:
+            pending.setdefault(h, t)
+
+    if pending:
+        kiwi = get_kiwi(num_workers)
+        results = kiwi.tokenize(iter(pending.values()))
+        for h, tokens in zip(pending, results):
+            by_hash[h] = collections.Counter(iter_nouns(tokens))
+
+        if cache is not None:
+            cache.put_many({h: dict(by_hash[h]) for h in pending})
+
+    for key, h, _ in docs:
+        counter = counters.get(key)
+        if counter is None:
+            counter = counters[key] = collections.Counter()
+        counter.update(by_hash[h])
+
+    return counters
+
+
+def sort_token_counts(counter: Counter[str]) -> List[Tuple[str, int]]:
+    """
+    빈도 내림차순, 같으면 토큰 가나다순
+    """
+    return sorted(counter.items(), key=lambda x: (-x[1], x[0]))
@@ -0,0 +1,394 @@
+# src/etl/blog/build_token_trends.py
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import bindparam, text
+
+from src.db.connection import get_engine
+
+
+# 결과 종류 (blog_token_trend.kind)
+KIND_TFIDF = "tfidf"  # 같은 달 다른 모델 대비 이 모델에서 유난히 많이 나온 키워드
+KIND_RISING = "rising"  # 전월 대비 비중이 가장 많이 오른 키워드
+KIND_FALLING = "falling"  # 전월 대비 비중이 가장 많이 내린 키워드
+
+DEFAULT_TOP_K = 10
+DEFAULT_MIN_COUNT = 2
+
+TOKEN_COUNTS_SQL = """
+    SELECT
+        model_id,
+        month,
+        token,
+        total_count
+    FROM blog_token_monthly
+    WHERE (:start_month IS NULL OR month >= :start_month)
+      AND (:end_month IS NULL OR month <= :end_month)
+"""
+
+TREND_INSERT_SQL = """
+    INSERT INTO blog_token_trend (
+        model_id,
+        month,
+        kind,
+        token_rank,
+        token,
+        score,
+        share,
+        prev_share
+    )
+    VALUES (
+        :model_id,
+        :month,
+        :kind,
+        :token_rank,
+        :token,
+        :score,
+        :share,
+        :prev_share
+    )
+"""
+
+
+def parse_month_arg(month_str: Optional[str]) -> Optional[datetime.date]:
+    """--month 값("YYYY-MM" 또는 "YYYY-MM-DD") → 그 달 1일. 없으면 None(전체 월)."""
+    if not month_str:
+        return None
+    if len(month_str) == 7:
+        month_str = month_str + "-01"
+    return datetime.datetime.strptime(month_str, "%Y-%m-%d").date().replace(day=1)
+
+
+def prev_month(month: datetime.date) -> datetime.date:
+    return (month.replace(day=1) - datetime.timedelta(days=1)).replace(day=1)
+
+
+@dataclass
+class TokenMatrix:
+    """
+    (모델, 월) × 토큰 희소 행렬 (COO 형식: 0 이 아닌 칸만 row/col/count 배열로 가진다)
+
+    - rows: 행 번호 → (model_id, month)
+    - tokens: 열 번호 → 토큰
+    - row_idx / col_idx / counts: 0 이 아닌 칸 (같은 위치끼리 한 칸)
+
+    blog_token_monthly 는 (모델, 월)마다 상위 50개만 있어서 행당 칸 수가 작고,
+    토큰 종류는 모델 수에 비례해 늘어나므로 dense 행렬 대신 이 형식으로 계산한다.
+    """
+
+    rows: List[Tuple[int, datetime.date]]
+    tokens: np.ndarray
+    row_idx: np.ndarray
+    col_idx: np.ndarray
+    counts: np.ndarray
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.rows), len(self.tokens)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.counts)
+
+    def row_totals(self) -> np.ndarray:
+        return np.bincount(self.row_idx, weights=self.counts, minlength=len(self.rows))
+
+    def row_months(self) -> Tuple[np.ndarray, List[datetime.date]]:
+        """행 번호 → 월 번호, 월 목록"""
+        codes, months = pd.factorize(pd.Series([m for _, m in self.rows], dtype=object))
+        return codes, list(months)
+
+    def prev_rows(self) -> np.ndarray:
+        """행 번호 → 같은 모델 전월 행 번호 (전월 데이터가 없으면 -1)"""
+        position = {key: i for i, key in enumerate(self.rows)}
+        return np.array(
+            [position.get((mid, prev_month(m)), -1) for mid, m in self.rows],
+            dtype=np.int64,
+        )
+
+
+def build_token_matrix(df: pd.DataFrame) -> TokenMatrix:
+    """
+    blog_token_monthly 행(model_id, month, token, total_count) → TokenMatrix
+    """
+    row_idx, row_keys = pd.factorize(pd.MultiIndex.from_arrays([df["model_id"], df["month"]]))
+    col_idx, tokens = pd.factorize(df["token"])
+    return TokenMatrix(
+        rows=[(int(mid), m) for mid, m in row_keys],
+        tokens=np.asarray(tokens, dtype=object),
+        row_idx=row_idx.astype(np.int64),
+        col_idx=col_idx.astype(np.int64),
+        counts=df["total_count"].to_numpy(dtype=np.float64),
+    )
+
+
+def compute_tfidf(matrix: TokenMatrix) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    칸별 (share, tfidf)
+
+    - share(tf) = 빈도 / 그 (모델, 월) 의 전체 빈도
+    - idf = ln((1 + N) / (1 + df))   (N = 그 달 모델 수, df = 그 토큰이 나온 모델 수)
+      → 그 달 모든 모델에 나온 단어(차, 자동차, 가격 …)는 0, 드물수록 커진다
+    """
+    share = matrix.counts / matrix.row_totals()[matrix.row_idx]
+
+    month_of_row, _ = matrix.row_months()
+    entry_month = month_of_row[matrix.row_idx]
+    n_models = np.bincount(month_of_row)[entry_month]
+
+    # (월, 토큰) 별 등장 모델 수 = 같은 (월, 열) 칸 개수
+    n_tokens = max(len(matrix.tokens), 1)
+    _, inverse, doc_freq = np.unique(
+        entry_month * n_tokens + matrix.col_idx,
+        return_inverse=True,
+        return_counts=True,
+    )
+    idf = np.log((1.0 + n_models) / (1.0 + doc_freq[inverse]))
+    return share, share * idf
+
+
+def compute_share_deltas(matrix: TokenMatrix, share: np.ndarray) -> pd.DataFrame:
+    """
+    전월 데이터가 있는 (모델, 월) 행에 대해 토큰별 비중 변화.
+    한쪽 달에만 있는 토큰은 다른 달 비중을 0 으로 본다. (상위 50개 밖으로 밀려난 것도 0)
+
+    반환 컬럼: row, col, count, share, prev_share, delta
+    """
+    prev_of_row = matrix.prev_rows()
+    next_of_row = np.full(len(matrix.rows), -1, dtype=np.int64)
+    has_prev = prev_of_row >= 0
+    next_of_row[prev_of_row[has_prev]] = np.flatnonzero(has_prev)
+
+    cur_mask = has_prev[matrix.row_idx]
+    cur = pd.DataFrame(
+        {
+            "row": matrix.row_idx[cur_mask],
+            "col": matrix.col_idx[cur_mask],
+            "count": matrix.counts[cur_mask],
+            "share": share[cur_mask],
+        }
+    )
+
+    # 전월 칸을 다음 달 행 번호로 옮겨서 같은 (row, col) 로 맞춘다
+    next_rows = next_of_row[matrix.row_idx]
+    prev_mask = next_rows >= 0
+    prev = pd.DataFrame(
+        {
+            "row": next_rows[prev_mask],
+            "col": matrix.col_idx[prev_mask],
+            "prev_share": share[prev_mask],
+        }
+    )
+
+    merged = cur.merge(prev, on=["row", "col"], how="outer")
+    merged[["count", "share", "prev_share"]] = merged[["count", "share", "prev_share"]].fillna(0.0)
+    merged["delta"] = merged["share"] - merged["prev_share"]
+    return merged
+
+
+def _top_k(
+    frame: pd.DataFrame,
+    matrix: TokenMatrix,
+    kind: str,
+    score_col: str,
+    top_k: int,
+    ascending: bool = False,
+) -> pd.DataFrame:
+    """행(모델, 월)별 score 상위 top_k → blog_token_trend 형태"""
+    if frame.empty:
+        return pd.DataFrame()
+
+    frame = frame.assign(token=matrix.tokens[frame["col"].to_numpy()], score=frame[score_col])
+    frame = frame.sort_values(["row", "score", "token"], ascending=[True, ascending, True])
+    top = frame.groupby("row", sort=False).head(top_k).copy()
+    top["token_rank"] = top.groupby("row", sort=False).cumcount() + 1
+    top["kind"] = kind
+
+    keys = [matrix.rows[r] for r in top["row"].to_numpy()]
+    top["model_id"] = [mid for mid, _ in keys]
+    top["month"] = [m for _, m in keys]
+    return top
+
+
+def compute_token_trends(
+    df: pd.DataFrame,
+    top_k: int = DEFAULT_TOP_K,
+    min_count: int = DEFAULT_MIN_COUNT,
+    months: Optional[List[datetime.date]] = None,
+) -> pd.DataFrame:
+    """
+    blog_token_monthly 행 → blog_token_trend 행 (모델/월마다 tfidf, rising, falling 각 top_k)
+
+    - tfidf / rising 은 그 달 빈도가 min_count 이상인 토큰만 (한 번 나온 단어는 노이즈)
+    - tfidf 는 점수가 0 보다 큰 것만 (그 달 모든 모델에 나온 단어는 제외)
+    - months 를 주면 그 달 결과만 남긴다 (IDF/전월 비교용으로 df 에는 다른 달이 더 있을 수 있음)
+
+    반환 컬럼: model_id, month, kind, token_rank, token, score, share, prev_share
+    """
+    columns = ["model_id", "month", "kind", "token_rank", "token", "score", "share", "prev_share"]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    matrix = build_token_matrix(df)
+    share, tfidf = compute_tfidf(matrix)
+
+    entries = pd.DataFrame(
+        {
+            "row": matrix.row_idx,
+            "col": matrix.col_idx,
+            "count": matrix.counts,
+            "share": share,
+            "tfidf": tfidf,
+        }
+    )
+    entries["prev_share"] = np.nan
+
+    deltas = compute_share_deltas(matrix, share)
+    rising = deltas[(deltas["delta"] > 0) & (deltas["count"] >= min_count)]
+    falling = deltas[deltas["delta"] < 0]
+
+    parts = [
+        _top_k(entries[(entries["count"] >= min_count) & (entries["tfidf"] > 0)], matrix, KIND_TFIDF, "tfidf", top_k),
+        _top_k(rising, matrix, KIND_RISING, "delta", top_k),
+        _top_k(falling, matrix, KIND_FALLING, "delta", top_k, ascending=True),
+    ]
+    parts = [p for p in parts if not p.empty]
+    if not parts:
+        return pd.DataFrame(columns=columns)
+
+    result = pd.concat(parts, ignore_index=True)[columns]
+    if months is not None:
+        result = result[result["month"].isin(set(months))]
+    return result.reset_index(drop=True)
+
+
+def load_token_counts(
+    conn,
+    start_month: Optional[datetime.date] = None,
+    end_month: Optional[datetime.date] = None,
+) -> pd.DataFrame:
+    """blog_token_monthly → DataFrame(model_id, month, token, total_count)"""
+    rows = conn.execute(
+        text(TOKEN_COUNTS_SQL),
+        {"start_month": start_month, "end_month": end_month},
+    ).fetchall()
+    df = pd.DataFrame(rows, columns=["model_id", "month", "token", "total_count"])
+    # 드라이버에 따라 DATE 가 문자열로 올 수 있어서 datetime.date 로 맞춘다
+    df["month"] = pd.to_datetime(df["month"]).dt.date
+    return df
+
+
+def save_token_trends(conn, trends: pd.DataFrame, months: List[datetime.date]) -> None:
+    """
+    대상 월의 blog_token_trend 를 지우고 새 결과로 채운다.
+    순위 목록이 통째로 바뀌므로 upsert 대신 월 단위로 교체한다. (이전 결과 중 빠진 순위가 남지 않게)
+    DELETE + INSERT 가 한 트랜잭션이 되도록 conn 은 engine.begin() 으로 연 연결을 넘긴다.
+    """
+    rows: List[Dict[str, Any]] = [
+        {
+            "model_id": int(r.model_id),
+            "month": r.month,
+            "kind": r.kind,
+            "token_rank": int(r.token_rank),
+            "token": r.token,
+            "score": float(r.score),
+            "share": float(r.share),
+            "prev_share": None if r.kind == KIND_TFIDF else float(r.prev_share),
+        }
+        for r in trends.itertuples(index=False)
+    ]
+
+    conn.execute(
+        text("DELETE FROM blog_token_trend WHERE month IN :months").bindparams(
+            bindparam("months", expanding=True)
+        ),
+        {"months": list(months)},
+    )
+    if rows:
+        conn.execute(text(TREND_INSERT_SQL), rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="blog_token_monthly 기반 키워드 트렌드(TF-IDF, 전월 대비 급상승/하락) 사전 계산 ETL"
+    )
+    parser.add_argument("--run-id", required=True, help="실행 ID (로그용)")
+    parser.add_argument(
+        "--month",
+        type=str,
+        default=None,
+        help="이 달만 다시 계산 (YYYY-MM 또는 YYYY-MM-DD, default: 전체 월)",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=DEFAULT_TOP_K,
+        help="모델/월/종류별 저장할 키워드 수",
+    )
+    parser.add_argument(
+        "--min-count",
+        type=int,
+        default=DEFAULT_MIN_COUNT,
+        help="TF-IDF / 급상승 후보가 되려면 그 달에 최소 몇 번 나와야 하는지",
+    )
+    args = parser.parse_args()
+
+    month = parse_month_arg(args.month)
+    started = time.perf_counter()
+
+    engine = get_engine(echo=False)
+    # 읽기는 별도 연결로 끝내고, 저장은 engine.begin() 트랜잭션에서 한다
+    # (같은 연결에서 SELECT 후 conn.begin() 을 부르면 SQLAlchemy 2.x 는 이미 시작된 트랜잭션이라 실패)
+    with engine.connect() as conn:
+        # 특정 월만 계산해도 전월 비교를 위해 전월까지 읽는다
+        df = load_token_counts(
+            conn,
+            start_month=prev_month(month) if month else None,
+            end_month=month,
+        )
+    if df.empty:
+        print("[WARN] blog_token_monthly 데이터가 없습니다.")
+        return
+
+    months = [month] if month else sorted(df["month"].unique())
+    print(
+        f"[INFO] 대상 월 {len(months)}개 "
+        f"({months[0]:%Y-%m} ~ {months[-1]:%Y-%m}), 토큰 행 {len(df):,}개"
+    )
+
+    t0 = time.perf_counter()
+    trends = compute_token_trends(
+        df, top_k=args.top_k, min_count=args.min_count, months=months
+    )
+    compute_sec = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with engine.begin() as conn:
+        save_token_trends(conn, trends, months)
+    db_sec = time.perf_counter() - t0
+
+    n_rows = len(df[["model_id", "month"]].drop_duplicates())
+    n_tokens = df["token"].nunique()
+    counts = trends["kind"].value_counts()
+
+    print("\n[SUMMARY]")
+    print(f"  run_id              : {args.run_id}")
+    print(f"  행렬 (모델·월 × 토큰): {n_rows:,} × {n_tokens:,} (0 아닌 칸 {len(df):,}개)")
+    print(f"  저장 행 수          : {len(trends):,}")
+    for kind in (KIND_TFIDF, KIND_RISING, KIND_FALLING):
+        print(f"    - {kind:<8}: {int(counts.get(kind, 0)):,}")
+    print(f"  계산 시간           : {compute_sec:.2f}초")
+    print(f"  DB 저장 시간        : {db_sec:.2f}초")
+    print(f"  전체 시간           : {time.perf_counter() - started:.2f}초")
+
+
+if __name__ == "__main__":
+    main()
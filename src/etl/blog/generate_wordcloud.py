@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import argparse
 import datetime
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 
 from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 from matplotlib import font_manager as fm
 
 from sqlalchemy import text
@@ -64,19 +68,19 @@ def parse_month_arg(month_str: str | None) -> datetime.date:
     return datetime.datetime.strptime(month_str, "%Y-%m-%d").date()
 
 
-def load_token_counts_by_model(
+def load_wordcloud_inputs(
     month: datetime.date,
     limit_models: int | None = None,
-) -> Dict[int, Dict[str, int]]:
+) -> Tuple[Dict[int, Dict[str, int]], Dict[int, Tuple[str, Optional[str]]]]:
     """
-    blog_token_monthly 에서 해당 month 의 토큰 빈도를
-    model_id 별로 묶어서 반환.
+    blog_token_monthly 의 해당 month 토큰 빈도와, 이미 만든 blog_wordcloud 정보를
+    쿼리 한 번(LEFT JOIN)으로 가져온다.
 
     return:
-        {
-            model_id: { token: total_count, ... },
-            ...
-        }
+        (
+            { model_id: { token: total_count, ... }, ... },
+            { model_id: (image_path, token_fingerprint), ... },  # 기존 이미지가 있는 모델만
+        )
     """
     engine = get_engine(echo=False)
     sql = text(
@@ -84,14 +88,20 @@ def load_token_counts_by_model(
         SELECT
             bt.model_id,
             bt.token,
-            bt.total_count
+            bt.total_count,
+            wc.image_path,
+            wc.token_fingerprint
         FROM blog_token_monthly bt
+        LEFT JOIN blog_wordcloud wc
+          ON wc.model_id = bt.model_id
+         AND wc.month = bt.month
         WHERE bt.month = :month
         ORDER BY bt.model_id, bt.token_rank
         """
     )
 
     result: Dict[int, Dict[str, int]] = {}
+    existing: Dict[int, Tuple[str, Optional[str]]] = {}
     with engine.connect() as conn:
         rows = conn.execute(sql, {"month": month}).mappings().all()
 
@@ -101,6 +111,8 @@ def load_token_counts_by_model(
         count = row["total_count"]
         if mid not in result:
             result[mid] = {}
+            if row["image_path"] is not None:
+                existing[mid] = (row["image_path"], row["token_fingerprint"])
         # 중복 토큰이 있을 일은 없지만, 혹시 모르니 누적
         result[mid][token] = result[mid].get(token, 0) + count
 
@@ -111,9 +123,50 @@ def load_token_counts_by_model(
             if i >= limit_models:
                 break
             limited[mid] = tokens
-        return limited
+        return limited, existing
 
-    return result
+    return result, existing
+
+
+def load_token_counts_by_model(
+    month: datetime.date,
+    limit_models: int | None = None,
+) -> Dict[int, Dict[str, int]]:
+    """
+    blog_token_monthly 에서 해당 month 의 토큰 빈도를
+    model_id 별로 묶어서 반환.
+
+    return:
+        {
+            model_id: { token: total_count, ... },
+            ...
+        }
+    """
+    return load_wordcloud_inputs(month, limit_models=limit_models)[0]
+
+
+def token_fingerprint(
+    tokens: Dict[str, int],
+    font_path: str | None,
+    width: int,
+    height: int,
+    max_words: int,
+) -> str:
+    """
+    (토큰 → 빈도) 정렬 목록 + 렌더링 옵션의 SHA-1.
+    같은 값이면 같은 이미지가 나오므로 다시 만들 필요가 없다.
+    font_path 는 resolve_font_path 가 실제로 고른 경로 (--font-path 가 없거나 잘못돼서
+    다른 폰트로 바뀌면 fingerprint 도 바뀐다)
+    """
+    payload = {
+        "tokens": sorted(tokens.items()),
+        "font_path": font_path,
+        "width": width,
+        "height": height,
+        "max_words": max_words,
+    }
+    canonical = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
 
 
 def load_model_names(model_ids: List[int]) -> Dict[int, Tuple[str, str]]:
@@ -186,14 +239,13 @@ def generate_wordcloud_image(
 ) -> None:
     """
     주어진 토큰 빈도로 워드클라우드 이미지 생성 후 파일 저장.
+    font_path 는 resolve_font_path 로 미리 찾아 둔 경로 (실행당 한 번만 탐색).
     """
     if not tokens:
         return
 
-    resolved_font = resolve_font_path(font_path)
-
     wc = WordCloud(
-        font_path=resolved_font,
+        font_path=font_path,
         width=width,
         height=height,
         background_color="white",
@@ -202,26 +254,44 @@ def generate_wordcloud_image(
 
     wc.generate_from_frequencies(tokens)
 
-    # matplotlib 로 저장 (한 번도 plt.show() 안 쓰고 바로 저장)
-    plt.figure(figsize=(width / 100, height / 100))
-    plt.imshow(wc, interpolation="bilinear")
-    plt.axis("off")
-    plt.tight_layout(pad=0)
-
+    # matplotlib figure 를 거치지 않고 WordCloud 가 그린 이미지를 바로 PNG 로 저장
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, bbox_inches="tight", pad_inches=0)
-    plt.close()
+    wc.to_file(str(output_path))
 
 
-def upsert_blog_wordcloud(
-    model_id: int,
-    month: datetime.date,
-    image_path: str,
-) -> None:
+def render_wordcloud_task(
+    task: Tuple[int, Dict[str, int], str, str | None, int, int, int],
+) -> Tuple[int, float, Optional[str]]:
+    """
+    프로세스 풀 작업 단위.
+    task = (model_id, tokens, output_path, font_path, width, height, max_words)
+    반환: (model_id, 걸린 시간(초), 에러 메시지 또는 None)
+    """
+    model_id, tokens, output_path, font_path, width, height, max_words = task
+    started = time.perf_counter()
+    try:
+        generate_wordcloud_image(
+            tokens=tokens,
+            output_path=Path(output_path),
+            font_path=font_path,
+            width=width,
+            height=height,
+            max_words=max_words,
+        )
+    except Exception as e:
+        return model_id, time.perf_counter() - started, f"{type(e).__name__}: {e}"
+    return model_id, time.perf_counter() - started, None
+
+
+def upsert_blog_wordclouds(rows: List[Dict[str, Any]]) -> None:
     """
-    blog_wordcloud 에 (model_id, month) 기준 upsert.
+    blog_wordcloud 에 (model_id, month) 기준 upsert. 실행 끝에 한 트랜잭션으로 모아서 저장.
+    rows: [{"model_id", "month", "image_path", "token_fingerprint"}, ...]
     image_path 는 프로젝트 루트 기준 상대 경로로 넣는다.
     """
+    if not rows:
+        return
+
     engine = get_engine(echo=False)
     sql = text(
         """
@@ -229,29 +299,25 @@ def upsert_blog_wordcloud(
             model_id,
             month,
             image_path,
+            token_fingerprint,
             generated_at
         )
         VALUES (
             :model_id,
             :month,
             :image_path,
+            :token_fingerprint,
             NOW()
         )
         ON DUPLICATE KEY UPDATE
             image_path  = VALUES(image_path),
+            token_fingerprint = VALUES(token_fingerprint),
             generated_at = VALUES(generated_at)
         """
     )
 
     with engine.begin() as conn:
-        conn.execute(
-            sql,
-            {
-                "model_id": model_id,
-                "month": month,
-                "image_path": image_path,
-            },
-        )
+        conn.execute(sql, rows)
 
 
 def main():
@@ -295,48 +361,117 @@ def main():
         default=100,
         help="워드클라우드에 사용할 최대 단어 수",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="이미지 생성 프로세스 수 (기본: CPU 코어 수, 1 이면 프로세스 풀 없이 실행)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="토큰 fingerprint 가 같아도 전부 다시 생성",
+    )
     args = parser.parse_args()
 
     month = parse_month_arg(args.month)
     print(f"[INFO] 워드클라우드 생성 기준 월 = {month}")
 
-    token_by_model = load_token_counts_by_model(month, limit_models=args.limit_models)
+    token_by_model, existing = load_wordcloud_inputs(month, limit_models=args.limit_models)
     if not token_by_model:
         print("[WARN] 해당 월에 blog_token_monthly 데이터가 없습니다.")
         return
 
+    # 폰트 탐색(findfont)은 실행당 한 번. fingerprint 에도 실제로 쓰는 폰트를 넣는다.
+    font_path = resolve_font_path(args.font_path)
+
+    # 토큰/옵션 fingerprint 가 같고 이미지 파일도 남아 있으면 스킵
+    fingerprints: Dict[int, str] = {}
+    skipped = 0
+    for model_id, tokens in token_by_model.items():
+        fp = token_fingerprint(tokens, font_path, args.width, args.height, args.max_words)
+        prev = existing.get(model_id)
+        if (
+            not args.force
+            and prev is not None
+            and prev[1] == fp
+            and (BASE_DIR / prev[0]).exists()
+        ):
+            skipped += 1
+            continue
+        fingerprints[model_id] = fp
+
+    print(f"[INFO] 대상 모델 {len(token_by_model)}개 중 변경 없음 {skipped}개 스킵")
+    if not fingerprints:
+        print("[INFO] 다시 만들 워드클라우드가 없습니다.")
+        return
+
+    token_by_model = {mid: token_by_model[mid] for mid in fingerprints}
     model_ids = list(token_by_model.keys())
     model_names = load_model_names(model_ids)
 
     out_dir = ensure_output_dir(month)
     print(f"[INFO] 출력 디렉토리: {out_dir}")
 
+    tasks = []
+    rel_paths: Dict[int, Path] = {}
     for model_id, tokens in token_by_model.items():
         brand, model_name = model_names.get(model_id, (None, None))
 
         output_path = build_filename(out_dir, model_id, brand, model_name)
-        rel_path = output_path.relative_to(BASE_DIR)
-
-        print(
-            f"[INFO] 모델 {model_id} ({brand} {model_name}) "
-            f"워드클라우드 생성 → {rel_path}"
-        )
+        rel_paths[model_id] = output_path.relative_to(BASE_DIR)
 
-        generate_wordcloud_image(
-            tokens=tokens,
-            output_path=output_path,
-            font_path=args.font_path,
-            width=args.width,
-            height=args.height,
-            max_words=args.max_words,
+        tasks.append(
+            (model_id, tokens, str(output_path), font_path, args.width, args.height, args.max_words)
         )
 
-        upsert_blog_wordcloud(
-            model_id=model_id,
-            month=month,
-            image_path=str(rel_path),
+    workers = max(1, args.workers)
+    print(f"[INFO] 워드클라우드 {len(tasks)}개 생성 (workers={workers})")
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = map(render_wordcloud_task, tasks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(render_wordcloud_task, tasks)
+
+    rows: List[Dict[str, Any]] = []
+    timings: List[float] = []
+    try:
+        for model_id, seconds, error in results:
+            brand, model_name = model_names.get(model_id, (None, None))
+            if error is not None:
+                print(f"[WARN] 모델 {model_id} ({brand} {model_name}) 워드클라우드 실패: {error}")
+                continue
+
+            timings.append(seconds)
+            print(
+                f"[INFO] 모델 {model_id} ({brand} {model_name}) "
+                f"워드클라우드 생성 → {rel_paths[model_id]} ({seconds:.2f}s)"
+            )
+            rows.append(
+                {
+                    "model_id": model_id,
+                    "month": month,
+                    "image_path": str(rel_paths[model_id]),
+                    "token_fingerprint": fingerprints[model_id],
+                }
+            )
+    finally:
+        if workers > 1:
+            pool.shutdown()
+    elapsed = time.perf_counter() - started
+
+    upsert_blog_wordclouds(rows)
+
+    print("\n[SUMMARY] 워드클라우드 생성 결과")
+    print(f"  images: {len(rows)}/{len(tasks)} (변경 없음 스킵 {skipped})")
+    if timings:
+        print(
+            f"  per_image: 평균 {sum(timings) / len(timings):.2f}s, "
+            f"최대 {max(timings):.2f}s, 합계 {sum(timings):.1f}s"
         )
-
+    print(f"  wall_time: {elapsed:.1f}s (workers={workers})")
     print("[INFO] 워드클라우드 생성/저장/DB upsert 완료")
 
 
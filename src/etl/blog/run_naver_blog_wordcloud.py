@@ -5,29 +5,140 @@ from __future__ import annotations
 import argparse
 import collections
 import datetime
-import os
 import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any
 
-import requests
-from bs4 import BeautifulSoup
-from kiwipiepy import Kiwi
 from sqlalchemy import text
 
+from src.db.article_body import compress_body
 from src.db.connection import get_engine
+from src.etl.blog.blog_fetcher import (
+    DEFAULT_HOST_INTERVAL_SEC,
+    DEFAULT_MAX_PER_HOST,
+    BlogFetcher,
+)
+from src.etl.blog.blog_search import BlogSearchPlan, search_naver_blogs_via_api
+from src.etl.blog.blog_token_cache import BlogTokenCache
+from src.etl.blog.blog_tokenizer import (
+    DEFAULT_NUM_WORKERS,
+    count_tokens_by_key,
+    get_kiwi,
+    iter_nouns,
+    sort_token_counts,
+)
 
 BASE_DIR = Path(__file__).resolve().parents[3]
 
 
+# 블로그 글 upsert (url UNIQUE 기준, url 은 blog_search.canonicalize_url 로 정규화된 값)
+ARTICLE_UPSERT_SQL = text(
+    """
+    INSERT INTO blog_article (
+        model_id,
+        month,
+        search_keyword,
+        search_rank,
+        title,
+        url,
+        summary,
+        posted_at
+    )
+    VALUES (
+        :model_id,
+        :month,
+        :search_keyword,
+        :search_rank,
+        :title,
+        :url,
+        :summary,
+        :posted_at
+    )
+    ON DUPLICATE KEY UPDATE
+        summary       = VALUES(summary),
+        posted_at     = VALUES(posted_at),
+        collected_at  = CURRENT_TIMESTAMP
+    """
+)
+
+# 본문 upsert (압축해서 blog_article_body 에 따로 저장 → 목록 조회는 본문을 읽지 않는다)
+BODY_UPSERT_SQL = text(
+    """
+    INSERT INTO blog_article_body (
+        article_id,
+        content_z,
+        content_bytes
+    )
+    SELECT
+        article_id,
+        :content_z,
+        :content_bytes
+    FROM blog_article
+    WHERE url = :url
+    ON DUPLICATE KEY UPDATE
+        content_z     = VALUES(content_z),
+        content_bytes = VALUES(content_bytes)
+    """
+)
+
+# 모델 ↔ 글 매핑 upsert (같은 글이 여러 모델 검색 결과에 나올 수 있다)
+LINK_UPSERT_SQL = text(
+    """
+    INSERT INTO blog_article_model (
+        article_id,
+        model_id,
+        month,
+        search_keyword,
+        search_rank
+    )
+    SELECT
+        article_id,
+        :model_id,
+        :month,
+        :search_keyword,
+        :search_rank
+    FROM blog_article
+    WHERE url = :url
+    ON DUPLICATE KEY UPDATE
+        search_keyword = VALUES(search_keyword),
+        search_rank    = VALUES(search_rank)
+    """
+)
+
+# 토큰 upsert (UNIQUE KEY (model_id, month, token) 기준)
+TOKEN_UPSERT_SQL = text(
+    """
+    INSERT INTO blog_token_monthly (
+        model_id,
+        month,
+        token,
+        total_count,
+        token_rank,
+        created_at
+    )
+    VALUES (
+        :model_id,
+        :month,
+        :token,
+        :total_count,
+        :rank,
+        NOW()
+    )
+    ON DUPLICATE KEY UPDATE
+        total_count = VALUES(total_count),
+        token_rank = VALUES(token_rank)
+    """
+)
+
+
 # -----------------------------
-# DB 유틸
+# DB 유틸 (호출하는 쪽에서 연결 하나를 만들어 넘긴다)
 # -----------------------------
-def get_models_for_blog_target(limit: int | None = None) -> List[Dict[str, Any]]:
+def get_models_for_blog_target(conn, limit: int | None = None) -> List[Dict[str, Any]]:
     """
     워드클라우드/블로그 수집 대상 car_model 목록을 가져온다.
     """
-    engine = get_engine(echo=False)
     sql = text(
         """
         SELECT model_id, brand_name, model_name_kr
@@ -35,8 +146,7 @@ def get_models_for_blog_target(limit: int | None = None) -> List[Dict[str, Any]]
         ORDER BY brand_name, model_name_kr
         """
     )
-    with engine.connect() as conn:
-        rows = conn.execute(sql).mappings().all()
+    rows = conn.execute(sql).mappings().all()
 
     if limit is not None:
         rows = rows[:limit]
@@ -44,268 +154,101 @@ def get_models_for_blog_target(limit: int | None = None) -> List[Dict[str, Any]]
     return rows
 
 
-def has_tokens_for_month(model_id: int, month: datetime.date) -> bool:
+def fetch_processed_model_ids(conn, month: datetime.date) -> Set[int]:
     """
-    이미 해당 model_id + month에 blog_token_monthly 데이터가 있는지 확인.
-    있으면 이번 수집은 스킵.
+    해당 month 에 blog_token_monthly 데이터가 이미 있는 model_id 집합 (쿼리 1번).
+    여기 있는 모델은 이번 수집에서 스킵.
     """
-    engine = get_engine(echo=False)
     sql = text(
         """
-        SELECT 1
+        SELECT DISTINCT model_id
         FROM blog_token_monthly
-        WHERE model_id = :model_id
-          AND month = :month
-        LIMIT 1
+        WHERE month = :month
         """
     )
-    with engine.connect() as conn:
-        row = conn.execute(sql, {"model_id": model_id, "month": month}).first()
-    return row is not None
+    return {row[0] for row in conn.execute(sql, {"month": month})}
 
 
-def insert_tokens(
+def build_token_rows(
     model_id: int,
     month: datetime.date,
     token_counts: List[Tuple[str, int]],
     top_k: int = 50,
-) -> None:
+) -> List[Dict[str, Any]]:
     """
-    토큰/빈도 리스트를 blog_token_monthly에 upsert.
-    DDL:
-      - token_rank 컬럼 사용
-      - UNIQUE KEY (model_id, month, token) 기준으로 ON DUPLICATE KEY UPDATE
+    정렬된 토큰/빈도 리스트 → blog_token_monthly 행 (상위 top_k 개, token_rank 1부터)
     """
-    engine = get_engine(echo=False)
-    sql = text(
-        """
-        INSERT INTO blog_token_monthly (
-            model_id,
-            month,
-            token,
-            total_count,
-            token_rank,
-            created_at
-        )
-        VALUES (
-            :model_id,
-            :month,
-            :token,
-            :total_count,
-            :rank,
-            NOW()
-        )
-        ON DUPLICATE KEY UPDATE
-            total_count = VALUES(total_count),
-            token_rank = VALUES(token_rank)
-        """
-    )
-
-    with engine.begin() as conn:
-        for rank, (token, count) in enumerate(token_counts[:top_k], start=1):
-            conn.execute(
-                sql,
-                {
-                    "model_id": model_id,
-                    "month": month,
-                    "token": token,
-                    "total_count": count,
-                    "rank": rank,
-                },
-            )
-
-
-def insert_blog_article(
-    model_id: int,
-    month: datetime.date,
-    search_keyword: str,
-    search_rank: int,
-    title: str,
-    url: str,
-    summary: str,
-    content_plain: str,
-    posted_at: datetime.datetime | None = None,
+    return [
+        {
+            "model_id": model_id,
+            "month": month,
+            "token": token,
+            "total_count": count,
+            "rank": rank,
+        }
+        for rank, (token, count) in enumerate(token_counts[:top_k], start=1)
+    ]
+
+
+def save_model_blog(
+    conn,
+    article_rows: List[Dict[str, Any]],
+    body_rows: List[Dict[str, Any]],
+    link_rows: List[Dict[str, Any]],
+    token_rows: List[Dict[str, Any]],
 ) -> None:
     """
-    블로그 글을 blog_article에 저장.
+    모델 하나의 블로그 글 + 본문 + 모델↔글 매핑 + 토큰을 한 트랜잭션으로 저장.
+    글/토큰은 executemany 한 번씩 (pymysql 이 multi-row INSERT ... ON DUPLICATE KEY UPDATE 로 묶어서 보낸다)
+
+    article_rows: 이번 실행에서 아직 저장되지 않은 글만 (다른 모델이 먼저 저장한 글은 매핑만 추가)
     - month: 기준 월 (워드클라우드 기준 월, ex) 2025-11-01)
     - search_keyword: 네이버 API에 사용한 검색어 (예: 'EV3 후기')
     - search_rank: 검색 결과 내 순위 (1, 2, 3)
     - summary: 내용 요약 (앞 N자)
-    - content_plain: 전체 본문 텍스트
     - posted_at: 원문 게시일 (모르면 NULL)
+    body_rows: {"url", "content_z"(compress_body 결과), "content_bytes"(원문 UTF-8 바이트 수)}
+    link_rows: {"url", "model_id", "month", "search_keyword", "search_rank"}
     """
-    engine = get_engine(echo=False)
-    sql = text(
-        """
-        INSERT INTO blog_article (
-            model_id,
-            month,
-            search_keyword,
-            search_rank,
-            title,
-            url,
-            summary,
-            content_plain,
-            posted_at
-        )
-        VALUES (
-            :model_id,
-            :month,
-            :search_keyword,
-            :search_rank,
-            :title,
-            :url,
-            :summary,
-            :content_plain,
-            :posted_at
-        )
-        ON DUPLICATE KEY UPDATE
-            summary       = VALUES(summary),
-            content_plain = VALUES(content_plain),
-            posted_at     = VALUES(posted_at),
-            collected_at  = CURRENT_TIMESTAMP
-        """
-    )
-    with engine.begin() as conn:
-        conn.execute(
-            sql,
-            {
-                "model_id": model_id,
-                "month": month,
-                "search_keyword": search_keyword,
-                "search_rank": search_rank,
-                "title": title,
-                "url": url,
-                "summary": summary,
-                "content_plain": content_plain,
-                "posted_at": posted_at,
-            },
-        )
-
-
-# -----------------------------
-# 블로그 본문 크롤링 (requests 기반)
-# -----------------------------
-def _fetch_html(url: str) -> str:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
-    }
-    resp = requests.get(url, headers=headers, timeout=10)
-    resp.raise_for_status()
-    return resp.text
-
-
-def extract_blog_text(url: str) -> str:
-    """
-    네이버 블로그(및 외부 블로그)의 본문 텍스트를 추출한다.
-
-    1차: 직접 HTML에서 본문 영역 찾기
-    2차: iframe#mainFrame 이 있으면 그 src를 다시 요청해서 본문 찾기
-    3차: 그래도 안 되면 전체 텍스트
-    """
-    try:
-        html = _fetch_html(url)
-    except Exception as e:
-        print(f"    [WARN] 1차 fetch 실패: {e}")
-        return ""
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    # 1) 최신 스마트에디터 3.0 구조
-    container = soup.select_one("div.se-main-container")
-    if container:
-        return container.get_text(separator="\n")
-
-    # 2) 구형 블로그 에디터 구조
-    legacy = soup.select_one("div#content")
-    if legacy:
-        return legacy.get_text(separator="\n")
-
-    # 3) iframe 구조 (구버전 blog.naver.com)
-    iframe = soup.select_one("iframe#mainFrame")
-    if iframe and iframe.has_attr("src"):
-        from urllib.parse import urljoin
-
-        iframe_src = iframe["src"]
-        iframe_url = urljoin("https://blog.naver.com", iframe_src)
-
-        try:
-            inner_html = _fetch_html(iframe_url)
-        except Exception as e:
-            print(f"    [WARN] iframe fetch 실패: {e}")
-            return ""
-
-        inner = BeautifulSoup(inner_html, "html.parser")
-
-        for selector in [
-            "div.se-main-container",
-            "div#postViewArea",
-            "div#contentArea",
-        ]:
-            area = inner.select_one(selector)
-            if area:
-                return area.get_text(separator="\n")
-
-        return inner.get_text(separator="\n")
-
-    # 4) 그 외의 경우: 전체 텍스트 fallback
-    return soup.get_text(separator="\n")
+    with conn.begin():
+        if article_rows:
+            conn.execute(ARTICLE_UPSERT_SQL, article_rows)
+        if body_rows:
+            conn.execute(BODY_UPSERT_SQL, body_rows)
+        if link_rows:
+            conn.execute(LINK_UPSERT_SQL, link_rows)
+        if token_rows:
+            conn.execute(TOKEN_UPSERT_SQL, token_rows)
 
 
 # -----------------------------
 # Kiwi 기반 명사 추출
 # -----------------------------
-kiwi = Kiwi()
-
-
 def tokenize_text(text: str) -> List[str]:
     """
-    한글 텍스트에서 명사류(N*) 토큰만 추출.
+    한글 텍스트에서 명사류(N*) 토큰만 추출. (글 하나 단위, 여러 글은 count_tokens_by_key 사용)
     """
-    results = kiwi.tokenize(text)
-    tokens: List[str] = []
+    return list(iter_nouns(get_kiwi().tokenize(text)))
 
-    for w in results:
-        if w.tag.startswith("N"):
-            form = w.form.strip()
-            if len(form) > 1 and not form.isdigit():
-                tokens.append(form)
-    return tokens
 
-
-def build_token_counts_from_articles(texts: List[str]) -> List[Tuple[str, int]]:
+def build_token_counts_from_articles(
+    texts: List[str],
+    num_workers: int = DEFAULT_NUM_WORKERS,
+    cache: Optional[BlogTokenCache] = None,
+) -> List[Tuple[str, int]]:
     """
     여러 블로그 본문 텍스트 리스트 → 토큰 빈도 리스트.
+    cache 가 있으면 캐시된 본문 빈도를 합치고 처음 보는 본문만 형태소 분석한다.
     """
-    all_tokens: List[str] = []
-    for t in texts:
-        all_tokens.extend(tokenize_text(t))
-
-    counter = collections.Counter(all_tokens)
-    sorted_items = sorted(counter.items(), key=lambda x: (-x[1], x[0]))
-    return sorted_items
+    counters = count_tokens_by_key(
+        ((0, t) for t in texts), num_workers=num_workers, cache=cache
+    )
+    return sort_token_counts(counters.get(0, collections.Counter()))
 
 
 # -----------------------------
 # 네이버 블로그 검색 API
 # -----------------------------
-def get_naver_credentials() -> Tuple[str, str]:
-    client_id = os.getenv("NAVER_CLIENT_ID")
-    client_secret = os.getenv("NAVER_CLIENT_SECRET")
-
-    if not client_id or not client_secret:
-        raise RuntimeError(
-            "NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경 변수가 없습니다."
-        )
-
-    return client_id, client_secret
-
-
 def build_search_query(brand_name: str, model_name: str) -> str:
     """
     모델별 검색어 생성 규칙.
@@ -314,46 +257,183 @@ def build_search_query(brand_name: str, model_name: str) -> str:
     return f"{model_name} 후기"
 
 
-def search_naver_blogs_via_api(
-    query: str,
-    max_results: int = 3,
-    sort: str = "sim",
-) -> List[Dict[str, str]]:
-    client_id, client_secret = get_naver_credentials()
-
-    url = "https://openapi.naver.com/v1/search/blog.json"
-    params = {
-        "query": query,
-        "display": max_results,
-        "start": 1,
-        "sort": sort,
-    }
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret,
-    }
-
-    resp = requests.get(url, headers=headers, params=params, timeout=5)
-
-    if resp.status_code != 200:
-        print(
-            f"[WARN] 네이버 블로그 검색 API 실패: query={query}, status={resp.status_code}"
-        )
-        return []
+# -----------------------------
+# 모델 batch 단위 수집/저장
+# -----------------------------
+def search_model_batch(
+    batch: List[Dict[str, Any]],
+    plan: BlogSearchPlan,
+    fetcher: BlogFetcher,
+    args: argparse.Namespace,
+    stats: collections.Counter,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Future]]:
+    """
+    batch 의 모델별 검색 → URL 정규화 + 실행 전체 중복 제거 → 처음 나온 글만 본문 수집을 스레드 풀에 넣는다.
+    검색이 실패한 모델은 경고만 찍고 건너뛴다 (연결 오류, 재시도 초과, JSON 아닌 응답 등).
+    반환: (검색 결과가 있는 모델 목록, URL → 본문 Future)
+    """
+    searched: List[Dict[str, Any]] = []
+    futures: Dict[str, Future] = {}
+    for m in batch:
+        brand = m["brand_name"]
+        model_name = m["model_name_kr"]
 
-    data = resp.json()
-    items = data.get("items", [])
+        query = build_search_query(brand, model_name)
+        print(f"[INFO] 검색 시작: query='{query}'")
 
-    results: List[Dict[str, str]] = []
-    for item in items[:max_results]:
-        # title 안의 HTML 태그 제거
-        soup_title = BeautifulSoup(item.get("title", ""), "html.parser")
-        title = soup_title.get_text(" ", strip=True)
-        link = item.get("link", "").strip()
-        if link:
-            results.append({"title": title, "url": link})
+        try:
+            articles = search_naver_blogs_via_api(
+                query,
+                max_results=args.max_articles,
+                sort="sim",
+                fetcher=fetcher,
+                max_pages=args.search_pages,
+            )
+        except Exception as e:
+            print(f"[WARN] 검색 실패, 스킵: {brand} {model_name}, error={e}")
+            stats["search_failed"] += 1
+            continue
+
+        if not articles:
+            print(f"[WARN] 검색 결과 없음: {brand} {model_name}")
+            continue
+
+        searched.append(m)
+        new_urls = plan.add(m["model_id"], query, articles)
+        for url in new_urls:
+            futures[url] = fetcher.submit(url)
+        if len(new_urls) < len(articles):
+            print(f"  [INFO] 다른 모델과 겹치는 글 {len(articles) - len(new_urls)}개 (본문은 한 번만 수집)")
+    return searched, futures
+
+
+def finish_model_batch(
+    conn,
+    batch: List[Dict[str, Any]],
+    futures: Dict[str, Future],
+    plan: BlogSearchPlan,
+    texts: Dict[str, str],
+    month: datetime.date,
+    args: argparse.Namespace,
+    token_cache: Optional[BlogTokenCache],
+    saved_urls: Set[str],
+    stats: collections.Counter,
+    timings: collections.Counter,
+) -> None:
+    """
+    batch 의 본문 결과를 받아서 Kiwi 배치 API 로 한 번에 토큰화하고,
+    모델별로 글 + 본문 + 매핑 + 토큰을 한 트랜잭션에 저장한다.
+
+    - 본문은 texts(URL → 본문)에 모아 두고 이후 batch 에서 같은 글이 나오면 다시 쓴다.
+    - 토큰이 없는 모델은 저장하지 않는다 (blog_token_monthly 에 없어야 다음 실행에서 다시 수집).
+    - blog_article 행은 그 글을 처음 저장하는 모델이 쓴다 (saved_urls).
+      먼저 찾은 모델이 건너뛰어졌어도 매핑의 article_id 가 항상 있다.
+    - 저장 실패는 그 모델만 롤백하고 다음 모델로 넘어간다.
+    """
+    # 1) 글마다 본문 결과를 받는다 (URL 당 한 번)
+    for url, fut in futures.items():
+        a = plan.articles[url]
+        try:
+            print(f"  [INFO] 텍스트 수집: {a['title']} ({url})")
+            text_body = fut.result()
+            if text_body.strip():
+                texts[url] = text_body
+                stats["texts"] += 1
+        except Exception as e:
+            print(f"  [WARN] 본문 크롤링 실패: {e}")
+
+    # 2) batch 본문 전체를 한 번에 토큰화 → 모델별 Counter
+    #    (본문 SHA-1 토큰 캐시에 있는 글은 분석하지 않고 저장된 빈도를 쓴다)
+    docs: List[Tuple[int, str]] = [
+        (m["model_id"], texts[url])
+        for m in batch
+        for url, _, _ in plan.links[m["model_id"]]
+        if url in texts
+    ]
+    tokenize_started = time.perf_counter()
+    counters = count_tokens_by_key(docs, num_workers=args.tokenize_workers, cache=token_cache)
+    tokenize_elapsed = time.perf_counter() - tokenize_started
+    timings["tokenize"] += tokenize_elapsed
+    print(
+        f"[INFO] 토큰화 완료: 모델 {len(batch)}개, 글 {len(docs)}개, {tokenize_elapsed:.1f}s "
+        f"(num_workers={args.tokenize_workers})"
+    )
+
+    # 3) 모델별 저장 (연결 하나 재사용)
+    db_started = time.perf_counter()
+    for m in batch:
+        model_id = m["model_id"]
+        brand = m["brand_name"]
+        model_name = m["model_name_kr"]
 
-    return results
+        links = [(url, query, rank) for url, query, rank in plan.links[model_id] if url in texts]
+        if not links:
+            print(f"[WARN] 본문 없음: {brand} {model_name}")
+            continue
+
+        token_counts = sort_token_counts(counters.get(model_id, collections.Counter()))
+        if not token_counts:
+            print(f"[WARN] 토큰 없음, 저장 스킵: {brand} {model_name}")
+            stats["no_tokens"] += 1
+            continue
+
+        article_rows: List[Dict[str, Any]] = []
+        body_rows: List[Dict[str, Any]] = []
+        link_rows: List[Dict[str, Any]] = []
+        for url, query, rank in links:
+            text_body = texts[url]
+            if url not in saved_urls:
+                article_rows.append(
+                    {
+                        "model_id": model_id,
+                        "month": month,  # today.replace(day=1)로 만든 기준 월
+                        "search_keyword": query,  # build_search_query에서 만든 검색어
+                        "search_rank": rank,  # 1, 2, 3
+                        "title": plan.articles[url]["title"],
+                        "url": url,
+                        "summary": text_body[: args.summary_length],
+                        "posted_at": None,  # 나중에 필요하면 파싱
+                    }
+                )
+                body_rows.append(
+                    {
+                        "url": url,
+                        "content_z": compress_body(text_body),
+                        "content_bytes": len(text_body.encode("utf-8")),
+                    }
+                )
+            link_rows.append(
+                {
+                    "url": url,
+                    "model_id": model_id,
+                    "month": month,
+                    "search_keyword": query,
+                    "search_rank": rank,
+                }
+            )
+
+        try:
+            save_model_blog(
+                conn,
+                article_rows,
+                body_rows,
+                link_rows,
+                build_token_rows(model_id, month, token_counts),
+            )
+        except Exception as e:
+            print(f"[WARN] 저장 실패, 스킵: {brand} {model_name}, error={e}")
+            stats["save_failed"] += 1
+            continue
+
+        saved_urls.update(r["url"] for r in article_rows)
+        stats["saved"] += 1
+        stats["raw_bytes"] += sum(r["content_bytes"] for r in body_rows)
+        stats["z_bytes"] += sum(len(r["content_z"]) for r in body_rows)
+        print(
+            f"[INFO] 저장 완료 → {brand} {model_name}, "
+            f"토큰 수={len(token_counts)}, 글 수={len(link_rows)}"
+        )
+    timings["db"] += time.perf_counter() - db_started
 
 
 # -----------------------------
@@ -379,78 +459,154 @@ def main():
         default=500,
         help="blog_article.summary 에 저장할 글자 수 (기본 500자)",
     )
+    parser.add_argument(
+        "--search-pages",
+        type=int,
+        default=3,
+        help="중복 제거 후 글이 모자라면 이어서 요청할 검색 결과 페이지 수 (기본 3)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="본문 수집 스레드 수 (기본 16)",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_MAX_PER_HOST,
+        help=(
+            f"같은 호스트(blog.naver.com 등)로 동시에 보낼 최대 요청 수 (기본 {DEFAULT_MAX_PER_HOST}). "
+            "올리면 빨라지지만 차단될 수 있으니 필요할 때만 지정"
+        ),
+    )
+    parser.add_argument(
+        "--host-interval",
+        type=float,
+        default=DEFAULT_HOST_INTERVAL_SEC,
+        help=f"같은 호스트 요청 시작 사이 최소 간격(초, 기본 {DEFAULT_HOST_INTERVAL_SEC})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=10.0,
+        help="요청별 읽기 타임아웃(초, 기본 10)",
+    )
+    parser.add_argument(
+        "--extractor",
+        choices=["auto", "selectolax", "lxml", "bs4-strainer", "bs4"],
+        default="auto",
+        help="본문 HTML 추출기 (기본 auto = selectolax → lxml → bs4-strainer 중 설치된 것)",
+    )
+    parser.add_argument(
+        "--tokenize-workers",
+        type=int,
+        default=DEFAULT_NUM_WORKERS,
+        help="Kiwi 형태소 분석 스레드 수 (-1 = 모든 코어, 0 = 메인 스레드만, 기본 -1)",
+    )
+    parser.add_argument(
+        "--no-token-cache",
+        action="store_true",
+        help="본문 SHA-1 토큰 캐시(data/cache/blog_tokens)를 쓰지 않음",
+    )
+    parser.add_argument(
+        "--save-batch",
+        type=int,
+        default=10,
+        help="모델 몇 개마다 토큰화/DB 저장할지 (기본 10). 실패/중단해도 저장된 batch 는 남는다",
+    )
+    parser.add_argument(
+        "--refresh-token-cache",
+        action="store_true",
+        help="토큰 캐시를 읽지 않고 전부 다시 분석해서 덮어씀",
+    )
     args = parser.parse_args()
 
     today = datetime.date.today()
     month = today.replace(day=1)
     print(f"[INFO] 수집 기준 월 = {month}")
 
-    models = get_models_for_blog_target(limit=args.limit_models)
-    print(f"[INFO] 대상 모델 수: {len(models)}")
-
-    for m in models:
-        model_id = m["model_id"]
-        brand = m["brand_name"]
-        model_name = m["model_name_kr"]
-
-        if has_tokens_for_month(model_id, month):
-            print(f"[INFO] 스킵 (이미 수집됨) → {brand} {model_name}")
-            continue
-
-        query = build_search_query(brand, model_name)
-        print(f"[INFO] 검색 시작: query='{query}'")
+    engine = get_engine(echo=False)
+    with engine.connect() as conn:
+        models = get_models_for_blog_target(conn, limit=args.limit_models)
+        processed = fetch_processed_model_ids(conn, month)
+    print(f"[INFO] 대상 모델 수: {len(models)} (이번 달 수집 완료 {len(processed)})")
 
-        articles = search_naver_blogs_via_api(
-            query,
-            max_results=args.max_articles,
-            sort="sim",
-        )
-        if not articles:
-            print(f"[WARN] 검색 결과 없음: {brand} {model_name}")
-            continue
+    started = time.perf_counter()
+    stats = collections.Counter()
+    timings = collections.Counter()
+    saved_urls: Set[str] = set()
 
-        texts: List[str] = []
-        for idx, a in enumerate(articles, start=1):
-            try:
-                print(f"  [INFO] 텍스트 수집: {a['title']} ({a['url']})")
-                text_body = extract_blog_text(a["url"])
-                if text_body.strip():
-                    summary = text_body[: args.summary_length]
-
-                    insert_blog_article(
-                        model_id=model_id,
-                        month=month,  # 위에서 today.replace(day=1)로 만든 기준 월
-                        search_keyword=query,  # build_search_query에서 만든 검색어
-                        search_rank=idx,  # 1, 2, 3
-                        title=a["title"],
-                        url=a["url"],
-                        summary=summary,
-                        content_plain=text_body,
-                        posted_at=None,  # 나중에 필요하면 파싱
+    token_cache = None if args.no_token_cache else BlogTokenCache(refresh=args.refresh_token_cache)
+    try:
+        with BlogFetcher(
+            max_workers=args.workers,
+            max_per_host=args.per_host,
+            host_interval_sec=args.host_interval,
+            timeout=(3.05, args.timeout),
+            extractor=args.extractor,
+        ) as fetcher, engine.connect() as conn:
+            print(f"[INFO] 본문 추출기: {fetcher.extractor.name}")
+            plan = BlogSearchPlan()
+            texts: Dict[str, str] = {}
+            targets: List[Dict[str, Any]] = []
+            for m in models:
+                if m["model_id"] in processed:
+                    print(f"[INFO] 스킵 (이미 수집됨) → {m['brand_name']} {m['model_name_kr']}")
+                else:
+                    targets.append(m)
+            save_batch = max(1, args.save_batch)
+
+            # 모델을 save_batch 개씩 나눠서
+            #   batch i 검색 → (그동안 batch i 본문은 스레드 풀에서 수집) → batch i-1 토큰화/저장
+            # 중간에 실패하거나 끊겨도 저장이 끝난 batch 는 남고, 다음 실행에서 이어서 수집한다.
+            pending: Optional[List[Dict[str, Any]]] = None
+            pending_futures: Dict[str, Future] = {}
+            for i in range(0, len(targets), save_batch):
+                batch = targets[i : i + save_batch]
+                searched, futures = search_model_batch(batch, plan, fetcher, args, stats)
+                stats["searched"] += len(searched)
+                if pending is not None:
+                    finish_model_batch(
+                        conn, pending, pending_futures, plan, texts, month, args,
+                        token_cache, saved_urls, stats, timings,
                     )
-
-                    texts.append(text_body)
-                time.sleep(0.8)
-            except Exception as e:
-                print(f"  [WARN] 본문 크롤링 실패: {e}")
-
-        if not texts:
-            print(f"[WARN] 본문 없음: {brand} {model_name}")
-            continue
-
-        token_counts = build_token_counts_from_articles(texts)
-        if not token_counts:
-            print(f"[WARN] 토큰 없음: {brand} {model_name}")
-            continue
-
-        insert_tokens(model_id, month, token_counts)
+                pending, pending_futures = searched, futures
+            if pending is not None:
+                finish_model_batch(
+                    conn, pending, pending_futures, plan, texts, month, args,
+                    token_cache, saved_urls, stats, timings,
+                )
+
+            request_count = fetcher.request_count
+    finally:
+        if token_cache is not None:
+            token_cache.close()
+
+    search_stats = plan.stats()
+    print(
+        f"[INFO] 검색 결과: 모델 {search_stats['models']}개, 매핑 {search_stats['links']}건, "
+        f"고유 글 {search_stats['unique_articles']}개 (여러 모델 공유 {search_stats['shared_articles']}개), "
+        f"본문 수집 {stats['texts']}개"
+    )
+    if stats["raw_bytes"]:
         print(
-            f"[INFO] 저장 완료 → {brand} {model_name}, "
-            f"토큰 수={len(token_counts)}, 글 수={len(texts)}"
+            f"[INFO] 본문 압축: {stats['raw_bytes'] / 1024:,.0f} KB → {stats['z_bytes'] / 1024:,.0f} KB "
+            f"({stats['z_bytes'] / stats['raw_bytes']:.0%})"
+        )
+    if token_cache is not None:
+        print(
+            f"[INFO] 토큰 캐시: hit={token_cache.hits}, miss={token_cache.misses}, "
+            f"hit rate={token_cache.hit_rate():.1%}"
         )
 
-        time.sleep(1.5)
-
+    elapsed = time.perf_counter() - started
+    print(
+        f"[INFO] 블로그 수집 완료: 저장 모델 {stats['saved']}/{stats['searched']}개 "
+        f"(검색 실패 {stats['search_failed']}, 토큰 없음 {stats['no_tokens']}, 저장 실패 {stats['save_failed']}), "
+        f"HTTP 요청 {request_count}회, {elapsed:.1f}s "
+        f"(토큰화 {timings['tokenize']:.1f}s, DB {timings['db']:.1f}s)"
+    )
 
 if __name__ == "__main__":
     main()
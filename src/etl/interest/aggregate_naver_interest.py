@@ -3,121 +3,159 @@
 from __future__ import annotations
 
 import argparse
-from typing import List, Dict, Any
+import csv
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from sqlalchemy import text
 
 from src.db.connection import get_engine
 
 
-def fetch_aggregated_naver_index() -> List[Dict[str, Any]]:
-    """
-    model_monthly_interest_detail 에서
-    (model_id, month) 단위로 평균 ratio 를 집계해온다.
-    """
-    engine = get_engine(echo=False)
-
-    sql = text(
-        """
-        SELECT
-            model_id,
-            month,
-            AVG(ratio) AS naver_index
-        FROM model_monthly_interest_detail
-        GROUP BY model_id, month
-        ORDER BY month, model_id
-        """
-    )
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+NAVER_DIR = BASE_DIR / "data" / "raw" / "naver"
 
-    with engine.connect() as conn:
-        rows = conn.execute(sql).mappings().all()
 
-    return [
-        {
-            "model_id": row["model_id"],
-            "month": row["month"],
-            "naver_index": (
-                float(row["naver_index"]) if row["naver_index"] is not None else None
-            ),
-        }
-        for row in rows
-    ]
+def _in_clause(column: str, prefix: str, values: Sequence) -> Tuple[str, Dict[str, object]]:
+    placeholders = ", ".join([f":{prefix}{i}" for i in range(len(values))])
+    params = {f"{prefix}{i}": v for i, v in enumerate(values)}
+    return f"{column} IN ({placeholders})", params
 
 
-def upsert_model_monthly_interest(aggregated: List[Dict[str, Any]]) -> None:
+def aggregate_naver_interest(
+    conn,
+    months: Optional[Sequence[str]] = None,
+    model_ids: Optional[Sequence[int]] = None,
+) -> int:
     """
-    집계된 네이버 관심도(aggregated)를
-    model_monthly_interest 테이블에 upsert 한다.
+    model_monthly_interest_detail 의 (model_id, month) 평균 ratio (연령대 필터 없는 행, age_group = '') 를
+    DB 안에서 바로 model_monthly_interest.naver_search_index 로 upsert 한다.
+    (INSERT ... SELECT ... GROUP BY ... ON DUPLICATE KEY UPDATE 한 문장)
+
+    months / model_ids 를 주면 해당 범위만 다시 집계한다.
+    반환: 영향받은 행 수 (MySQL 기준 insert=1, update=2)
 
     - DB 컬럼명:
         naver_search_index       ← 네이버 검색 지수
-        google_trend_index       ← (미사용, NULL 유지)
-        danawa_pop_rank          ← (미사용, NULL 유지)
-        danawa_pop_rank_size     ← (미사용, NULL 유지)
+        google_trend_index       ← (미사용, 기존 값 유지)
+        danawa_pop_rank          ← (미사용, 기존 값 유지)
+        danawa_pop_rank_size     ← (미사용, 기존 값 유지)
     """
-    if not aggregated:
-        print("[WARN] 집계된 데이터가 없습니다. detail 테이블을 확인하세요.")
-        return
+    # 연령대별 행(run_naver_age_crawl)은 다른 기준으로 스케일된 값이라 제외 (연령 필터 없음 = '')
+    conditions: List[str] = ["age_group = ''"]
+    params: Dict[str, object] = {}
 
-    engine = get_engine(echo=False)
+    if months:
+        cond, p = _in_clause("month", "mo", list(months))
+        conditions.append(cond)
+        params.update(p)
+    if model_ids:
+        cond, p = _in_clause("model_id", "md", list(model_ids))
+        conditions.append(cond)
+        params.update(p)
+
+    where = f"WHERE {' AND '.join(conditions)}"
 
     sql = text(
-        """
+        f"""
         INSERT INTO model_monthly_interest (
             model_id,
             month,
             naver_search_index,
-            google_trend_index,
-            danawa_pop_rank,
-            danawa_pop_rank_size,
             created_at
         )
-        VALUES (
-            :model_id,
-            :month,
-            :naver_search_index,
-            NULL,
-            NULL,
-            NULL,
+        SELECT
+            model_id,
+            month,
+            AVG(ratio) AS naver_search_index,
             NOW()
-        )
+        FROM model_monthly_interest_detail
+        {where}
+        GROUP BY model_id, month
+        HAVING AVG(ratio) IS NOT NULL
         ON DUPLICATE KEY UPDATE
             naver_search_index = VALUES(naver_search_index)
         """
     )
 
-    with engine.begin() as conn:
-        for row in aggregated:
-            if row["naver_index"] is None:
-                continue
+    result = conn.execute(sql, params)
+    return result.rowcount
 
-            conn.execute(
-                sql,
-                {
-                    "model_id": row["model_id"],
-                    "month": row["month"],
-                    "naver_search_index": row["naver_index"],
-                },
-            )
 
-    print(f"[INFO] model_monthly_interest upsert 완료 (rows={len(aggregated)})")
+def touched_scope(run_id: str) -> Tuple[List[str], List[int]]:
+    """
+    run_id 의 detail 정규화 CSV 에 들어 있던 (월 목록, model_id 목록).
+    = 해당 run 의 detail 적재로 바뀐 범위
+    """
+    csv_path = NAVER_DIR / run_id / f"naver_trend_{run_id}_detail_normalized.csv"
+    if not csv_path.exists():
+        raise FileNotFoundError(f"정규화된 detail CSV가 없습니다: {csv_path}")
+
+    months: Set[str] = set()
+    model_ids: Set[int] = set()
+    with csv_path.open("r", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            months.add(row["month"])
+            model_ids.add(int(row["model_id"]))
+    return sorted(months), sorted(model_ids)
+
+
+def run_aggregate(
+    months: Optional[Sequence[str]] = None,
+    model_ids: Optional[Sequence[int]] = None,
+) -> None:
+    scope = "전체"
+    if months or model_ids:
+        scope = f"months={len(months or [])}개, models={len(model_ids or [])}개"
+    print(f"[INFO] 네이버 detail → model_monthly_interest 집계 시작 (범위: {scope})")
+
+    engine = get_engine(echo=False)
 
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        affected = aggregate_naver_interest(conn, months=months, model_ids=model_ids)
+    elapsed = time.perf_counter() - started
 
-def run_aggregate() -> None:
-    print("[INFO] 네이버 detail → model_monthly_interest 집계 시작")
-    aggregated = fetch_aggregated_naver_index()
-    print(f"[INFO] 집계된 (model_id, month) 개수: {len(aggregated)}")
-    upsert_model_monthly_interest(aggregated)
-    print("[INFO] 네이버 관심도 집계 완료")
+    print(f"[INFO] model_monthly_interest upsert 완료 (affected_rows={affected})")
+    print(f"[INFO] 네이버 관심도 집계 완료: {elapsed:.3f}s")
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="model_monthly_interest_detail → model_monthly_interest (naver_search_index 집계)"
     )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="해당 run 의 detail CSV 에 포함된 월/모델만 다시 집계 (예: 25_11_16)",
+    )
+    parser.add_argument(
+        "--months",
+        nargs="+",
+        default=None,
+        help="다시 집계할 월 목록 (YYYY-MM-01)",
+    )
+    parser.add_argument(
+        "--model-ids",
+        nargs="+",
+        type=int,
+        default=None,
+        help="다시 집계할 model_id 목록",
+    )
     args = parser.parse_args()
 
-    run_aggregate()
+    months = args.months
+    model_ids = args.model_ids
+    if args.run_id:
+        run_months, run_model_ids = touched_scope(args.run_id)
+        months = months or run_months
+        model_ids = model_ids or run_model_ids
+        if not months:
+            print(f"[WARN] detail CSV 가 비어 있어 집계할 범위가 없습니다: run_id={args.run_id}")
+            return
+
+    run_aggregate(months=months, model_ids=model_ids)
 
 
 if __name__ == "__main__":
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import argparse
 import csv
+import os
+import re
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 
 from src.db.connection import get_engine
 
@@ -15,71 +20,318 @@ from src.db.connection import get_engine
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
 NAVER_DIR = BASE_DIR / "data" / "raw" / "naver"
 
+DEFAULT_CHUNK_SIZE = 5000
 
-def load_detail(run_id: str):
+MONTH_RE = re.compile(r"^\d{4}-\d{2}-01$")
+VALID_DEVICES = {"pc", "mobile"}
+VALID_GENDERS = {"male", "female"}
+
+COLUMNS = ["model_id", "month", "device", "gender", "age_group", "ratio"]
+
+UPSERT_SQL = text(
+    """
+    INSERT INTO model_monthly_interest_detail (
+        model_id,
+        month,
+        device,
+        gender,
+        age_group,
+        ratio,
+        created_at
+    )
+    VALUES (
+        :model_id,
+        :month,
+        :device,
+        :gender,
+        :age_group,
+        :ratio,
+        NOW()
+    )
+    ON DUPLICATE KEY UPDATE
+        ratio = VALUES(ratio)
+    """
+)
+
+STAGE_TABLE = "tmp_interest_detail_stage"
+
+
+def detail_csv_path(run_id: str) -> Path:
+    return NAVER_DIR / run_id / f"naver_trend_{run_id}_detail_normalized.csv"
+
+
+def parse_detail_row(row: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    정규화 detail CSV 한 행 검증 + 타입 변환. 잘못된 행이면 None.
+    device / gender / age_group 의 "필터 없음" 은 NULL 이 아니라 빈 문자열로 쓴다.
+    (UNIQUE KEY 에 들어가는 컬럼이라 NULL 이면 ON DUPLICATE KEY UPDATE 가 매번 새 행을 만든다)
+    """
+    try:
+        model_id = int(row["model_id"])
+        ratio = float(row["ratio"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    month = (row.get("month") or "").strip()
+    device = (row.get("device") or "").strip()
+    gender = (row.get("gender") or "").strip()
+    age_group = (row.get("age_group") or "").strip()
+
+    if not MONTH_RE.match(month):
+        return None
+    if device and device not in VALID_DEVICES:
+        return None
+    if gender and gender not in VALID_GENDERS:
+        return None
+    if len(age_group) > 10:
+        return None
+
+    return {
+        "model_id": model_id,
+        "month": month,
+        "device": device,
+        "gender": gender,
+        "age_group": age_group,
+        "ratio": ratio,
+    }
+
+
+def read_detail_rows(csv_path: Path) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    반환: (검증 통과한 행 목록, 잘못된 행 수)
+    """
+    rows: List[Dict[str, Any]] = []
+    invalid = 0
+    with csv_path.open("r", encoding="utf-8-sig") as f:
+        for raw in csv.DictReader(f):
+            parsed = parse_detail_row(raw)
+            if parsed is None:
+                invalid += 1
+                continue
+            rows.append(parsed)
+    return rows, invalid
+
+
+def load_executemany(conn, rows: List[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    chunk_size 행씩 executemany 로 upsert.
+    (pymysql 은 INSERT ... VALUES ... ON DUPLICATE KEY UPDATE 를 multi-row INSERT 로 묶어서 보낸다)
+    """
+    for i in range(0, len(rows), chunk_size):
+        conn.execute(UPSERT_SQL, rows[i : i + chunk_size])
+    return len(rows)
+
+
+class StreamingDetailLoader:
+    """
+    정규화 행을 하나씩 받아 chunk_size 행마다 upsert + commit 하는 적재기.
+    (수집 → 정규화 → 적재를 한 번에 흘려보내는 스트리밍 모드용, 메모리는 chunk 하나만큼)
+
+    적재한 (월, model_id) 범위를 모아 두었다가 집계 범위로 쓴다.
+    """
+
+    def __init__(self, conn, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.conn = conn
+        self.chunk_size = max(1, chunk_size)
+        self._buffer: List[Dict[str, Any]] = []
+
+        self.months: Set[str] = set()
+        self.model_ids: Set[int] = set()
+        self.loaded_rows = 0
+        self.invalid_rows = 0
+
+    def add(self, row: Dict[str, Any]) -> None:
+        parsed = parse_detail_row(row)
+        if parsed is None:
+            self.invalid_rows += 1
+            return
+
+        self._buffer.append(parsed)
+        self.months.add(parsed["month"])
+        self.model_ids.add(parsed["model_id"])
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        self.conn.execute(UPSERT_SQL, self._buffer)
+        self.conn.commit()
+        self.loaded_rows += len(self._buffer)
+        self._buffer = []
+
+
+def _write_tsv(rows: List[Dict[str, Any]], path: Path) -> None:
+    # LOAD DATA 기본 형식: 탭 구분, NULL 은 \N
+    with path.open("w", encoding="utf-8", newline="") as f:
+        for r in rows:
+            f.write(
+                "\t".join("\\N" if r[c] is None else str(r[c]) for c in COLUMNS) + "\n"
+            )
+
+
+def load_via_infile(conn, rows: List[Dict[str, Any]]) -> int:
+    """
+    임시 TSV → LOAD DATA LOCAL INFILE 로 staging 임시 테이블에 적재한 뒤
+    INSERT ... SELECT ... ON DUPLICATE KEY UPDATE 로 한 번에 merge.
+    """
+    conn.execute(text(f"DROP TEMPORARY TABLE IF EXISTS {STAGE_TABLE}"))
+    conn.execute(
+        text(
+            f"""
+            CREATE TEMPORARY TABLE {STAGE_TABLE} (
+                model_id INT UNSIGNED NOT NULL,
+                month DATE NOT NULL,
+                device VARCHAR(10) NOT NULL DEFAULT '',
+                gender VARCHAR(10) NOT NULL DEFAULT '',
+                age_group VARCHAR(10) NOT NULL DEFAULT '',
+                ratio FLOAT NOT NULL
+            ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4
+            """
+        )
+    )
+
+    fd, tmp_name = tempfile.mkstemp(prefix="interest_detail_", suffix=".tsv")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        _write_tsv(rows, tmp_path)
+        conn.execute(
+            text(
+                f"""
+                LOAD DATA LOCAL INFILE :path
+                INTO TABLE {STAGE_TABLE}
+                CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY '\\t'
+                LINES TERMINATED BY '\\n'
+                ({", ".join(COLUMNS)})
+                """
+            ),
+            {"path": str(tmp_path)},
+        )
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    conn.execute(
+        text(
+            f"""
+            INSERT INTO model_monthly_interest_detail (
+                model_id,
+                month,
+                device,
+                gender,
+                age_group,
+                ratio,
+                created_at
+            )
+            SELECT model_id, month, device, gender, age_group, ratio, NOW()
+            FROM {STAGE_TABLE}
+            ON DUPLICATE KEY UPDATE
+                ratio = VALUES(ratio)
+            """
+        )
+    )
+    conn.execute(text(f"DROP TEMPORARY TABLE IF EXISTS {STAGE_TABLE}"))
+    return len(rows)
+
+
+def load_detail(
+    run_id: str,
+    method: str = "auto",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
     """
     정규화된 네이버 detail CSV를 읽어서
     model_monthly_interest_detail 테이블에 upsert.
+
+    method:
+      - "load-data"  : LOAD DATA LOCAL INFILE → staging 임시 테이블 → merge
+      - "executemany": chunk_size 행씩 executemany
+      - "auto"       : load-data 를 먼저 시도하고, 서버/드라이버가 막혀 있으면 executemany
+    dry_run=True 면 CSV 검증 결과만 출력하고 DB에는 쓰지 않는다.
     """
-    csv_path = NAVER_DIR / run_id / f"naver_trend_{run_id}_detail_normalized.csv"
+    csv_path = detail_csv_path(run_id)
     if not csv_path.exists():
         raise FileNotFoundError(f"정규화된 detail CSV가 없습니다: {csv_path}")
 
-    print(f"[INFO] 로딩 시작: {csv_path}")
+    print(f"[INFO] 로딩 시작: {csv_path} (method={method}, dry_run={dry_run})")
 
-    engine = get_engine(echo=False)
+    rows, invalid = read_detail_rows(csv_path)
+    stats: Dict[str, Any] = {
+        "valid_rows": len(rows),
+        "invalid_rows": invalid,
+        "loaded_rows": 0,
+        "method": None,
+        "elapsed_sec": 0.0,
+    }
+    if invalid:
+        print(f"[WARN] 검증 실패로 제외된 행: {invalid}")
 
-    sql = text(
-        """
-        INSERT INTO model_monthly_interest_detail (
-            model_id,
-            month,
-            device,
-            gender,
-            age_group,
-            ratio,
-            created_at
-        )
-        VALUES (
-            :model_id,
-            :month,
-            :device,
-            :gender,
-            :age_group,
-            :ratio,
-            NOW()
-        )
-        ON DUPLICATE KEY UPDATE
-            ratio = VALUES(ratio)
-        """
-    )
+    if dry_run or not rows:
+        if not rows:
+            print("[WARN] 적재할 행이 없습니다.")
+        return stats
+
+    started = time.perf_counter()
 
-    rows = 0
+    if method in ("auto", "load-data"):
+        engine = get_engine(echo=False, local_infile=True)
+        try:
+            with engine.begin() as conn:
+                stats["loaded_rows"] = load_via_infile(conn, rows)
+            stats["method"] = "load-data"
+        except DBAPIError as e:
+            if method == "load-data":
+                raise
+            print(f"[WARN] LOAD DATA LOCAL INFILE 사용 불가 → executemany 로 전환: {e.orig}")
 
-    with engine.begin() as conn:
-        with csv_path.open("r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                params = {
-                    "model_id": int(row["model_id"]),
-                    "month": row["month"],
-                    "device": row["device"] or None,
-                    "gender": row["gender"] or None,
-                    "age_group": row["age_group"] or None,
-                    "ratio": float(row["ratio"]),
-                }
-                conn.execute(sql, params)
-                rows += 1
+    if stats["method"] is None:
+        engine = get_engine(echo=False)
+        with engine.begin() as conn:
+            stats["loaded_rows"] = load_executemany(conn, rows, chunk_size)
+        stats["method"] = "executemany"
 
-    print(f"[INFO] detail 테이블 upsert 완료: {rows} rows")
+    stats["elapsed_sec"] = time.perf_counter() - started
+    return stats
 
 
 def main():
     parser = argparse.ArgumentParser(description="네이버 관심도 detail 로더")
     parser.add_argument("--run-id", required=True, help="수집 실행 ID (예: 25_11_16)")
+    parser.add_argument(
+        "--method",
+        choices=["auto", "load-data", "executemany"],
+        default="auto",
+        help="적재 방식 (기본: auto = LOAD DATA 시도 후 안 되면 executemany)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"executemany 한 번에 보낼 행 수 (기본: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="CSV 검증만 하고 DB에는 쓰지 않음",
+    )
     args = parser.parse_args()
 
-    load_detail(run_id=args.run_id)
+    stats = load_detail(
+        run_id=args.run_id,
+        method=args.method,
+        chunk_size=args.chunk_size,
+        dry_run=args.dry_run,
+    )
+
+    print("\n[SUMMARY] 네이버 detail 로더 결과")
+    for k, v in stats.items():
+        if k == "elapsed_sec":
+            v = f"{v:.3f}"
+        print(f"  {k}: {v}")
+    if stats["loaded_rows"] and stats["elapsed_sec"] > 0:
+        print(f"  rows/s: {stats['loaded_rows'] / stats['elapsed_sec']:,.0f}")
 
 
 if __name__ == "__main__":
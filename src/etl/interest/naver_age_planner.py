@@ -0,0 +1,253 @@
+# src/etl/interest/naver_age_planner.py
+
+from __future__ import annotations
+
+import datetime
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from src.api.naver_datalab import MAX_KEYWORD_GROUPS
+from src.db.connection import get_engine
+from src.etl.interest.naver_trend_planner import DEVICE_OPTIONS, GENDER_OPTIONS, CrawlJob
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+AGE_PROGRESS_PATH = BASE_DIR / "data" / "raw" / "naver" / "naver_age_progress.json"
+
+PROGRESS_VERSION = 1
+
+# 데이터랩 ages 코드 → age_group 라벨
+AGE_OPTIONS: List[Tuple[str, str]] = [
+    ("1", "0-12"),
+    ("2", "13-18"),
+    ("3", "19-24"),
+    ("4", "25-29"),
+    ("5", "30-34"),
+    ("6", "35-39"),
+    ("7", "40-44"),
+    ("8", "45-49"),
+    ("9", "50-54"),
+    ("10", "55-59"),
+    ("11", "60+"),
+]
+
+# (device_label, gender_label, age_label)
+Segment = Tuple[str, str, str]
+
+
+def all_segments() -> List[Segment]:
+    return [
+        (device_label, gender_label, age_label)
+        for _, device_label in DEVICE_OPTIONS
+        for _, gender_label in GENDER_OPTIONS
+        for _, age_label in AGE_OPTIONS
+    ]
+
+
+def unit_key(keyword: str, segment: Segment) -> str:
+    """
+    (키워드, device, gender, age) 한 조합의 진행 상태 키
+    """
+    return "|".join((keyword,) + segment)
+
+
+@dataclass
+class AgeProgress:
+    """
+    연령대별 수집 진행 상태 (여러 날에 걸쳐 이어서 수집)
+
+      data/raw/naver/naver_age_progress.json
+        {"version": 1, "start_date", "end_date", "anchor_keyword",
+         "done": [unit_key, ...], "calls": {"YYYY-MM-DD": 그날 쓴 API 호출 수}}
+
+    기간/앵커 키워드가 바뀌면 이전 진행 상태는 쓰지 않고 새로 시작한다.
+    """
+
+    start_date: str
+    end_date: str
+    anchor_keyword: str
+    done: Set[str] = field(default_factory=set)
+    calls: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls, start_date: str, end_date: str, anchor_keyword: str, path: Optional[Path] = None
+    ) -> "AgeProgress":
+        path = path or AGE_PROGRESS_PATH
+        fresh = cls(start_date, end_date, anchor_keyword)
+        if not path.exists():
+            return fresh
+
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 진행 상태 파일을 읽지 못해 새로 시작: {path}, error={e}")
+            return fresh
+
+        if (
+            state.get("version") != PROGRESS_VERSION
+            or state.get("start_date") != start_date
+            or state.get("end_date") != end_date
+            or state.get("anchor_keyword") != anchor_keyword
+        ):
+            print(
+                f"[INFO] 기간/앵커가 다른 진행 상태 → 새로 시작 "
+                f"(이전: {state.get('start_date')}~{state.get('end_date')}, {state.get('anchor_keyword')})"
+            )
+            # 일일 사용량은 기간과 관계없이 이어서 센다
+            fresh.calls = dict(state.get("calls") or {})
+            return fresh
+
+        fresh.done = set(state.get("done") or [])
+        fresh.calls = dict(state.get("calls") or {})
+        return fresh
+
+    def save(self, path: Optional[Path] = None) -> None:
+        path = path or AGE_PROGRESS_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 최근 30일 사용량만 남긴다
+        cutoff = (datetime.date.today() - datetime.timedelta(days=30)).isoformat()
+        calls = {d: n for d, n in self.calls.items() if d >= cutoff}
+
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": PROGRESS_VERSION,
+                    "start_date": self.start_date,
+                    "end_date": self.end_date,
+                    "anchor_keyword": self.anchor_keyword,
+                    "done": sorted(self.done),
+                    "calls": calls,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        os.replace(tmp_path, path)
+
+    def used_today(self) -> int:
+        return self.calls.get(datetime.date.today().isoformat(), 0)
+
+    def add_calls(self, n: int) -> None:
+        today = datetime.date.today().isoformat()
+        self.calls[today] = self.calls.get(today, 0) + n
+
+    def mark_done(self, job: CrawlJob) -> None:
+        segment = (job.device_label, job.gender_label, job.age_label)
+        for keyword in job.keywords:
+            self.done.add(unit_key(keyword, segment))
+
+
+def fetch_sales_priority(model_ids: List[int], months: int = 3) -> Dict[int, int]:
+    """
+    model_monthly_sales 의 최근 months 개월(저장된 마지막 월 기준) 판매량 합계.
+    판매 기록이 없는 모델은 결과에 없음(= 0).
+    """
+    if not model_ids:
+        return {}
+
+    engine = get_engine(echo=False)
+
+    placeholders = ", ".join([f":m{i}" for i in range(len(model_ids))])
+    params = {f"m{i}": model_id for i, model_id in enumerate(model_ids)}
+    params["months"] = months
+
+    sql = text(
+        f"""
+        SELECT model_id, SUM(sales_units) AS units
+        FROM model_monthly_sales
+        WHERE model_id IN ({placeholders})
+          AND month > (
+              SELECT DATE_SUB(MAX(month), INTERVAL :months MONTH)
+              FROM model_monthly_sales
+          )
+        GROUP BY model_id
+        """
+    )
+
+    with engine.connect() as conn:
+        rows = conn.execute(sql, params).mappings().all()
+
+    return {row["model_id"]: int(row["units"] or 0) for row in rows}
+
+
+def prioritize_keywords(
+    models_by_keyword: Dict[str, List[dict]], sales: Dict[int, int]
+) -> List[str]:
+    """
+    키워드를 최근 판매량 순(키워드에 묶인 모델 중 최대값)으로 정렬
+    """
+    def _units(keyword: str) -> int:
+        return max(sales.get(m["model_id"], 0) for m in models_by_keyword[keyword])
+
+    return sorted(models_by_keyword, key=lambda kw: (-_units(kw), kw))
+
+
+def plan_age_batches(
+    keywords: List[str],
+    progress: AgeProgress,
+    size: int = MAX_KEYWORD_GROUPS - 1,
+) -> List[CrawlJob]:
+    """
+    아직 끝나지 않은 (키워드, device, gender, age) 조합을
+    API 1회 단위(같은 device/gender/age 의 키워드 4개 + 앵커) 배치로 묶는다.
+
+    keywords 는 우선순위 순서. 배치는 "우선순위 묶음 번호 → segment" 순으로 정렬되므로
+    앞에서부터 잘라 쓰면 판매량 상위 모델의 모든 연령대가 먼저 채워진다.
+    """
+    device_codes = {label: code for code, label in DEVICE_OPTIONS}
+    gender_codes = {label: code for code, label in GENDER_OPTIONS}
+    age_codes = {label: code for code, label in AGE_OPTIONS}
+
+    ranked: List[Tuple[int, int, CrawlJob]] = []
+    for seg_idx, segment in enumerate(all_segments()):
+        pending = [kw for kw in keywords if unit_key(kw, segment) not in progress.done]
+        device_label, gender_label, age_label = segment
+        for chunk_idx in range(0, len(pending), size):
+            job = CrawlJob(
+                device_code=device_codes[device_label],
+                device_label=device_label,
+                gender_code=gender_codes[gender_label],
+                gender_label=gender_label,
+                start_date=progress.start_date,
+                end_date=progress.end_date,
+                keywords=pending[chunk_idx : chunk_idx + size],
+                age_code=age_codes[age_label],
+                age_label=age_label,
+            )
+            ranked.append((chunk_idx // size, seg_idx, job))
+
+    ranked.sort(key=lambda x: (x[0], x[1]))
+    return [job for _, _, job in ranked]
+
+
+def summarize_age_plan(
+    batches: List[CrawlJob],
+    n_keywords: int,
+    daily_budget: int,
+    used_today: int,
+) -> Dict[str, int]:
+    """
+    전체 조합 수 / 남은 호출 수 / 오늘 쓸 수 있는 호출 수 / 남은 일수 추정
+    """
+    remaining = len(batches)
+    today_calls = max(0, min(remaining, daily_budget - used_today))
+    after_today = remaining - today_calls
+    days = (1 if today_calls else 0) + (
+        math.ceil(after_today / daily_budget) if daily_budget > 0 else 0
+    )
+    return {
+        "total_units": n_keywords * len(all_segments()),
+        "remaining_calls": remaining,
+        "today_calls": today_calls,
+        "estimated_days": days,
+    }
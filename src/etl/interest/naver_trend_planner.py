@@ -0,0 +1,223 @@
+# src/etl/interest/naver_trend_planner.py
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from src.api.naver_datalab import chunk_keywords
+from src.db.connection import get_engine
+
+
+# 디바이스/성별 조합 정의
+# 네이버에 보낼 코드와 CSV/DB에 저장할 라벨을 분리
+DEVICE_OPTIONS: List[Tuple[Optional[str], str]] = [
+    ("pc", "pc"),
+    ("mo", "mobile"),
+]
+GENDER_OPTIONS: List[Tuple[Optional[str], str]] = [
+    ("m", "male"),
+    ("f", "female"),
+]
+
+# (model_id, device_label, gender_label) → (체이닝 기준 월 'YYYY-MM-01', 그 월의 ratio)
+LatestPoints = Dict[Tuple[int, str, str], Tuple[str, float]]
+
+
+@dataclass
+class CrawlJob:
+    """
+    같은 (device, gender, 기간) 으로 요청할 키워드 묶음 (최대 4개 + 앵커 = API 1회)
+    overlap_month 가 있으면 확정된 저장 월(체이닝 기준 월)부터 다시 받아서
+    저장된 값에 이어 붙인다(체이닝).
+    model_ids 가 있으면 이 기간으로 계획된 모델에만 결과를 쓴다.
+    (같은 키워드라도 모델마다 저장 상태가 다르면 기간이 다른 job 으로 나뉜다)
+    """
+
+    device_code: Optional[str]
+    device_label: str
+    gender_code: Optional[str]
+    gender_label: str
+    start_date: str
+    end_date: str
+    keywords: List[str] = field(default_factory=list)
+    overlap_month: Optional[str] = None  # 'YYYY-MM-01'
+    age_code: Optional[str] = None  # 데이터랩 ages 코드 (None = 연령 필터 없음)
+    age_label: str = ""  # CSV/DB age_group 값
+    model_ids: Optional[List[int]] = None  # None = 키워드의 모든 모델
+
+
+def month_start(date_str: str) -> str:
+    """
+    'YYYY-MM-DD' → 'YYYY-MM-01'
+    """
+    return date_str[:7] + "-01"
+
+
+def fetch_latest_points(
+    model_ids: List[int],
+    today: Optional[datetime.date] = None,
+) -> LatestPoints:
+    """
+    model_monthly_interest_detail 에서 (model_id, device, gender) 별
+    체이닝 기준 월과 그 월의 ratio 를 조회한다. (연령대 필터 없는 행 = age_group '' 만)
+
+    체이닝 기준 월 = 마지막 저장 월보다 앞이면서 이번 달보다 앞인 저장 월 중 가장 최근 월.
+      마지막 저장 월은 저장할 때 진행 중이던 달(부분 집계)일 수 있어 기준으로 쓰지 않는다.
+      그 앞 월은 마지막 저장 월을 쓴 실행 시점에 이미 끝난 달이므로 확정값이다.
+    저장 월이 하나뿐이면 기준 월이 없으므로 결과에서 빠진다(→ 전체 기간 backfill).
+    """
+    if not model_ids:
+        return {}
+
+    today = today or datetime.date.today()
+    engine = get_engine(echo=False)
+
+    placeholders = ", ".join([f":m{i}" for i in range(len(model_ids))])
+    params = {f"m{i}": model_id for i, model_id in enumerate(model_ids)}
+    params["current_month"] = today.replace(day=1)
+
+    sql = text(
+        f"""
+        SELECT d.model_id, d.device, d.gender, d.month, d.ratio
+        FROM model_monthly_interest_detail d
+        JOIN (
+            SELECT t.model_id, t.device, t.gender, MAX(t.month) AS month
+            FROM model_monthly_interest_detail t
+            JOIN (
+                SELECT model_id, device, gender, MAX(month) AS last_month
+                FROM model_monthly_interest_detail
+                WHERE model_id IN ({placeholders})
+                  AND age_group = ''
+                GROUP BY model_id, device, gender
+            ) latest
+              ON latest.model_id = t.model_id
+             AND latest.device = t.device
+             AND latest.gender = t.gender
+            WHERE t.age_group = ''
+              AND t.month < latest.last_month
+              AND t.month < :current_month
+            GROUP BY t.model_id, t.device, t.gender
+        ) chained
+          ON chained.model_id = d.model_id
+         AND chained.device = d.device
+         AND chained.gender = d.gender
+         AND chained.month = d.month
+        WHERE d.age_group = ''
+        """
+    )
+
+    with engine.connect() as conn:
+        rows = conn.execute(sql, params).mappings().all()
+
+    latest: LatestPoints = {}
+    for row in rows:
+        month = row["month"]
+        if isinstance(month, (datetime.date, datetime.datetime)):
+            month = month.strftime("%Y-%m-01")
+        latest[(row["model_id"], row["device"], row["gender"])] = (
+            month,
+            float(row["ratio"]),
+        )
+    return latest
+
+
+def plan_jobs(
+    models_by_keyword: Dict[str, List[dict]],
+    start_date: str,
+    end_date: str,
+    latest: LatestPoints,
+    full: bool = False,
+) -> List[CrawlJob]:
+    """
+    모델 × device × gender 마다 요청할 기간을 정하고,
+    같은 (device, gender, 기간) 끼리 키워드를 묶어서 CrawlJob 목록을 만든다.
+
+    - 체이닝 기준 월이 없는 모델(새로 추가된 car_model 등) → 전체 기간 backfill
+    - 기준 월 L 이 있으면 → L ~ end_date 만 요청 (L 은 체이닝용 겹침 월)
+      L 다음 월부터 이번 달(부분 집계)까지는 매번 다시 받아서 덮어쓴다.
+    - L 이 end_date 의 월 이후면 요청하지 않음
+    - full=True 면 저장 여부와 관계없이 전체 기간
+    같은 키워드의 모델끼리 기준 월이 다르면 모델별로 다른 job 에 들어간다.
+    """
+    start_month = month_start(start_date)
+    end_month = month_start(end_date)
+
+    # (device, gender, window_start) → {키워드: [model_id, ...]}
+    grouped: Dict[Tuple[str, str, str], Dict[str, List[int]]] = {}
+    for keyword, models in models_by_keyword.items():
+        for _, device_label in DEVICE_OPTIONS:
+            for _, gender_label in GENDER_OPTIONS:
+                for m in models:
+                    point = None if full else latest.get((m["model_id"], device_label, gender_label))
+
+                    if point is None:
+                        window_start = start_date
+                    else:
+                        chain_month = point[0]
+                        if chain_month >= end_month:
+                            continue
+                        window_start = start_date if chain_month < start_month else chain_month
+
+                    keywords = grouped.setdefault((device_label, gender_label, window_start), {})
+                    keywords.setdefault(keyword, []).append(m["model_id"])
+
+    device_codes = {label: code for code, label in DEVICE_OPTIONS}
+    gender_codes = {label: code for code, label in GENDER_OPTIONS}
+
+    jobs: List[CrawlJob] = []
+    for (device_label, gender_label, window_start), keywords in sorted(grouped.items()):
+        jobs.append(
+            CrawlJob(
+                device_code=device_codes[device_label],
+                device_label=device_label,
+                gender_code=gender_codes[gender_label],
+                gender_label=gender_label,
+                start_date=window_start,
+                end_date=end_date,
+                keywords=list(keywords),
+                overlap_month=None if window_start == start_date else window_start,
+                model_ids=sorted({mid for mids in keywords.values() for mid in mids}),
+            )
+        )
+    return jobs
+
+
+def split_batches(jobs: List[CrawlJob], anchor_keyword: str) -> List[CrawlJob]:
+    """
+    CrawlJob 을 API 1회 단위(키워드 4개 + 앵커)로 나눈다.
+    """
+    batches: List[CrawlJob] = []
+    for job in jobs:
+        for batch in chunk_keywords(job.keywords, anchor_keyword):
+            batches.append(
+                CrawlJob(
+                    device_code=job.device_code,
+                    device_label=job.device_label,
+                    gender_code=job.gender_code,
+                    gender_label=job.gender_label,
+                    start_date=job.start_date,
+                    end_date=job.end_date,
+                    keywords=batch,
+                    overlap_month=job.overlap_month,
+                    age_code=job.age_code,
+                    age_label=job.age_label,
+                    model_ids=job.model_ids,
+                )
+            )
+    return batches
+
+
+def summarize_plan(batches: List[CrawlJob]) -> Dict[str, int]:
+    """
+    계획 요약: 전체 API 호출 수, 전체 기간 backfill / 증분(tail) 호출 수
+    """
+    backfill = sum(1 for b in batches if b.overlap_month is None)
+    return {
+        "planned_calls": len(batches),
+        "backfill_calls": backfill,
+        "tail_calls": len(batches) - backfill,
+    }
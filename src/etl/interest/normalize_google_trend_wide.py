@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import argparse
 import csv
-from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Tuple, List, Any
+from typing import Dict, Iterator, List, Tuple
 
+import numpy as np
+import pandas as pd
 from sqlalchemy import text
 
 from src.db.connection import get_engine
@@ -16,6 +17,9 @@ from src.db.connection import get_engine
 BASE_DIR = Path(__file__).resolve().parents[3]
 GOOGLE_DIR = BASE_DIR / "data" / "raw" / "google"
 
+# wide CSV 를 한 번에 읽을 행 수
+DEFAULT_CHUNK_ROWS = 50_000
+
 
 def load_model_map() -> Dict[Tuple[str, str], int]:
     """
@@ -69,7 +73,126 @@ def open_skip_category_line(path: Path):
     return f
 
 
-def normalize_google_trend_wide(run_id: str) -> Path:
+def map_columns(
+    fieldnames: List[str],
+    brand_name: str,
+    model_map: Dict[Tuple[str, str], int],
+    used_columns: Dict[str, int],
+    skipped_columns: List[str],
+) -> List[Tuple[int, int]]:
+    """
+    헤더 분석: 어떤 컬럼을 model_id로 사용할지 결정.
+    반환: [(컬럼 위치, model_id)] (헤더 순서)
+    같은 이름의 컬럼이 여러 개면 csv.DictReader 처럼 마지막 컬럼 값을 쓴다.
+    """
+    last_pos = {col: pos for pos, col in enumerate(fieldnames)}
+
+    col_to_model_id: Dict[str, int] = {}
+    for col in fieldnames[1:]:
+        raw_name = col.strip()
+        # "캐스퍼: (대한민국)" → "캐스퍼"
+        if ":" in raw_name:
+            trend_name = raw_name.split(":", 1)[0].strip()
+        else:
+            trend_name = raw_name
+
+        key = (brand_name, trend_name)
+        model_id = model_map.get(key)
+        if model_id is not None:
+            col_to_model_id[col] = model_id
+            used_columns[f"{brand_name}:{trend_name}"] = model_id
+        else:
+            skipped_columns.append(f"{brand_name}:{trend_name}")
+
+    return [(last_pos[col], model_id) for col, model_id in col_to_model_id.items()]
+
+
+def iter_wide_partials(
+    path: Path,
+    brand_name: str,
+    model_map: Dict[Tuple[str, str], int],
+    used_columns: Dict[str, int],
+    skipped_columns: List[str],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """
+    wide CSV 하나를 chunk_rows 행씩 읽어서
+    (model_id, month) 별 index 합계/개수 DataFrame 을 chunk 마다 yield 한다.
+
+    - 날짜 × 모델 값을 행 우선 순서로 펼쳐(long format) 한 번에 파싱
+    - 값은 int(float(x)) 와 같게 소수점 버림, 빈 값은 무시
+    - '<1' 처럼 숫자가 아닌 값은 경고 후 무시
+    """
+    with open_skip_category_line(path) as f:
+        fieldnames = next(csv.reader(f), [])
+        if not fieldnames:
+            print(f"[WARN] 헤더 없음, 스킵: {path}")
+            return
+
+        # 첫 번째 컬럼 (예: '주') 를 날짜 컬럼으로 사용
+        columns = map_columns(fieldnames, brand_name, model_map, used_columns, skipped_columns)
+
+        print(
+            f"[INFO] 매핑된 컬럼 수: {len(columns)} "
+            f"(전체 {len(fieldnames) - 1} 중)"
+        )
+        if not columns:
+            return
+
+        positions = [pos for pos, _ in columns]
+        model_ids = np.array([model_id for _, model_id in columns], dtype="int64")
+
+        reader = pd.read_csv(
+            f,
+            header=None,
+            usecols=[0] + positions,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=chunk_rows,
+        )
+        for chunk in reader:
+            dates = chunk[0].fillna("").str.strip()
+
+            bad_dates = dates[(dates != "") & (dates.str.len() < 7)]
+            for date_str in bad_dates:
+                print(f"[WARN] 예기치 않은 날짜 형식 스킵: {date_str}")
+
+            # YYYY-MM-01 로 월 키 통일 (주간/일간 데이터 기준)
+            valid_rows = (dates.str.len() >= 7).to_numpy()
+            months = (dates.str[:7] + "-01").to_numpy()
+
+            values = chunk[positions].fillna("").to_numpy()
+            n_cols = len(positions)
+
+            long = pd.DataFrame(
+                {
+                    "model_id": np.tile(model_ids, len(chunk)),
+                    "month": np.repeat(months, n_cols),
+                    "value": pd.Series(values.ravel()).str.strip().to_numpy(),
+                }
+            )
+            row_ok = np.repeat(valid_rows, n_cols)
+
+            nonempty = row_ok & (long["value"] != "").to_numpy()
+            parsed = pd.to_numeric(long["value"].where(nonempty), errors="coerce")
+
+            bad_values = nonempty & parsed.isna().to_numpy()
+            if bad_values.any():
+                examples = long.loc[bad_values, "value"].unique()[:5].tolist()
+                print(
+                    f"[WARN] index 파싱 실패 스킵: {int(bad_values.sum())}건 "
+                    f"(예: {examples}), file={path.name}"
+                )
+
+            keep = nonempty & ~bad_values
+            long = long[keep].assign(value=np.trunc(parsed[keep]))
+
+            yield long.groupby(["model_id", "month"], sort=False)["value"].agg(
+                ["sum", "count"]
+            )
+
+
+def normalize_google_trend_wide(run_id: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Path:
     """
     data/raw/google/<run_id> 안의
       *hyundai*all.csv
@@ -82,6 +205,9 @@ def normalize_google_trend_wide(run_id: str) -> Path:
 
     스키마:
       model_id, month, google_trend_index
+
+    파일마다 chunk_rows 행씩 읽어서 (model_id, month) 합계/개수만 누적하므로
+    여러 해 분량의 일간 데이터도 메모리에 한 번에 올리지 않는다.
     """
     folder = GOOGLE_DIR / run_id
     if not folder.exists():
@@ -104,8 +230,11 @@ def normalize_google_trend_wide(run_id: str) -> Path:
     model_map = load_model_map()
     print(f"[INFO] car_model 매핑 로드 완료: {len(model_map)} 개")
 
-    # (model_id, month) -> indices
-    bucket: Dict[Tuple[int, str], List[int]] = defaultdict(list)
+    # (model_id, month) 별 index 합계/개수 (처음 나온 순서 유지)
+    acc = pd.DataFrame(
+        {"sum": pd.Series(dtype="float64"), "count": pd.Series(dtype="int64")},
+        index=pd.MultiIndex.from_arrays([[], []], names=["model_id", "month"]),
+    )
 
     used_columns: Dict[str, int] = {}
     skipped_columns: List[str] = []
@@ -118,91 +247,24 @@ def normalize_google_trend_wide(run_id: str) -> Path:
 
         print(f"[INFO] 구글 트렌드 wide CSV 로딩: {path} (brand={brand_name})")
 
-        with open_skip_category_line(path) as f:
-            reader = csv.DictReader(f)
-            if not reader.fieldnames:
-                print(f"[WARN] 헤더 없음, 스킵: {path}")
-                continue
-
-            fieldnames = reader.fieldnames
-            # 첫 번째 컬럼 (예: '주') 를 날짜 컬럼으로 사용
-            date_col = fieldnames[0]
-
-            # 헤더 분석: 어떤 컬럼을 model_id로 사용할지 결정
-            col_to_model_id: Dict[str, int] = {}
-            for col in fieldnames[1:]:
-                raw_name = col.strip()
-                # "캐스퍼: (대한민국)" → "캐스퍼"
-                if ":" in raw_name:
-                    trend_name = raw_name.split(":", 1)[0].strip()
-                else:
-                    trend_name = raw_name
-
-                key = (brand_name, trend_name)
-                model_id = model_map.get(key)
-                if model_id is not None:
-                    col_to_model_id[col] = model_id
-                    used_columns[f"{brand_name}:{trend_name}"] = model_id
-                else:
-                    skipped_columns.append(f"{brand_name}:{trend_name}")
-
-            print(
-                f"[INFO] 매핑된 컬럼 수: {len(col_to_model_id)} "
-                f"(전체 {len(fieldnames) - 1} 중)"
-            )
+        for partial in iter_wide_partials(
+            path, brand_name, model_map, used_columns, skipped_columns, chunk_rows
+        ):
+            acc = pd.concat([acc, partial]).groupby(level=[0, 1], sort=False).sum()
 
-            # 실제 데이터 행 처리
-            for row in reader:
-                date_str = (row.get(date_col) or "").strip()
-                if not date_str:
-                    continue
-                # YYYY-MM-01 로 월 키 통일 (주간 데이터 기준)
-                if len(date_str) < 7:
-                    print(f"[WARN] 예기치 않은 날짜 형식 스킱: {date_str}")
-                    continue
-                month = date_str[:7] + "-01"
-
-                for col, model_id in col_to_model_id.items():
-                    val_str = (row.get(col) or "").strip()
-                    if not val_str:
-                        continue
-                    try:
-                        idx = int(float(val_str))
-                    except ValueError:
-                        print(
-                            f"[WARN] index 파싱 실패 스킵: "
-                            f"date={date_str}, col={col}, value={val_str}"
-                        )
-                        continue
-
-                    bucket[(model_id, month)].append(idx)
-
-    # 평균값 계산
-    rows: List[Dict[str, Any]] = []
-    for (model_id, month), indices in bucket.items():
-        if not indices:
-            continue
-        avg_idx = sum(indices) / len(indices)
-        google_trend_index = round(avg_idx)
-        rows.append(
-            {
-                "model_id": model_id,
-                "month": month,
-                "google_trend_index": google_trend_index,
-            }
-        )
+    # 평균값 계산 (round: 파이썬 round 와 같은 half-to-even)
+    out = acc.reset_index()
+    out = out[out["count"] > 0]
+    out["google_trend_index"] = np.round(out["sum"] / out["count"]).astype("int64")
+    out = out[["model_id", "month", "google_trend_index"]]
+    out["model_id"] = out["model_id"].astype("int64")
 
-    print(f"[INFO] 정규화된 (model_id, month) 개수: {len(rows)}")
+    print(f"[INFO] 정규화된 (model_id, month) 개수: {len(out)}")
 
     out_path = folder / f"google_trend_{run_id}_normalized.csv"
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["model_id", "month", "google_trend_index"],
-        )
-        writer.writeheader()
-        writer.writerows(rows)
+    # csv.DictWriter 로 쓰던 기존 출력과 같은 형식 (\r\n 줄바꿈)
+    out.to_csv(out_path, index=False, encoding="utf-8-sig", lineterminator="\r\n")
 
     print(f"[INFO] 정규화 CSV 저장 완료: {out_path}")
 
@@ -220,9 +282,15 @@ def main():
         description="구글 트렌드 wide CSV → 월별 지수 정규화"
     )
     parser.add_argument("--run-id", required=True, help="실행 ID (예: 25_11_16)")
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help=f"wide CSV 를 한 번에 읽을 행 수 (기본: {DEFAULT_CHUNK_ROWS})",
+    )
 
     args = parser.parse_args()
-    normalize_google_trend_wide(run_id=args.run_id)
+    normalize_google_trend_wide(run_id=args.run_id, chunk_rows=args.chunk_rows)
 
 
 if __name__ == "__main__":
@@ -4,14 +4,68 @@ from __future__ import annotations
 
 import argparse
 import csv
-from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Tuple, Any
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
 NAVER_DIR = BASE_DIR / "data" / "raw" / "naver"
 
 
+DETAIL_FIELDNAMES = ["model_id", "month", "device", "gender", "age_group", "ratio"]
+
+
+def _cell(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def normalize_raw_row(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    raw 행(naver_trend_<run_id>.csv 한 줄 또는 수집 중인 행 dict) 하나를
+    detail 정규화 행으로 변환. 쓸 수 없는 행이면 None.
+    """
+    try:
+        model_id = int(row["model_id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    date_str = _cell(row.get("date"))
+    ratio_str = _cell(row.get("ratio"))
+
+    if not date_str or not ratio_str:
+        return None
+
+    # YYYY-MM-01 로 통일
+    if len(date_str) < 7:
+        print(f"[WARN] 예기치 않은 날짜 형식 스킵: {date_str}")
+        return None
+    month = date_str[:7] + "-01"
+
+    try:
+        ratio = float(ratio_str)
+    except ValueError:
+        print(f"[WARN] ratio 파싱 실패 스킵: {ratio_str}")
+        return None
+
+    return {
+        "model_id": model_id,
+        "month": month,
+        "device": _cell(row.get("device")),
+        "gender": _cell(row.get("gender")),
+        "age_group": _cell(row.get("age_group")),
+        "ratio": ratio,
+    }
+
+
+def iter_normalized(rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    raw 행 스트림 → detail 정규화 행 스트림 (generator, 메모리에 모으지 않음)
+    """
+    for row in rows:
+        normalized = normalize_raw_row(row)
+        if normalized is not None:
+            yield normalized
+
+
 def normalize_detail(run_id: str) -> Path:
     """
     data/raw/naver/<run_id>/naver_trend_<run_id>.csv 를 읽어서
@@ -28,61 +82,21 @@ def normalize_detail(run_id: str) -> Path:
 
     print(f"[INFO] raw CSV 로딩: {raw_path}")
 
-    rows: List[Dict[str, Any]] = []
-
-    with raw_path.open("r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                model_id = int(row["model_id"])
-            except (KeyError, ValueError):
-                continue
-
-            date_str = (row.get("date") or "").strip()
-            device = (row.get("device") or "").strip()
-            gender = (row.get("gender") or "").strip()
-            age_group = (row.get("age_group") or "").strip()
-            ratio_str = (row.get("ratio") or "").strip()
-
-            if not date_str or not ratio_str:
-                continue
-
-            # YYYY-MM-01 로 통일
-            if len(date_str) < 7:
-                print(f"[WARN] 예기치 않은 날짜 형식 스킵: {date_str}")
-                continue
-            month = date_str[:7] + "-01"
-
-            try:
-                ratio = float(ratio_str)
-            except ValueError:
-                print(f"[WARN] ratio 파싱 실패 스킵: {ratio_str}")
-                continue
-
-            rows.append(
-                {
-                    "model_id": model_id,
-                    "month": month,
-                    "device": device,
-                    "gender": gender,
-                    "age_group": age_group,
-                    "ratio": ratio,
-                }
-            )
-
-    if not rows:
-        print("[WARN] 정규화 결과가 비어 있습니다.")
-    else:
-        print(f"[INFO] 정규화된 레코드 수: {len(rows)}")
-
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["model_id", "month", "device", "gender", "age_group", "ratio"],
-        )
+    count = 0
+    with raw_path.open("r", encoding="utf-8-sig") as f_in, out_path.open(
+        "w", newline="", encoding="utf-8-sig"
+    ) as f_out:
+        writer = csv.DictWriter(f_out, fieldnames=DETAIL_FIELDNAMES)
         writer.writeheader()
-        writer.writerows(rows)
+        for row in iter_normalized(csv.DictReader(f_in)):
+            writer.writerow(row)
+            count += 1
+
+    if not count:
+        print("[WARN] 정규화 결과가 비어 있습니다.")
+    else:
+        print(f"[INFO] 정규화된 레코드 수: {count}")
 
     print(f"[INFO] 정규화 CSV 저장 완료: {out_path}")
     return out_path
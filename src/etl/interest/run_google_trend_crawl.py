@@ -0,0 +1,300 @@
+# src/etl/interest/run_google_trend_crawl.py
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.api.google_trends import (
+    CATEGORY_AUTOS,
+    GOOGLE_TRENDS_CACHE_DIR,
+    MAX_KEYWORDS,
+    GoogleTrendsClient,
+    TrendsBackend,
+)
+from src.api.naver_datalab import chunk_keywords, rescale_values_to_anchor
+from src.api.naver_datalab_cache import DEFAULT_TTL_HOURS, DatalabCache
+from src.etl.interest.run_naver_trend_crawl import DEFAULT_ANCHOR_KEYWORD, fetch_target_models
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+GOOGLE_DIR = BASE_DIR / "data" / "raw" / "google"
+
+# normalize_google_trend_wide.guess_brand_from_filename 이 알아보는 파일명 태그
+BRAND_FILE_TAGS = {
+    "현대": "HYUNDAI",
+    "기아": "KIA",
+}
+
+# 구글 트렌드 내보내기 CSV 헤더의 지역 표기 ("캐스퍼: (대한민국)")
+GEO_LABELS = {
+    "KR": "대한민국",
+}
+
+# Series = {날짜 'YYYY-MM-DD': 값}
+Series = Dict[str, float]
+
+
+def rescale_group(data: Dict[str, Any], anchor_keyword: str) -> Optional[Dict[str, Series]]:
+    """
+    그룹 응답을 앵커 키워드의 기간 내 최고값 = 100 기준으로 다시 스케일.
+    모든 그룹에 같은 앵커가 들어가므로 스케일 후에는 그룹이 달라도 값을 비교할 수 있다.
+    앵커 데이터가 없거나 전부 0이면 None.
+    """
+    dates = data.get("dates") or []
+    scaled = rescale_values_to_anchor(data.get("values") or {}, anchor_keyword, ndigits=2)
+    if scaled is None:
+        return None
+
+    return {
+        keyword: {d: v for d, v in zip(dates, series) if v is not None}
+        for keyword, series in scaled.items()
+    }
+
+
+def date_column_name(dates: List[str]) -> str:
+    """
+    날짜 간격으로 구글 트렌드 내보내기와 같은 첫 컬럼명을 정한다. (일 / 주 / 월)
+    """
+    if len(dates) < 2:
+        return "주"
+    gap = (
+        datetime.date.fromisoformat(dates[1]) - datetime.date.fromisoformat(dates[0])
+    ).days
+    if gap >= 28:
+        return "월"
+    if gap >= 7:
+        return "주"
+    return "일"
+
+
+def write_wide_csv(
+    path: Path,
+    keywords: List[str],
+    scaled: Dict[str, Series],
+    geo: str,
+    category_label: str,
+) -> int:
+    """
+    구글 트렌드 내보내기와 같은 wide CSV 로 저장 (normalize_google_trend_wide 입력 형식)
+
+      카테고리: 자동차
+      주,캐스퍼: (대한민국),아반떼: (대한민국),...
+      2024-11-10,84,55,...
+    """
+    columns = [kw for kw in keywords if kw in scaled]
+    dates = sorted({d for kw in columns for d in scaled[kw]})
+    geo_label = GEO_LABELS.get(geo, geo)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8-sig") as f:
+        f.write(f"카테고리: {category_label}\n")
+        writer = csv.writer(f)
+        writer.writerow([date_column_name(dates)] + [f"{kw}: ({geo_label})" for kw in columns])
+        for d in dates:
+            writer.writerow([d] + [scaled[kw].get(d, "") for kw in columns])
+    return len(columns)
+
+
+def run_google_trend_crawl(
+    run_id: str,
+    start_date: str,
+    end_date: str,
+    brands: Optional[List[str]] = None,
+    limit_models: Optional[int] = None,
+    anchor_keyword: str = DEFAULT_ANCHOR_KEYWORD,
+    geo: str = "KR",
+    cat: int = CATEGORY_AUTOS,
+    workers: int = 2,
+    min_interval_sec: float = 5.0,
+    max_retries: int = 3,
+    refresh: bool = False,
+    cache_ttl_hours: float = DEFAULT_TTL_HOURS,
+    backend: Optional[TrendsBackend] = None,
+) -> List[Path]:
+    """
+    car_model 기준으로 구글 트렌드를 수집해서
+    data/raw/google/<run_id>/google_trend_<run_id>_<BRAND>_all.csv 에 브랜드별 wide CSV 로 저장한다.
+    (이후 normalize_google_trend_wide → load_google_trend 로 적재)
+
+    - 요청 한 번에 모델 4개 + 앵커 키워드 1개 (구글 트렌드 비교 최대 5개)
+    - 값은 그룹마다 앵커 키워드의 기간 내 최고값 = 100 으로 다시 스케일 → 모든 모델이 같은 기준
+    - workers 개 스레드가 요청을 나눠 보내되, 요청 간격은 min_interval_sec(+jitter) 로 전체 공유 제한
+    - 응답은 data/cache/google_trends 에 캐시 → 중간에 멈춰도 같은 기간으로 다시 실행하면
+      끝난 그룹은 건너뛰고 이어서 수집 (refresh=True 면 전부 다시 요청)
+
+    backend: 테스트용으로 pytrends 대신 쓸 백엔드 (TrendsBackend)
+    """
+    if brands is None:
+        brands = ["현대", "기아"]
+
+    print(
+        f"[INFO] 구글 트렌드 수집 시작: run_id={run_id}, 기간={start_date} ~ {end_date}, geo={geo}, cat={cat}"
+    )
+    print(f"[INFO] 대상 브랜드: {brands}")
+
+    models = fetch_target_models(brands)
+    if limit_models is not None:
+        models = models[:limit_models]
+
+    if not models:
+        print("[WARN] 대상 모델이 없습니다. car_model 테이블을 확인하세요.")
+        return []
+
+    keywords = [m["model_name_kr"] for m in models]
+    groups = chunk_keywords(keywords, anchor_keyword, size=MAX_KEYWORDS - 1)
+
+    print(f"[INFO] 수집 대상 모델 수: {len(models)}, 앵커 키워드: {anchor_keyword}, 그룹 수: {len(groups)}")
+    print(f"[INFO] workers={workers}, 요청 간격 {min_interval_sec}s 이상")
+
+    cache = DatalabCache(
+        cache_dir=GOOGLE_TRENDS_CACHE_DIR, ttl_hours=cache_ttl_hours, refresh=refresh
+    )
+    client = GoogleTrendsClient(
+        backend=backend,
+        min_interval_sec=min_interval_sec,
+        max_retries=max_retries,
+        cache=cache,
+    )
+
+    scaled: Dict[str, Series] = {}
+    failed_groups: List[List[str]] = []
+
+    def _one(group: List[str]) -> Tuple[List[str], Optional[Dict[str, Series]]]:
+        data = client.fetch(group + [anchor_keyword], start_date, end_date, geo=geo, cat=cat)
+        return group, rescale_group(data, anchor_keyword)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_one, group): group for group in groups}
+        for done, fut in enumerate(as_completed(futures), start=1):
+            group = futures[fut]
+            try:
+                _, group_scaled = fut.result()
+            except Exception as e:
+                print(f"[WARN] 구글 트렌드 요청 실패: {group}, error={e}")
+                failed_groups.append(group)
+                continue
+
+            if group_scaled is None:
+                print(f"[WARN] 앵커 키워드 데이터가 없어 스케일 불가, 스킵: {group}")
+                failed_groups.append(group)
+                continue
+
+            scaled.update(group_scaled)
+            print(f"[INFO] ({done}/{len(groups)}) 완료: {', '.join(group)}")
+
+    category_label = "자동차" if cat == CATEGORY_AUTOS else str(cat)
+    out_dir = GOOGLE_DIR / run_id
+    out_paths: List[Path] = []
+    for brand in brands:
+        tag = BRAND_FILE_TAGS.get(brand)
+        if tag is None:
+            print(f"[WARN] 파일명 태그가 없는 브랜드, 스킵 (BRAND_FILE_TAGS 확인): {brand}")
+            continue
+
+        brand_keywords = list(
+            dict.fromkeys(m["model_name_kr"] for m in models if m["brand_name"] == brand)
+        )
+        if not brand_keywords:
+            continue
+
+        out_path = out_dir / f"google_trend_{run_id}_{tag}_all.csv"
+        n_cols = write_wide_csv(out_path, brand_keywords, scaled, geo, category_label)
+        out_paths.append(out_path)
+        print(f"[INFO] wide CSV 저장: {out_path} (모델 {n_cols}/{len(brand_keywords)})")
+
+    print("\n[SUMMARY] 구글 트렌드 수집 결과")
+    print(f"  groups: {len(groups)} (실패/스킵 {len(failed_groups)})")
+    print(f"  models_collected: {len(scaled)}")
+    print(f"  api_calls: {client.call_count} (재시도 {client.retry_count})")
+    print(f"  cache: hit={cache.hits}, miss={cache.misses} (refresh={refresh})")
+
+    return out_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="구글 트렌드 관심도 수집 (car_model 기준, 앵커 키워드로 그룹 간 스케일 통일)"
+    )
+    parser.add_argument("--run-id", required=True, help="수집 실행 ID (예: 25_11_16)")
+    parser.add_argument("--start-date", required=True, help="YYYY-MM-DD 형식 시작일")
+    parser.add_argument("--end-date", required=True, help="YYYY-MM-DD 형식 종료일")
+    parser.add_argument(
+        "--brands",
+        nargs="+",
+        default=["현대", "기아"],
+        help="대상 브랜드명 목록 (car_model.brand_name 기준, 기본: 현대 기아)",
+    )
+    parser.add_argument(
+        "--limit-models",
+        type=int,
+        default=None,
+        help="테스트용: 상위 N개 모델만 수집",
+    )
+    parser.add_argument(
+        "--anchor-keyword",
+        default=DEFAULT_ANCHOR_KEYWORD,
+        help=f"모든 그룹에 함께 넣어 스케일을 맞출 기준 키워드 (기본: {DEFAULT_ANCHOR_KEYWORD})",
+    )
+    parser.add_argument("--geo", default="KR", help="지역 코드 (기본: KR)")
+    parser.add_argument(
+        "--cat",
+        type=int,
+        default=CATEGORY_AUTOS,
+        help=f"구글 트렌드 카테고리 ID (기본: {CATEGORY_AUTOS} = 자동차)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="동시에 요청을 처리할 스레드 수 (기본: 2)",
+    )
+    parser.add_argument(
+        "--min-interval-sec",
+        type=float,
+        default=5.0,
+        help="요청 사이 최소 간격(초, 전체 스레드 공유, 기본: 5)",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=3,
+        help="요청 실패 시 재시도 횟수 (기본: 3)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="응답 캐시(data/cache/google_trends)를 무시하고 전부 다시 요청",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=DEFAULT_TTL_HOURS,
+        help=f"이번 달이 포함된 요청의 캐시 유효 시간 (기본: {DEFAULT_TTL_HOURS:g}시간)",
+    )
+
+    args = parser.parse_args()
+
+    run_google_trend_crawl(
+        run_id=args.run_id,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        brands=args.brands,
+        limit_models=args.limit_models,
+        anchor_keyword=args.anchor_keyword,
+        geo=args.geo,
+        cat=args.cat,
+        workers=args.workers,
+        min_interval_sec=args.min_interval_sec,
+        max_retries=args.max_retries,
+        refresh=args.refresh,
+        cache_ttl_hours=args.cache_ttl_hours,
+    )
+
+
+if __name__ == "__main__":
+    main()
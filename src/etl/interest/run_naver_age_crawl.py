@@ -0,0 +1,315 @@
+# src/etl/interest/run_naver_age_crawl.py
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.api.naver_datalab_async import (
+    DEFAULT_DAILY_QUOTA,
+    AsyncNaverDatalabClient,
+    QuotaExceededError,
+)
+from src.api.naver_datalab_cache import DEFAULT_TTL_HOURS, DatalabCache
+from src.db.connection import get_engine
+from src.etl.interest.load_naver_interest_detail import (
+    DEFAULT_CHUNK_SIZE,
+    StreamingDetailLoader,
+)
+from src.etl.interest.naver_age_planner import (
+    AgeProgress,
+    fetch_sales_priority,
+    plan_age_batches,
+    prioritize_keywords,
+    summarize_age_plan,
+)
+from src.etl.interest.normalize_naver_detail import normalize_raw_row
+from src.etl.interest.run_naver_trend_crawl import (
+    DEFAULT_ANCHOR_KEYWORD,
+    FIELDNAMES,
+    fetch_target_models,
+    iter_batch_results,
+    rows_from_results,
+)
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+NAVER_RAW_BASE = BASE_DIR / "data" / "raw" / "naver"
+
+# 기본 device×gender 수집(run_naver_trend_crawl) 등 다른 작업용으로 남겨 둘 호출 수
+DEFAULT_RESERVE_CALLS = 100
+
+
+def run_naver_age_crawl(
+    run_id: str,
+    start_date: str,
+    end_date: str,
+    brands: Optional[List[str]] = None,
+    limit_models: Optional[int] = None,
+    anchor_keyword: str = DEFAULT_ANCHOR_KEYWORD,
+    daily_quota: int = DEFAULT_DAILY_QUOTA,
+    reserve_calls: int = DEFAULT_RESERVE_CALLS,
+    sales_months: int = 3,
+    concurrency: int = 4,
+    rate_per_sec: float = 5.0,
+    base_url: Optional[str] = None,
+    refresh: bool = False,
+    cache_ttl_hours: float = DEFAULT_TTL_HOURS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    tee_raw_csv: bool = False,
+    plan_only: bool = False,
+) -> None:
+    """
+    네이버 데이터랩 연령대별(ages) 관심도를 일일 한도 안에서 나눠 수집한다.
+
+    (모델, device, gender, 연령대 11개) 조합은 device×gender 수집의 11배 호출이 필요하므로
+      - 최근 sales_months 개월 판매량이 많은 모델부터
+      - 하루에 (daily_quota - reserve_calls) 회까지만 요청하고
+      - 끝난 조합은 data/raw/naver/naver_age_progress.json 에 기록해서 다음 날 이어서 수집한다.
+
+    결과는 model_monthly_interest_detail 에 age_group 라벨(예: '19-24')과 함께 바로 upsert 한다.
+    ratio 는 같은 (device, gender, age) 안에서 앵커 키워드 최고값 = 100 기준.
+    (model_monthly_interest 집계는 age_group 이 없는 행만 쓰므로 다시 집계할 필요 없음)
+    """
+    if brands is None:
+        brands = ["현대", "기아"]
+
+    print(
+        f"[INFO] 네이버 연령대별 수집 계획: run_id={run_id}, 기간={start_date} ~ {end_date}"
+    )
+
+    models = fetch_target_models(brands)
+    if limit_models is not None:
+        models = models[:limit_models]
+    if not models:
+        print("[WARN] 대상 모델이 없습니다. car_model 테이블을 확인하세요.")
+        return
+
+    models_by_keyword: Dict[str, List[dict]] = {}
+    for m in models:
+        models_by_keyword.setdefault(m["model_name_kr"], []).append(m)
+
+    sales = fetch_sales_priority([m["model_id"] for m in models], months=sales_months)
+    keywords = prioritize_keywords(models_by_keyword, sales)
+
+    progress = AgeProgress.load(start_date, end_date, anchor_keyword)
+    batches = plan_age_batches(keywords, progress)
+
+    daily_budget = daily_quota - reserve_calls
+    if daily_budget <= 0:
+        print(f"[ERROR] 일일 예산이 없습니다: daily_quota={daily_quota}, reserve_calls={reserve_calls}")
+        return
+
+    plan = summarize_age_plan(batches, len(keywords), daily_budget, progress.used_today())
+
+    print(
+        f"[INFO] 키워드 {len(keywords)}개 × 조합 → 전체 {plan['total_units']}개 "
+        f"(완료 {len(progress.done)}), 남은 API 호출 {plan['remaining_calls']}회"
+    )
+    print(
+        f"[INFO] 일일 예산 {daily_budget}회 (한도 {daily_quota} - 예비 {reserve_calls}), "
+        f"오늘 사용 {progress.used_today()}회 → 이번 실행 {plan['today_calls']}회, "
+        f"완료까지 약 {plan['estimated_days']}일"
+    )
+    top = [
+        f"{kw}({max(sales.get(m['model_id'], 0) for m in models_by_keyword[kw])})"
+        for kw in keywords[:5]
+    ]
+    print(f"[INFO] 우선순위 상위 (최근 {sales_months}개월 판매량): {', '.join(top)}")
+
+    today_batches = batches[: plan["today_calls"]]
+    if plan_only or not today_batches:
+        if not batches:
+            print("[INFO] 모든 연령대 조합 수집 완료.")
+        elif not today_batches:
+            print("[INFO] 오늘 예산을 다 썼습니다. 내일 다시 실행하세요.")
+        return
+
+    cache = DatalabCache(ttl_hours=cache_ttl_hours, refresh=refresh)
+    client = AsyncNaverDatalabClient(
+        base_url=base_url,
+        concurrency=concurrency,
+        rate_per_sec=rate_per_sec,
+        daily_quota=daily_budget - progress.used_today(),
+        cache=cache,
+    )
+
+    tee_path = NAVER_RAW_BASE / run_id / f"naver_trend_{run_id}_age.csv"
+    engine = get_engine(echo=False)
+
+    with engine.connect() as conn:
+        loader = StreamingDetailLoader(conn, chunk_size=chunk_size)
+        done_jobs = []
+
+        async def _run():
+            tee_file = None
+            writer = None
+            if tee_raw_csv:
+                tee_path.parent.mkdir(parents=True, exist_ok=True)
+                tee_file = tee_path.open("w", newline="", encoding="utf-8-sig")
+                writer = csv.DictWriter(tee_file, fieldnames=FIELDNAMES)
+                writer.writeheader()
+
+            done = 0
+            try:
+                async with client:
+                    async for job, results in iter_batch_results(
+                        client, today_batches, anchor_keyword, "month"
+                    ):
+                        done += 1
+                        print(
+                            f"[INFO] ({done}/{len(today_batches)}) device={job.device_label}, "
+                            f"gender={job.gender_label}, age={job.age_label}, 모델: {', '.join(job.keywords)}"
+                        )
+                        if results is None:
+                            continue
+
+                        for row in rows_from_results(job, results, models_by_keyword, {}):
+                            if writer is not None:
+                                writer.writerow(row)
+                            normalized = normalize_raw_row(row)
+                            if normalized is not None:
+                                loader.add(normalized)
+                        done_jobs.append(job)
+            except QuotaExceededError as e:
+                print(f"[ERROR] {e} → 남은 요청 중단 ({done}/{len(today_batches)} 완료)")
+            finally:
+                if tee_file is not None:
+                    tee_file.close()
+
+        try:
+            asyncio.run(_run())
+            loader.flush()
+            # DB 에 다 들어간 뒤에만 완료 처리
+            for job in done_jobs:
+                progress.mark_done(job)
+        finally:
+            # 실패해도 쓴 호출 수는 기록
+            progress.add_calls(client.call_count)
+            progress.save()
+
+    print("\n[SUMMARY] 네이버 연령대별 수집 결과")
+    print(f"  batches_done: {len(done_jobs)}/{len(today_batches)}")
+    print(f"  detail_rows: {loader.loaded_rows} (검증 실패 {loader.invalid_rows})")
+    print(f"  api_calls: {client.call_count} (재시도 {client.retry_count})")
+    print(f"  cache: hit={cache.hits}, miss={cache.misses}")
+    print(f"  progress: {len(progress.done)}/{plan['total_units']} 조합 완료")
+    if tee_raw_csv:
+        print(f"  raw_csv: {tee_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="네이버 데이터랩 연령대별 관심도 수집 (일일 한도 내 분할 수집, 진행 상태 유지)"
+    )
+    parser.add_argument("--run-id", required=True, help="수집 실행 ID (예: 25_11_16)")
+    parser.add_argument("--start-date", required=True, help="YYYY-MM-DD 형식 시작일")
+    parser.add_argument("--end-date", required=True, help="YYYY-MM-DD 형식 종료일")
+    parser.add_argument(
+        "--brands",
+        nargs="+",
+        default=["현대", "기아"],
+        help="대상 브랜드명 목록 (car_model.brand_name 기준, 기본: 현대 기아)",
+    )
+    parser.add_argument(
+        "--limit-models",
+        type=int,
+        default=None,
+        help="테스트용: 상위 N개 모델만 수집",
+    )
+    parser.add_argument(
+        "--anchor-keyword",
+        default=DEFAULT_ANCHOR_KEYWORD,
+        help=f"모든 배치에 함께 넣어 스케일을 맞출 기준 키워드 (기본: {DEFAULT_ANCHOR_KEYWORD})",
+    )
+    parser.add_argument(
+        "--daily-quota",
+        type=int,
+        default=DEFAULT_DAILY_QUOTA,
+        help=f"데이터랩 일일 호출 한도 (기본: {DEFAULT_DAILY_QUOTA})",
+    )
+    parser.add_argument(
+        "--reserve-calls",
+        type=int,
+        default=DEFAULT_RESERVE_CALLS,
+        help=f"다른 수집용으로 남겨 둘 일일 호출 수 (기본: {DEFAULT_RESERVE_CALLS})",
+    )
+    parser.add_argument(
+        "--sales-months",
+        type=int,
+        default=3,
+        help="우선순위에 쓸 최근 판매량 기간(개월, 기본: 3)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="동시에 보낼 최대 API 요청 수 (기본: 4)",
+    )
+    parser.add_argument(
+        "--rate-per-sec",
+        type=float,
+        default=5.0,
+        help="초당 최대 API 호출 수 (토큰 버킷, 기본: 5)",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="데이터랩 API 주소 변경 (테스트용 stub 서버 등)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="응답 캐시(data/cache/naver_datalab)를 무시하고 다시 요청",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=DEFAULT_TTL_HOURS,
+        help=f"이번 달이 포함된 요청의 캐시 유효 시간 (기본: {DEFAULT_TTL_HOURS:g}시간)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"한 번에 upsert 할 행 수 (기본: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--tee-raw-csv",
+        action="store_true",
+        help="raw CSV(naver_trend_<run_id>_age.csv)도 보관용으로 같이 기록",
+    )
+    parser.add_argument(
+        "--plan-only",
+        action="store_true",
+        help="남은 조합 / 오늘 호출 수 / 예상 일수만 출력하고 수집은 하지 않음",
+    )
+
+    args = parser.parse_args()
+
+    run_naver_age_crawl(
+        run_id=args.run_id,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        brands=args.brands,
+        limit_models=args.limit_models,
+        anchor_keyword=args.anchor_keyword,
+        daily_quota=args.daily_quota,
+        reserve_calls=args.reserve_calls,
+        sales_months=args.sales_months,
+        concurrency=args.concurrency,
+        rate_per_sec=args.rate_per_sec,
+        base_url=args.base_url,
+        refresh=args.refresh,
+        cache_ttl_hours=args.cache_ttl_hours,
+        chunk_size=args.chunk_size,
+        tee_raw_csv=args.tee_raw_csv,
+        plan_only=args.plan_only,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,55 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from sqlalchemy import text
 
-from src.api.naver_datalab import NaverDatalabClient
+from src.api.naver_datalab_cache import DEFAULT_TTL_HOURS, DatalabCache
+from src.api.naver_datalab_async import (
+    DEFAULT_DAILY_QUOTA,
+    AsyncNaverDatalabClient,
+    QuotaExceededError,
+)
 from src.db.connection import get_engine
+from src.etl.interest.aggregate_naver_interest import aggregate_naver_interest
+from src.etl.interest.load_naver_interest_detail import (
+    DEFAULT_CHUNK_SIZE,
+    StreamingDetailLoader,
+)
+from src.etl.interest.naver_trend_planner import (
+    CrawlJob,
+    LatestPoints,
+    fetch_latest_points,
+    month_start,
+    plan_jobs,
+    split_batches,
+    summarize_plan,
+)
+from src.etl.interest.normalize_naver_detail import normalize_raw_row
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
 NAVER_RAW_BASE = BASE_DIR / "data" / "raw" / "naver"
 
+# 모든 배치에 같이 넣어서 배치 간 스케일을 맞추는 기준 키워드
+DEFAULT_ANCHOR_KEYWORD = "자동차"
+
+FIELDNAMES = [
+    "model_id",
+    "brand_name",
+    "model_name",
+    "date",
+    "device",
+    "gender",
+    "age_group",
+    "ratio",
+]
+
 
 def fetch_target_models(brands: List[str]) -> List[dict]:
     """
@@ -55,14 +90,236 @@ def fetch_target_models(brands: List[str]) -> List[dict]:
     return models
 
 
+async def iter_batch_results(
+    client: AsyncNaverDatalabClient,
+    batches: List[CrawlJob],
+    anchor_keyword: str,
+    time_unit: str,
+) -> AsyncIterator[Tuple[CrawlJob, Optional[Dict[str, Any]]]]:
+    """
+    배치(CrawlJob) 요청을 동시에 보내고 끝나는 순서대로 (job, results) 를 yield 한다.
+    실패한 요청은 경고를 찍고 results=None.
+    동시 요청 수 / 호출 속도 제한은 client 가 맡는다.
+    """
+
+    async def _one(job: CrawlJob):
+        try:
+            results = await client.fetch_trend_anchored(
+                keywords=job.keywords,
+                anchor_keyword=anchor_keyword,
+                start_date=job.start_date,
+                end_date=job.end_date,
+                time_unit=time_unit,
+                device=job.device_code,
+                gender=job.gender_code,
+                ages=[job.age_code] if job.age_code else None,
+            )
+        except QuotaExceededError:
+            raise
+        except Exception as e:
+            print(
+                f"[WARN] 네이버 API 호출 실패: "
+                f"{job.keywords}, device={job.device_code}, gender={job.gender_code}, "
+                f"ages={job.age_code}, error={e}"
+            )
+            results = None
+        return job, results
+
+    tasks = [asyncio.create_task(_one(job)) for job in batches]
+
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for t in tasks:
+            t.cancel()
+
+
+def chain_points(
+    data_points: List[Dict[str, Any]],
+    model_id: int,
+    job: CrawlJob,
+    latest: LatestPoints,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    증분(tail) 요청 결과를 이미 저장된 값에 이어 붙인다.
+    겹치는 월(overlap_month, 확정된 체이닝 기준 월)의 저장값 / 새로 받은 값 비율로
+    나머지 월을 스케일하고 겹치는 월 자체는 다시 쓰지 않는다.
+    그 뒤 월(지난 실행 때 부분 집계였던 달, 이번 달 포함)은 새 값으로 덮어쓴다.
+    전체 기간 요청(overlap_month 없음)은 그대로 반환, 스케일할 수 없으면 None.
+    """
+    if job.overlap_month is None:
+        return data_points
+
+    stored = latest.get((model_id, job.device_label, job.gender_label))
+    fetched = next(
+        (
+            float(dp["ratio"])
+            for dp in data_points
+            if dp.get("period") and month_start(dp["period"]) == job.overlap_month
+        ),
+        None,
+    )
+    if stored is None or stored[0] != job.overlap_month or not fetched:
+        return None
+
+    factor = stored[1] / fetched
+    return [
+        {**dp, "ratio": round(float(dp["ratio"]) * factor, 5)}
+        for dp in data_points
+        if dp.get("period") and month_start(dp["period"]) > job.overlap_month
+    ]
+
+
+def rows_from_results(
+    job: CrawlJob,
+    results: Dict[str, Any],
+    models_by_keyword: Dict[str, List[dict]],
+    latest: LatestPoints,
+    skipped: Optional[List[Tuple[int, str, str]]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    배치 응답 하나를 raw CSV 한 줄(FIELDNAMES) 형태의 dict 로 풀어서 yield 한다.
+    job.model_ids 가 있으면 그 모델만 쓴다.
+    스케일할 수 없어 건너뛴 (model_id, device, gender) 는 skipped 에 모은다.
+    """
+    for keyword in job.keywords:
+        data_points = results.get(keyword) or []
+        if not data_points:
+            print(
+                f"[WARN] 네이버 데이터 없음: "
+                f"{keyword}, device={job.device_label}, gender={job.gender_label}"
+            )
+            continue
+
+        for m in models_by_keyword[keyword]:
+            if job.model_ids is not None and m["model_id"] not in job.model_ids:
+                continue
+
+            points = chain_points(data_points, m["model_id"], job, latest)
+            if points is None:
+                print(
+                    f"[WARN] 겹치는 월로 스케일 불가, 스킵 (--full 로 다시 수집): "
+                    f"{keyword}(model_id={m['model_id']}), "
+                    f"device={job.device_label}, gender={job.gender_label}"
+                )
+                if skipped is not None:
+                    skipped.append((m["model_id"], job.device_label, job.gender_label))
+                continue
+
+            for dp in points:
+                period = dp.get("period")
+                ratio = dp.get("ratio")
+                if period is None or ratio is None:
+                    continue
+
+                yield {
+                    "model_id": m["model_id"],
+                    "brand_name": m["brand_name"],
+                    "model_name": keyword,
+                    "date": period,
+                    "device": job.device_label,
+                    "gender": job.gender_label,
+                    "age_group": job.age_label,  # 연령 필터 없으면 빈 문자열
+                    "ratio": ratio,
+                }
+
+
+async def iter_raw_rows(
+    models_by_keyword: Dict[str, List[dict]],
+    batches: List[CrawlJob],
+    latest: LatestPoints,
+    anchor_keyword: str,
+    time_unit: str,
+    client: AsyncNaverDatalabClient,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    배치 응답을 받는 대로 raw CSV 한 줄(FIELDNAMES) 형태의 dict 로 풀어서 yield 한다.
+    일일 한도에 걸리면 남은 요청을 중단하고 끝낸다.
+    """
+    total = len(batches)
+    done = 0
+    skipped: List[Tuple[int, str, str]] = []
+    try:
+        async for job, results in iter_batch_results(
+            client, batches, anchor_keyword, time_unit
+        ):
+            done += 1
+            print(
+                f"[INFO] ({done}/{total}) device={job.device_label}, gender={job.gender_label}, "
+                f"기간={job.start_date}~{job.end_date}, 모델: {', '.join(job.keywords)}"
+            )
+            if results is None:
+                continue
+
+            for row in rows_from_results(job, results, models_by_keyword, latest, skipped):
+                yield row
+    except QuotaExceededError as e:
+        print(f"[ERROR] {e} → 남은 요청 중단 ({done}/{total} 완료)")
+
+    if skipped:
+        model_ids = sorted({model_id for model_id, _, _ in skipped})
+        print(
+            f"[WARN] 스케일 불가로 건너뛴 모델 {len(model_ids)}개 "
+            f"(device×gender {len(skipped)}건), --full 로 다시 수집 필요: model_id={model_ids}"
+        )
+
+
+async def _crawl_async(out_path: Path, raw_rows: AsyncIterator[Dict[str, Any]]) -> None:
+    with out_path.open("w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        async for row in raw_rows:
+            writer.writerow(row)
+
+
+async def _stream_async(
+    raw_rows: AsyncIterator[Dict[str, Any]],
+    loader: StreamingDetailLoader,
+    tee_path: Optional[Path] = None,
+) -> None:
+    """
+    스트리밍 모드: raw 행 → 정규화(generator) → detail 배치 upsert.
+    tee_path 가 있으면 raw 행을 그 CSV 에도 같이 기록한다(보관용).
+    """
+    tee_file = tee_path.open("w", newline="", encoding="utf-8-sig") if tee_path else None
+    try:
+        writer = None
+        if tee_file is not None:
+            writer = csv.DictWriter(tee_file, fieldnames=FIELDNAMES)
+            writer.writeheader()
+
+        async for row in raw_rows:
+            if writer is not None:
+                writer.writerow(row)
+            normalized = normalize_raw_row(row)
+            if normalized is not None:
+                loader.add(normalized)
+        loader.flush()
+    finally:
+        if tee_file is not None:
+            tee_file.close()
+
+
 def run_naver_trend_crawl(
     run_id: str,
     start_date: str,
     end_date: str,
     time_unit: str = "month",
     brands: Optional[List[str]] = None,
-    sleep_sec: float = 0.3,
     limit_models: Optional[int] = None,
+    anchor_keyword: str = DEFAULT_ANCHOR_KEYWORD,
+    concurrency: int = 4,
+    rate_per_sec: float = 5.0,
+    daily_quota: Optional[int] = DEFAULT_DAILY_QUOTA,
+    base_url: Optional[str] = None,
+    refresh: bool = False,
+    cache_ttl_hours: float = DEFAULT_TTL_HOURS,
+    full: bool = False,
+    plan_only: bool = False,
+    stream: bool = False,
+    tee_raw_csv: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> None:
     """
     car_model 기준으로 현대/기아 모델의 네이버 검색 트렌드를 수집하여
@@ -71,7 +328,32 @@ def run_naver_trend_crawl(
     이번 버전은 디바이스/성별 단위까지 상세히 수집:
       - device: pc / mobile
       - gender: male / female
-      - age_group: 현재는 필터 미사용 → 빈 문자열로 기록
+      - age_group: 연령 필터 미사용 → 빈 문자열로 기록 (연령대별은 run_naver_age_crawl)
+
+    요청 한 번에 모델 4개 + 앵커 키워드 1개(keywordGroups 최대 5개)를 묶어 보내고,
+    ratio 는 앵커 키워드의 기간 내 최고값 = 100 기준으로 다시 스케일해서 기록한다.
+    → 같은 device×gender 안에서는 모델 간 ratio 를 직접 비교할 수 있다.
+
+    증분 계획 (time_unit=month, full=False):
+      model_monthly_interest_detail 의 (model, device, gender) 별 체이닝 기준 월
+      (마지막 저장 월 이전의 확정된 월)부터만 다시 요청하고, 겹치는 월 값으로
+      기존 시계열에 이어 붙인다. 그 뒤 월(부분 집계였던 달, 이번 달)은 매번 덮어쓴다.
+      기준 월이 없는 모델은 전체 기간을 backfill 한다. 계획은 모델별로 세운다.
+      실행 전에 계획된 API 호출 수를 출력하고, plan_only=True 면 여기서 멈춘다.
+
+    요청은 AsyncNaverDatalabClient 로 최대 concurrency 개씩 동시에 보내고,
+    rate_per_sec / daily_quota 토큰 버킷으로 호출 속도를 제한한다.
+    (base_url: 테스트용 stub 서버 주소)
+
+    응답은 data/cache/naver_datalab 에 요청 body 해시로 캐시된다.
+    지난달까지의 기간은 다시 요청하지 않고, 이번 달이 포함된 요청은
+    cache_ttl_hours 이후에 다시 요청한다. refresh=True 면 캐시를 무시한다.
+
+    stream=True 면 raw CSV → 정규화 CSV → 적재 CSV 를 거치지 않고
+    수집한 데이터 포인트를 바로 정규화해서 model_monthly_interest_detail 에
+    chunk_size 행씩 upsert 하고, 마지막에 적재한 월/모델 범위만 model_monthly_interest 로 집계한다.
+    (normalize_naver_detail → load_naver_interest_detail → aggregate_naver_interest 를 한 번에)
+    이때 raw CSV 는 tee_raw_csv=True 일 때만 보관용으로 같이 기록한다.
     """
     if brands is None:
         brands = ["현대", "기아"]
@@ -89,104 +371,99 @@ def run_naver_trend_crawl(
         print("[WARN] 대상 모델이 없습니다. car_model 테이블을 확인하세요.")
         return
 
-    print(f"[INFO] 수집 대상 모델 수: {len(models)}")
+    # 같은 모델명이 여러 model_id 에 걸려 있어도 키워드는 한 번만 요청
+    models_by_keyword: Dict[str, List[dict]] = {}
+    for m in models:
+        models_by_keyword.setdefault(m["model_name_kr"], []).append(m)
 
-    client = NaverDatalabClient()
+    if time_unit != "month" and not full:
+        # detail 테이블은 월 단위라 증분 계획은 month 에서만 의미가 있음
+        print(f"[INFO] time_unit={time_unit} → 증분 계획 없이 전체 기간 수집")
+        full = True
 
-    # 디바이스/성별 조합 정의
-    # 네이버에 보낼 코드와 CSV에 저장할 라벨을 분리
-    device_options: List[Tuple[Optional[str], str]] = [
-        ("pc", "pc"),
-        ("mo", "mobile"),
-    ]
-    gender_options: List[Tuple[Optional[str], str]] = [
-        ("m", "male"),
-        ("f", "female"),
-    ]
+    latest = {} if full else fetch_latest_points([m["model_id"] for m in models])
+    jobs = plan_jobs(models_by_keyword, start_date, end_date, latest, full=full)
+    batches = split_batches(jobs, anchor_keyword)
+    plan = summarize_plan(batches)
+
+    print(f"[INFO] 수집 대상 모델 수: {len(models)} (키워드 {len(models_by_keyword)}개)")
+    print(
+        f"[INFO] 앵커 키워드: {anchor_keyword}, 계획된 API 호출 수: {plan['planned_calls']} "
+        f"(전체 기간 backfill {plan['backfill_calls']}, 증분 {plan['tail_calls']})"
+    )
+    print(
+        f"[INFO] concurrency={concurrency}, rate={rate_per_sec}/s, daily_quota={daily_quota}"
+    )
+
+    if plan_only or not batches:
+        if not batches:
+            print("[INFO] 새로 수집할 구간이 없습니다.")
+        return
 
     # 출력 디렉토리 및 파일 준비
     out_dir = NAVER_RAW_BASE / run_id
-    out_dir.mkdir(parents=True, exist_ok=True)
-
     out_path = out_dir / f"naver_trend_{run_id}.csv"
+    if not stream or tee_raw_csv:
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    cache = DatalabCache(ttl_hours=cache_ttl_hours, refresh=refresh)
+    client = AsyncNaverDatalabClient(
+        base_url=base_url,
+        concurrency=concurrency,
+        rate_per_sec=rate_per_sec,
+        daily_quota=daily_quota,
+        cache=cache,
+    )
 
-    fieldnames = [
-        "model_id",
-        "brand_name",
-        "model_name",
-        "date",
-        "device",
-        "gender",
-        "age_group",
-        "ratio",
-    ]
+    def _raw_rows() -> AsyncIterator[Dict[str, Any]]:
+        return iter_raw_rows(
+            models_by_keyword, batches, latest, anchor_keyword, time_unit, client
+        )
 
-    with out_path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    if not stream:
 
-        total_calls = 0
+        async def _run():
+            async with client:
+                await _crawl_async(out_path, _raw_rows())
 
-        for idx, m in enumerate(models, start=1):
-            model_id = m["model_id"]
-            brand_name = m["brand_name"]
-            model_name = m["model_name_kr"]
+        asyncio.run(_run())
 
-            print(
-                f"[INFO] ({idx}/{len(models)}) 모델 처리 중: [{brand_name}] {model_name} (model_id={model_id})"
-            )
+        print(f"[INFO] 네이버 데이터랩 수집 완료: {out_path}")
+    else:
+        engine = get_engine(echo=False)
+        started = time.perf_counter()
 
-            for device_code, device_label in device_options:
-                for gender_code, gender_label in gender_options:
-                    try:
-                        data_points = client.fetch_trend(
-                            keyword=model_name,
-                            start_date=start_date,
-                            end_date=end_date,
-                            time_unit=time_unit,
-                            device=device_code,
-                            gender=gender_code,
-                            ages=None,  # 나이 필터는 지금은 사용하지 않음
-                        )
-                        total_calls += 1
-                    except Exception as e:
-                        print(
-                            f"[WARN] 네이버 API 호출 실패: "
-                            f"[{brand_name}] {model_name}, device={device_code}, gender={gender_code}, error={e}"
-                        )
-                        continue
-
-                    if not data_points:
-                        print(
-                            f"[WARN] 네이버 데이터 없음: "
-                            f"[{brand_name}] {model_name}, device={device_code}, gender={gender_code}"
-                        )
-                        continue
-
-                    for dp in data_points:
-                        period = dp.get("period")
-                        ratio = dp.get("ratio")
-                        if period is None or ratio is None:
-                            continue
-
-                        writer.writerow(
-                            {
-                                "model_id": model_id,
-                                "brand_name": brand_name,
-                                "model_name": model_name,
-                                "date": period,
-                                "device": device_label,
-                                "gender": gender_label,
-                                "age_group": "",  # 추후 ages 사용 시 여기 채우면 됨
-                                "ratio": ratio,
-                            }
-                        )
-
-                    if sleep_sec > 0:
-                        time.sleep(sleep_sec)
-
-    print(f"[INFO] 네이버 데이터랩 수집 완료: {out_path}")
-    print(f"[INFO] 총 API 호출 수: {total_calls}")
+        with engine.connect() as conn:
+            loader = StreamingDetailLoader(conn, chunk_size=chunk_size)
+
+            async def _run():
+                async with client:
+                    await _stream_async(
+                        _raw_rows(), loader, out_path if tee_raw_csv else None
+                    )
+
+            asyncio.run(_run())
+
+            affected = 0
+            if loader.loaded_rows:
+                affected = aggregate_naver_interest(
+                    conn,
+                    months=sorted(loader.months),
+                    model_ids=sorted(loader.model_ids),
+                )
+                conn.commit()
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"[INFO] 스트리밍 적재 완료: detail {loader.loaded_rows}행 "
+            f"(검증 실패 {loader.invalid_rows}), 월 {len(loader.months)}개 × 모델 {len(loader.model_ids)}개 "
+            f"→ model_monthly_interest affected_rows={affected}, {elapsed:.3f}s"
+        )
+        if tee_raw_csv:
+            print(f"[INFO] raw CSV 보관: {out_path}")
+
+    print(f"[INFO] 총 API 호출 수: {client.call_count} (재시도 {client.retry_count})")
+    print(f"[INFO] 캐시 hit={cache.hits}, miss={cache.misses} (refresh={refresh})")
 
 
 def main():
@@ -215,10 +492,69 @@ def main():
         help="테스트용: 상위 N개 모델만 수집",
     )
     parser.add_argument(
-        "--sleep-sec",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="동시에 보낼 최대 API 요청 수 (기본: 4)",
+    )
+    parser.add_argument(
+        "--rate-per-sec",
         type=float,
-        default=0.3,
-        help="모델×필터 조합별 API 호출 사이 딜레이(초)",
+        default=5.0,
+        help="초당 최대 API 호출 수 (토큰 버킷, 기본: 5)",
+    )
+    parser.add_argument(
+        "--daily-quota",
+        type=int,
+        default=DEFAULT_DAILY_QUOTA,
+        help=f"이번 실행에서 쓸 최대 호출 수 (일일 한도, 기본: {DEFAULT_DAILY_QUOTA})",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="데이터랩 API 주소 변경 (테스트용 stub 서버 등)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="응답 캐시(data/cache/naver_datalab)를 무시하고 전부 다시 요청",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=DEFAULT_TTL_HOURS,
+        help=f"이번 달이 포함된 요청의 캐시 유효 시간 (기본: {DEFAULT_TTL_HOURS:g}시간)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="증분 계획 없이 모든 모델을 --start-date ~ --end-date 전체 기간으로 수집",
+    )
+    parser.add_argument(
+        "--plan-only",
+        action="store_true",
+        help="계획된 API 호출 수만 출력하고 수집은 하지 않음",
+    )
+    parser.add_argument(
+        "--anchor-keyword",
+        default=DEFAULT_ANCHOR_KEYWORD,
+        help=f"모든 배치에 함께 넣어 스케일을 맞출 기준 키워드 (기본: {DEFAULT_ANCHOR_KEYWORD})",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="CSV 를 거치지 않고 수집 → 정규화 → detail 적재 → 범위 집계를 한 번에 실행",
+    )
+    parser.add_argument(
+        "--tee-raw-csv",
+        action="store_true",
+        help="--stream 모드에서도 raw CSV(naver_trend_<run_id>.csv)를 보관용으로 같이 기록",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"--stream 모드에서 한 번에 upsert 할 행 수 (기본: {DEFAULT_CHUNK_SIZE})",
     )
 
     args = parser.parse_args()
@@ -229,8 +565,19 @@ def main():
         end_date=args.end_date,
         time_unit=args.time_unit,
         brands=args.brands,
-        sleep_sec=args.sleep_sec,
         limit_models=args.limit_models,
+        anchor_keyword=args.anchor_keyword,
+        concurrency=args.concurrency,
+        rate_per_sec=args.rate_per_sec,
+        daily_quota=args.daily_quota,
+        base_url=args.base_url,
+        refresh=args.refresh,
+        cache_ttl_hours=args.cache_ttl_hours,
+        full=args.full,
+        plan_only=args.plan_only,
+        stream=args.stream,
+        tee_raw_csv=args.tee_raw_csv,
+        chunk_size=args.chunk_size,
     )
 
 
@@ -0,0 +1,136 @@
+# src/etl/sales/bench_danawa_normalizer.py
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from src.etl.sales.danawa_normalizer import normalize_file
+from src.etl.sales.danawa_normalizer_vectorized import normalize_file_vectorized
+
+
+MODEL_NAMES = ["카니발", "스포티지", "쏘렌토", "아반떼", "그랜저", "아이오닉 5", "EV3"]
+
+
+def _change_str(rng: random.Random) -> str:
+    """전월/전년대비 원문 텍스트 (크롤러가 저장하는 여러 형태를 섞는다)"""
+    kind = rng.randrange(6)
+    base = rng.randrange(0, 20000)
+    diff = rng.randrange(0, 5000)
+    if kind == 0:
+        return f"{base} {diff}▲"
+    if kind == 1:
+        return f"{base} {diff}▼"
+    if kind == 2:
+        return f"{diff:,}▼"
+    if kind == 3:
+        return "-"
+    if kind == 4:
+        return ""
+    return f"-{diff}"
+
+
+# 판매량 / 증감 셀의 유니코드 예외 케이스 (행 단위 결과와 같아야 한다)
+UNICODE_SALES = ["１２대", "1,2\xa034대", "\u20039,118대"]
+UNICODE_CHANGES = ["9118\xa0697▲", "12\xa03▼", "\u3000５▲\u3000", "１２ ３▼"]
+
+
+def write_synthetic_raw(path: Path, rows: int, seed: int = 42) -> None:
+    """
+    raw 판매량 CSV 형식(7컬럼)을 기본으로, 6컬럼 행/빈 행/
+    판매량 없는 행/유니코드 공백·숫자 셀 같은 예외 케이스를 섞은 합성 파일 생성.
+    """
+    rng = random.Random(seed)
+
+    with path.open("w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(["순위", "", "모델명", "판매량", "점유율", "전월대비", "전년대비"])
+        for i in range(rows):
+            rank = str(i % 60 + 1)
+            model = rng.choice(MODEL_NAMES)
+            sales = f"{rng.randrange(0, 30000):,}대" if rng.random() > 0.01 else "-"
+            share = f"{rng.random() * 30:.1f}%" if rng.random() > 0.05 else ""
+            mom = _change_str(rng)
+            yoy = _change_str(rng)
+
+            r = rng.random()
+            if r < 0.002:
+                # NBSP / 전각 숫자·공백 셀 (파이썬 str 기준 공백/숫자와 RE2 기준이 다른 경우)
+                writer.writerow(
+                    [f"\u3000{rank}", "", f"{model}\xa0", rng.choice(UNICODE_SALES), share,
+                     rng.choice(UNICODE_CHANGES), rng.choice(UNICODE_CHANGES)]
+                )
+            elif r < 0.01:
+                writer.writerow([])
+            elif r < 0.05:
+                writer.writerow([rank, model, sales, share, mom, yoy])
+            elif r < 0.06:
+                writer.writerow([rank, "", model])
+            else:
+                writer.writerow([f" {rank} ", "", model, sales, share, mom, yoy])
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(rows: int, repeat: int, work_dir: Path) -> None:
+    raw_path = work_dir / "bench_model_sales_2025_01_00.csv"
+    rowwise_out = work_dir / "rowwise_normalized.csv"
+    vectorized_out = work_dir / "vectorized_normalized.csv"
+
+    write_synthetic_raw(raw_path, rows)
+    print(f"[INFO] 합성 raw CSV 생성: {raw_path} ({rows} rows)")
+
+    # 벤치마크 파일은 Parquet staging 데이터셋에 쓰지 않는다
+    t_row = _time(lambda: normalize_file(raw_path, rowwise_out, stage=False), repeat)
+    t_vec = _time(
+        lambda: normalize_file_vectorized(raw_path, vectorized_out, stage=False), repeat
+    )
+
+    identical = rowwise_out.read_bytes() == vectorized_out.read_bytes()
+
+    print("\n[SUMMARY] 다나와 정규화 벤치마크 (best of {})".format(repeat))
+    print(f"  rows: {rows}")
+    print(f"  row-wise:   {t_row:.3f}s ({rows / t_row:,.0f} rows/s)")
+    print(f"  vectorized: {t_vec:.3f}s ({rows / t_vec:,.0f} rows/s)")
+    print(f"  speedup: x{t_row / t_vec:.2f}")
+    print(f"  byte-identical: {identical}")
+
+    if not identical:
+        raise SystemExit("[ERROR] 행 단위 / 벡터화 결과가 다릅니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다나와 정규화: 행 단위 vs 벡터화 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="합성 raw 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument(
+        "--work-dir",
+        type=str,
+        default=None,
+        help="합성 파일 저장 경로 (기본: 임시 디렉토리)",
+    )
+    args = parser.parse_args()
+
+    if args.work_dir:
+        work_dir = Path(args.work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        run_benchmark(args.rows, args.repeat, work_dir)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            run_benchmark(args.rows, args.repeat, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# src/etl/sales/danawa_manifest.py
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    # 로더에서도 manifest를 읽으므로 selenium import 는 피한다.
+    from src.etl.sales.danawa_scraper import DanawaRow
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+DANAWA_RAW_BASE = BASE_DIR / "data" / "raw" / "danawa"
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def manifest_path(run_id: str) -> Path:
+    """
+    data/raw/danawa/<run_id>/manifest.json
+    """
+    return DANAWA_RAW_BASE / run_id / MANIFEST_FILENAME
+
+
+def job_key(month: str, brand: str) -> str:
+    """
+    (month, brand) 작업 식별자. 예: '2023-01-00|hyundai'
+    """
+    return f"{month}|{brand}"
+
+
+def compute_rows_hash(rows: List[DanawaRow]) -> str:
+    """
+    크롤링 결과 행들의 내용 해시(sha256).
+    판매량/메타 CSV에 저장되는 값만 사용하므로
+    같은 데이터면 run_id가 달라도 같은 해시가 나온다.
+    """
+    h = hashlib.sha256()
+    for r in rows:
+        line = "\t".join(
+            [
+                r.rank,
+                r.model_name,
+                r.sales,
+                r.share,
+                r.mom,
+                r.yoy,
+                r.detail_url or "",
+                r.image_url or "",
+            ]
+        )
+        h.update(line.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def load_manifest(run_id: str) -> Dict[str, Any]:
+    """
+    manifest.json 을 읽는다. 없으면 빈 manifest 반환.
+    """
+    path = manifest_path(run_id)
+    if not path.exists():
+        return {"run_id": run_id, "jobs": {}}
+
+    with path.open("r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    data.setdefault("run_id", run_id)
+    data.setdefault("jobs", {})
+    return data
+
+
+def save_manifest(manifest: Dict[str, Any]) -> None:
+    """
+    임시 파일에 쓴 뒤 교체해서, 저장 도중 죽어도 manifest가 깨지지 않게 한다.
+    """
+    path = manifest_path(manifest["run_id"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_suffix(".json.tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_job_completed(manifest: Dict[str, Any], month: str, brand: str) -> bool:
+    job = manifest["jobs"].get(job_key(month, brand))
+    return bool(job) and job.get("status") == "done"
+
+
+def find_previous_hash(run_id: str, month: str, brand: str) -> Optional[str]:
+    """
+    현재 run_id를 제외한 다른 run 들의 manifest 중
+    같은 (month, brand) 작업을 가장 최근에 완료한 기록의 content_hash 반환.
+    """
+    if not DANAWA_RAW_BASE.exists():
+        return None
+
+    key = job_key(month, brand)
+    latest_at = ""
+    latest_hash: Optional[str] = None
+
+    for run_dir in DANAWA_RAW_BASE.iterdir():
+        if not run_dir.is_dir() or run_dir.name == run_id:
+            continue
+        path = run_dir / MANIFEST_FILENAME
+        if not path.exists():
+            continue
+
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                other = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] manifest 읽기 실패, 스킵: {path}, error={e}")
+            continue
+
+        job = (other.get("jobs") or {}).get(key)
+        if not job or job.get("status") != "done":
+            continue
+
+        completed_at = job.get("completed_at") or ""
+        if completed_at >= latest_at:
+            latest_at = completed_at
+            latest_hash = job.get("content_hash")
+
+    return latest_hash
+
+
+def record_job(
+    manifest: Dict[str, Any],
+    month: str,
+    brand: str,
+    rows: List[DanawaRow],
+    sales_file: Optional[str],
+    meta_file: Optional[str],
+) -> Dict[str, Any]:
+    """
+    완료된 (month, brand) 작업을 manifest에 기록하고 바로 저장한다.
+    이전 run과 content_hash가 같으면 unchanged=True 로 표시한다.
+    """
+    content_hash = compute_rows_hash(rows)
+    previous_hash = find_previous_hash(manifest["run_id"], month, brand)
+
+    job = {
+        "month": month,
+        "brand": brand,
+        "status": "done",
+        "row_count": len(rows),
+        "content_hash": content_hash,
+        "unchanged": previous_hash is not None and previous_hash == content_hash,
+        "sales_file": sales_file,
+        "meta_file": meta_file,
+        "completed_at": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+    manifest["jobs"][job_key(month, brand)] = job
+    save_manifest(manifest)
+    return job
+
+
+def load_unchanged_jobs(run_id: str) -> Set[Tuple[str, str]]:
+    """
+    로더용: 이전 run과 내용이 같아서 unchanged로 표시된 작업의
+    (brand, month_date) 집합. month_date 는 staging 파티션과 같은 'YYYY-MM-01'.
+    manifest가 없으면 빈 집합 (= 전부 적재 대상).
+    """
+    manifest = load_manifest(run_id)
+    jobs: Set[Tuple[str, str]] = set()
+    for job in manifest["jobs"].values():
+        if not job.get("unchanged"):
+            continue
+        # manifest month 는 다나와 URL 형식 'YYYY-MM-00'
+        month_date = job["month"][:7] + "-01"
+        jobs.add((job["brand"].lower(), month_date))
+    return jobs
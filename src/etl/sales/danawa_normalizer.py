@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+import argparse
 import csv
 import os
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.etl.sales.danawa_parquet import (
+    stage_meta_csv,
+    stage_sales_frame,
+    staged_path_for,
+)
+
+
+# 행 단위 / 벡터화 경로가 같이 쓰는 패턴 (모듈 로드 시 한 번만 컴파일)
+DIGITS_RE = re.compile(r"\d+")
+SHARE_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+NORMALIZED_HEADER = ["순위", "모델명", "판매량", "점유율", "전월대비", "전년대비"]
 
 
 def parse_int_from_str(s: str) -> Optional[int]:
@@ -19,7 +35,7 @@ def parse_int_from_str(s: str) -> Optional[int]:
     s = s.strip()
     if not s:
         return None
-    digits = re.findall(r"\d+", s.replace(",", ""))
+    digits = DIGITS_RE.findall(s.replace(",", ""))
     if not digits:
         return None
     return int("".join(digits))
@@ -34,6 +50,7 @@ def parse_change_field(s: str) -> Optional[int]:
       '9118 697▲'  -> +697
       '6578 351▼'  -> -351
       '0 9815▲'    -> +9815
+      '-351'       -> -351  (이미 정규화된 값)
       ''           -> None
     """
     if not s:
@@ -60,8 +77,11 @@ def parse_change_field(s: str) -> Optional[int]:
         sign = -1
     elif "▲" in diff_part:
         sign = 1
+    elif diff_part.startswith("-"):
+        # 이미 정규화된 값('-351')을 다시 정규화해도 부호가 유지되도록
+        sign = -1
 
-    digits = re.findall(r"\d+", diff_part.replace(",", ""))
+    digits = DIGITS_RE.findall(diff_part.replace(",", ""))
     if not digits:
         return None
 
@@ -116,7 +136,7 @@ def normalize_row(raw_row: List[str]) -> Optional[List[str]]:
     # 점유율: 숫자(실수)만 남기기 (예: '17.7%', '17.7 %' → '17.7')
     share_ratio = ""
     if share_str:
-        m = re.search(r"-?\d+(?:\.\d+)?", share_str.replace(",", ""))
+        m = SHARE_RE.search(share_str.replace(",", ""))
         if m:
             share_ratio = m.group(0)
 
@@ -138,75 +158,240 @@ def normalize_row(raw_row: List[str]) -> Optional[List[str]]:
     ]
 
 
-def normalize_folder(folder_path: Path) -> None:
+def normalized_output_path(input_path: Path) -> Path:
     """
-    한 브랜드 폴더(hyundai/ 또는 kia/) 안에 있는
-    판매량 CSV(원본 또는 nomalized/normalized 둘 다)를 읽어서
-    *_normalized.csv로 다시 저장한다.
+    판매량 CSV 경로 → 대응하는 *_normalized.csv 경로.
+    """
+    filename = input_path.name
+    if filename.endswith("_normalized.csv"):
+        return input_path  # 덮어쓰기
+    if filename.endswith("_nomalized.csv"):
+        # 팀원이 만든 오타 버전 → 이름 통일하면서 새 파일 생성
+        return input_path.with_name(
+            filename.replace("_nomalized.csv", "_normalized.csv")
+        )
+    return input_path.with_name(filename.replace(".csv", "_normalized.csv"))
+
+
+def source_priority(input_path: Path) -> int:
+    """
+    같은 *_normalized.csv 로 가는 입력이 여럿일 때 고르는 순서 (작을수록 우선).
+    크롤러 원본(0) > 팀원 nomalized 오타 버전(1) > 이전에 만든 normalized(2)
+    """
+    filename = input_path.name
+    if filename.endswith("_normalized.csv"):
+        return 2
+    if filename.endswith("_nomalized.csv"):
+        return 1
+    return 0
+
 
-    - *_normalized.csv 파일은 이 함수로 "다시" 덮어써도 된다.
-    - 메타 CSV(*_meta_*.csv)는 건너뛴다.
+def is_up_to_date(input_path: Path, output_path: Optional[Path]) -> bool:
+    """
+    출력 파일이 이미 있고 원본보다 최신(mtime)이면 다시 정규화할 필요 없음.
+    이미 normalized 인 파일(입력 == 출력)은 항상 최신으로 본다.
     """
-    print(f"\n[INFO] 폴더 정규화 시작: {folder_path}")
+    if output_path is None:
+        return False
+    if input_path == output_path:
+        return True
+    if not output_path.exists():
+        return False
+    return output_path.stat().st_mtime >= input_path.stat().st_mtime
 
-    for filename in os.listdir(folder_path):
-        if not filename.endswith(".csv"):
-            continue
-        if "_meta_" in filename:
-            # 메타 정보 CSV는 정규화 대상이 아님
-            continue
 
-        input_path = folder_path / filename
+def needs_normalize(input_path: Path, output_path: Path, write_csv: bool = True) -> bool:
+    """
+    증분 모드 판정: normalized CSV(write_csv 일 때)와 Parquet staging 중
+    하나라도 원본보다 오래됐거나 없으면 다시 정규화한다.
+    (data/raw/danawa 밖의 파일은 staging 대상이 아니므로 CSV 만 본다)
+    """
+    if write_csv and not is_up_to_date(input_path, output_path):
+        return True
+    staged = staged_path_for(input_path)
+    if staged is None:
+        return False
+    return not is_up_to_date(input_path, staged)
+
+
+def normalize_file(
+    input_path: Path,
+    output_path: Optional[Path] = None,
+    write_csv: bool = True,
+    stage: bool = True,
+) -> bool:
+    """
+    판매량 CSV 한 개를 정규화해서 *_normalized.csv 로 저장하고,
+    같은 결과를 Parquet staging 데이터셋(run_id/brand/month 파티션)에도 쓴다.
+    write_csv=False 면 Parquet 만, stage=False 면 CSV 만 쓴다. (벤치마크 등)
+    저장했으면 True, 정규화 결과가 비어 있으면 False.
+    """
+    if output_path is None:
+        output_path = normalized_output_path(input_path)
 
-        # 출력 파일명: *_normalized.csv 로 통일
-        if filename.endswith("_normalized.csv"):
-            output_path = input_path  # 덮어쓰기
-        elif filename.endswith("_nomalized.csv"):
-            # 팀원이 만든 오타 버전 → 이름 통일하면서 새 파일 생성
-            output_path = folder_path / filename.replace(
-                "_nomalized.csv", "_normalized.csv"
-            )
-        else:
-            output_path = folder_path / filename.replace(".csv", "_normalized.csv")
+    print(f"[INFO] 파일 처리: {input_path} -> {output_path}")
 
-        print(f"[INFO] 파일 처리: {input_path} -> {output_path}")
+    normalized_rows: List[List[str]] = []
 
-        normalized_rows: List[List[str]] = []
+    with input_path.open("r", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        try:
+            header = next(reader)
+        except StopIteration:
+            return False
 
-        with input_path.open("r", encoding="utf-8-sig") as f:
-            reader = csv.reader(f)
-            try:
-                header = next(reader)
-            except StopIteration:
+        for row in reader:
+            if not row:
                 continue
+            norm = normalize_row(row)
+            if norm is None:
+                continue
+            normalized_rows.append(norm)
 
-            for row in reader:
-                if not row:
-                    continue
-                norm = normalize_row(row)
-                if norm is None:
-                    continue
-                normalized_rows.append(norm)
-
-        if not normalized_rows:
-            print(f"[WARN] 정규화 결과가 비어 있음: {input_path}")
-            continue
+    if not normalized_rows:
+        print(f"[WARN] 정규화 결과가 비어 있음: {input_path}")
+        return False
 
+    if write_csv:
         with output_path.open("w", newline="", encoding="utf-8-sig") as f:
             writer = csv.writer(f)
             # 최종 정규화 헤더
-            writer.writerow(
-                ["순위", "모델명", "판매량", "점유율", "전월대비", "전년대비"]
-            )
+            writer.writerow(NORMALIZED_HEADER)
             writer.writerows(normalized_rows)
 
         print(f"[INFO] 저장 완료: {output_path}")
 
+    if stage:
+        stage_sales_frame(
+            input_path, pd.DataFrame(normalized_rows, columns=NORMALIZED_HEADER)
+        )
+    return True
 
-# if __name__ == "__main__":
-#     base_dir = Path(__file__).resolve().parents[3]
-#     # folder = base_dir / "data" / "raw" / "danawa" / "25_11_14" / "hyundai"
-#     # normalize_folder(folder)
 
-#     folder = base_dir / "data" / "raw" / "danawa" / "25_11_14" / "kia"
-#     normalize_folder(folder)
+def normalize_folder(
+    folder_path: Path,
+    full: bool = False,
+    vectorized: bool = False,
+    write_csv: bool = True,
+) -> Dict[str, int]:
+    """
+    한 브랜드 폴더(hyundai/ 또는 kia/) 안에 있는
+    판매량 CSV(원본 또는 nomalized/normalized 둘 다)를 읽어서
+    *_normalized.csv로 다시 저장한다.
+
+    - 정규화 결과는 Parquet staging 데이터셋에도 저장된다 (danawa_parquet).
+      write_csv=False 면 *_normalized.csv 는 쓰지 않는다.
+    - 기본은 증분 모드: 출력 파일이 원본보다 최신이면 건너뛴다.
+    - full=True 면 *_normalized.csv 까지 포함해 전부 다시 정규화한다.
+    - 같은 출력 파일로 가는 입력이 여럿이면 source_priority 로 하나만 쓴다.
+    - vectorized=True 면 대상 파일들을 pandas로 한 번에 정규화한다.
+      (danawa_normalizer_vectorized, 결과 파일은 행 단위 경로와 동일)
+    - 메타 CSV(*_meta_*.csv)는 정규화 없이 Parquet staging 만 한다.
+
+    반환: {"processed": n, "skipped": n, "empty": n, "meta_staged": n}
+    """
+    print(f"\n[INFO] 폴더 정규화 시작: {folder_path} (full={full})")
+
+    counters = {"processed": 0, "skipped": 0, "empty": 0, "meta_staged": 0}
+    # 출력 경로 → 입력 경로. X.csv 와 (오래된) X_normalized.csv 가 같이 있으면
+    # 둘 다 X_normalized.csv 로 가므로 원본 하나만 남긴다. (나중 것이 덮어쓰는 문제 방지)
+    sources: Dict[Path, Path] = {}
+
+    for filename in sorted(os.listdir(folder_path)):
+        if not filename.endswith(".csv"):
+            continue
+
+        input_path = folder_path / filename
+
+        if "_meta_" in filename:
+            # 메타 정보 CSV는 정규화 대상이 아님 → staging 만
+            if full or not is_up_to_date(input_path, staged_path_for(input_path)):
+                if stage_meta_csv(input_path):
+                    counters["meta_staged"] += 1
+            continue
+
+        output_path = normalized_output_path(input_path)
+        current = sources.get(output_path)
+        if current is None or source_priority(input_path) < source_priority(current):
+            sources[output_path] = input_path
+
+    jobs: List[Tuple[Path, Path]] = []
+    for output_path, input_path in sorted(sources.items(), key=lambda kv: kv[1].name):
+        if not full and not needs_normalize(input_path, output_path, write_csv):
+            counters["skipped"] += 1
+            continue
+
+        jobs.append((input_path, output_path))
+
+    if vectorized:
+        from src.etl.sales.danawa_normalizer_vectorized import (
+            normalize_files_vectorized,
+        )
+
+        results = normalize_files_vectorized(jobs, write_csv=write_csv)
+    else:
+        results = [normalize_file(inp, out, write_csv=write_csv) for inp, out in jobs]
+
+    for ok in results:
+        if ok:
+            counters["processed"] += 1
+        else:
+            counters["empty"] += 1
+
+    print(
+        f"[INFO] 폴더 정규화 완료: processed={counters['processed']}, "
+        f"skipped={counters['skipped']}, empty={counters['empty']}, "
+        f"meta_staged={counters['meta_staged']}"
+    )
+    return counters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다나와 판매량 CSV 정규화")
+    parser.add_argument("--run-id", required=True, help="다나와 수집 실행 ID (예: 25_11_14)")
+    parser.add_argument(
+        "--brands",
+        nargs="+",
+        default=["hyundai", "kia"],
+        help="대상 브랜드 코드 (예: hyundai kia)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="mtime과 상관없이 폴더 전체를 다시 정규화",
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="pandas 벡터화 경로로 정규화 (대량 파일/행에 유리)",
+    )
+    parser.add_argument(
+        "--no-csv",
+        action="store_true",
+        help="*_normalized.csv 는 쓰지 않고 Parquet staging 데이터셋만 갱신",
+    )
+    args = parser.parse_args()
+
+    base_dir = Path(__file__).resolve().parents[3]
+    totals = {"processed": 0, "skipped": 0, "empty": 0, "meta_staged": 0}
+    for brand in args.brands:
+        folder = base_dir / "data" / "raw" / "danawa" / args.run_id / brand
+        if not folder.exists():
+            print(f"[WARN] 브랜드 디렉토리 없음: {folder}")
+            continue
+        counters = normalize_folder(
+            folder,
+            full=args.full,
+            vectorized=args.vectorized,
+            write_csv=not args.no_csv,
+        )
+        for k, v in counters.items():
+            totals[k] += v
+
+    print("\n[SUMMARY] 다나와 정규화 결과")
+    for k, v in totals.items():
+        print(f"  {k}: {v}")
+
+
+if __name__ == "__main__":
+    main()
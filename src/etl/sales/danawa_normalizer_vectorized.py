@@ -0,0 +1,372 @@
+# src/etl/sales/danawa_normalizer_vectorized.py
+
+from __future__ import annotations
+
+import csv
+import io
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+from src.etl.sales.danawa_normalizer import (
+    SHARE_RE,
+    NORMALIZED_HEADER,
+    normalize_row,
+    normalized_output_path,
+)
+from src.etl.sales.danawa_parquet import stage_sales_frame
+
+
+# pyarrow 문자열 컬럼에 쓰는 패턴 (RE2 로 배치당 한 번 컴파일되어 컬럼 전체에 적용)
+# - arrow 의 extract_regex 는 이름 있는 그룹이 필요하다.
+# - RE2 의 \d / \s 와 utf8_trim_whitespace 는 파이썬 str 의 \d / split() / strip() 과 범위가 다르다.
+#   (NBSP, 전각 공백/숫자 등) 그런 글자가 있는 행은 UNICODE_FALLBACK_RE 로 골라 normalize_row 로 처리한다.
+SHARE_EXTRACT_RE = f"(?P<share>{SHARE_RE.pattern})"
+NON_DIGITS_RE = r"\D+"  # \d+ 덩어리를 이어 붙인 것 = 숫자가 아닌 문자 전부 제거
+# 다나와 셀에 자주 나오는 숫자 아닌 글자. 정규식 치환보다 빠른 리터럴 치환으로 먼저 지운다.
+COMMON_NON_DIGITS = (",", "대", "▲", "▼", "-", " ", "%", ".")
+CHANGE_PARTS_RE = r"^(?P<first>\S+)(?:\s+(?P<second>\S+))?"
+NEEDS_QUOTE_RE = r'[",\r\n]'  # csv.writer(QUOTE_MINIMAL) 가 따옴표로 감싸는 문자
+# ASCII(\v, \x1c-\x1f 제외) / 한글 음절 / ▲▼ 밖의 글자. 이 범위 안에서는 위 패턴과 파이썬 결과가 같다.
+UNICODE_FALLBACK_RE = r"[^\x00-\x0a\x0c-\x1b\x20-\x7f\x{AC00}-\x{D7A3}▲▼]"
+
+# raw 컬럼 수에 따른 (순위, 모델명, 판매량, 점유율, 전월대비, 전년대비) 위치
+COLS_7 = [0, 2, 3, 4, 5, 6]  # 크롤러 raw 형식 (중간에 빈 칼럼)
+COLS_6 = [0, 1, 2, 3, 4, 5]  # 기존 팀원 nomalized/normalized 형식
+
+RAW_FIELDS = ["rank", "model_name", "sales", "share", "mom", "yoy"]
+
+# 행 단위 경로(csv.writer)와 같은 헤더 줄
+_HEADER_BUF = io.StringIO(newline="")
+csv.writer(_HEADER_BUF).writerow(NORMALIZED_HEADER)
+HEADER_LINE = _HEADER_BUF.getvalue().encode("utf-8")
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _layout(ncols: int) -> Optional[List[int]]:
+    """셀 개수 → 사용할 raw 컬럼 위치 (6개 미만이면 None = 버리는 행)"""
+    if ncols >= 7:
+        return COLS_7
+    if ncols == 6:
+        return COLS_6
+    return None
+
+
+def _rows_to_table(rows: List[List[str]]) -> pa.Table:
+    """
+    csv.reader 로 읽은 행 목록 → RAW_FIELDS + _ncols 테이블. (셀 개수가 제각각인 행용)
+    """
+    picked: List[List[str]] = [[] for _ in RAW_FIELDS]
+    ncols: List[int] = []
+    for row in rows:
+        layout = _layout(len(row))
+        for values, idx in zip(picked, layout or COLS_6):
+            values.append(row[idx] if layout else "")
+        ncols.append(len(row))
+
+    columns = {name: pa.array(values, type=pa.string()) for name, values in zip(RAW_FIELDS, picked)}
+    columns["_ncols"] = pa.array(ncols, type=pa.int32())
+    return pa.table(columns)
+
+
+def _read_with_csv(text: str) -> pa.Table:
+    """파일 전체를 csv 모듈로 읽는다 (행 단위 경로와 같은 방식, Arrow 로 순서를 맞출 수 없을 때)"""
+    with io.StringIO(text, newline="") as f:
+        rows = [row for row in list(csv.reader(f))[1:] if row]
+    return _rows_to_table(rows)
+
+
+def read_raw_table(path: Path) -> Optional[pa.Table]:
+    """
+    판매량 CSV 한 개 → RAW_FIELDS(strip 전 문자열) + _ncols 테이블. 헤더 1행과 빈 행은 제외.
+    파일이 비어 있으면 None.
+
+    헤더와 셀 개수가 같은 행은 Arrow CSV 리더로 한 번에 읽고,
+    개수가 다른 행(6/7컬럼 혼합, 잘린 행 등)만 csv 모듈로 다시 읽어서 원래 순서대로 합친다.
+    (따옴표/가변 컬럼 처리를 행 단위 경로의 csv.reader 와 같게 하기 위해)
+    """
+    # 행 단위 경로는 텍스트 모드(universal newlines)로 읽으므로 따옴표 안 개행도 \n 으로 바뀐다 → 같게 맞춤
+    data = path.read_bytes().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    text = data.decode("utf-8-sig")
+    with io.StringIO(text, newline="") as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        return None
+    if not header:
+        # 첫 줄이 빈 줄이면 Arrow 의 skip_rows 와 헤더 위치가 달라진다
+        return _read_with_csv(text)
+
+    ncols = max(len(header), 1)
+    names = [f"c{i}" for i in range(ncols)]
+
+    # Arrow 가 못 읽은 행: (행 번호, 원문). 행 번호는 헤더 = 1 부터, 빈 줄은 세지 않는다.
+    odd_rows: List[Tuple[Optional[int], str]] = []
+
+    def _on_invalid(row) -> str:
+        odd_rows.append((row.number, row.text))
+        return "skip"
+
+    fast = pacsv.read_csv(
+        pa.py_buffer(data),
+        read_options=pacsv.ReadOptions(column_names=names, skip_rows=1, use_threads=False),
+        parse_options=pacsv.ParseOptions(
+            newlines_in_values=True, invalid_row_handler=_on_invalid
+        ),
+        convert_options=pacsv.ConvertOptions(
+            column_types={n: pa.string() for n in names},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+
+    layout = _layout(ncols)
+    if layout is not None:
+        columns = {name: fast.column(f"c{i}") for name, i in zip(RAW_FIELDS, layout)}
+    else:
+        empty = pa.array([""] * fast.num_rows, type=pa.string())
+        columns = {name: empty for name in RAW_FIELDS}
+    columns["_ncols"] = pa.array(np.full(fast.num_rows, len(header), dtype=np.int32))
+    table = pa.table(columns)
+
+    if not odd_rows:
+        return table
+
+    # 행 번호 순서로 합친다: 헤더가 1번이므로 데이터 행은 2..total+1, 빠진 번호 = Arrow 가 읽은 행
+    total = table.num_rows + len(odd_rows)
+    numbers = [number for number, _ in odd_rows]
+    if any(n is None for n in numbers) or len(set(numbers)) != len(numbers) or not (
+        min(numbers) >= 2 and max(numbers) <= total + 1
+    ):
+        # 행 번호를 믿을 수 없으면 순서를 맞출 수 없으므로 파일 전체를 csv 모듈로
+        return _read_with_csv(text)
+
+    odd = _rows_to_table(
+        [next(csv.reader(io.StringIO(row_text, newline="")), []) for _, row_text in odd_rows]
+    )
+    is_odd = np.zeros(total, dtype=bool)
+    is_odd[np.array(numbers, dtype=np.int64) - 2] = True
+    order = np.empty(total, dtype=np.int64)
+    order[~is_odd] = np.arange(table.num_rows)
+    order[is_odd] = table.num_rows + np.arange(len(odd_rows))
+    return pa.concat_tables([table, odd]).take(pa.array(order))
+
+
+def _digits_joined(arr: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    숫자 덩어리를 이어 붙이고 int 변환과 같은 형태로 만든다.
+    ('1,234대' -> '1234', '0012' -> '12', '000' -> '0')
+    숫자가 없으면 빈 문자열.
+    """
+    joined = arr.combine_chunks() if isinstance(arr, pa.ChunkedArray) else arr
+    for ch in COMMON_NON_DIGITS:
+        joined = pc.replace_substring(joined, ch, "")
+    # 그래도 숫자 아닌 글자가 남은 행만 정규식으로 처리 (전체에 돌리면 이 함수 시간의 대부분)
+    rest = pc.invert(pc.or_(pc.ascii_is_decimal(joined), pc.equal(joined, "")))
+    if pc.any(rest).as_py():
+        cleaned = pc.replace_substring_regex(pc.filter(joined, rest), NON_DIGITS_RE, "")
+        joined = pc.replace_with_mask(joined, rest, cleaned)
+    stripped = pc.utf8_ltrim(joined, characters="0")
+    all_zero = pc.and_(pc.equal(stripped, ""), pc.not_equal(joined, ""))
+    return pc.if_else(all_zero, "0", stripped)
+
+
+def _parse_change_column(arr: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    parse_change_field 의 컬럼 단위 버전.
+    '9118 697▲' -> '697', '6578 351▼' -> '-351', '-351' -> '-351', ''/'-' -> ''
+    """
+    # 공백 기준 첫 번째/두 번째 토큰 → 두 번째가 있으면 그게 증감량
+    parts = pc.extract_regex(arr, CHANGE_PARTS_RE)
+    first = pc.fill_null(pc.struct_field(parts, "first"), "")
+    second = pc.fill_null(pc.struct_field(parts, "second"), "")
+    diff = pc.if_else(pc.equal(second, ""), first, second)
+
+    # 부호 판정 우선순위: ▼ > ▲ > 맨 앞 '-' (parse_change_field 와 동일)
+    down = pc.match_substring(diff, "▼")
+    up = pc.match_substring(diff, "▲")
+    minus = pc.or_(down, pc.and_(pc.invert(up), pc.starts_with(diff, "-")))
+
+    value = _digits_joined(diff)
+    negative = pc.and_(minus, pc.and_(pc.not_equal(value, ""), pc.not_equal(value, "0")))
+    value = pc.if_else(negative, pc.binary_join_element_wise("-", value, ""), value)
+
+    blank = pc.or_(pc.equal(arr, ""), pc.equal(arr, "-"))
+    return pc.if_else(blank, "", value)
+
+
+def normalize_table(raw: pa.Table) -> pa.Table:
+    """
+    read_raw_table 결과를 정규화된 6개 컬럼(NORMALIZED_HEADER) 테이블로 변환한다.
+    normalize_row 를 행마다 호출한 결과와 같은 값(문자열)을 낸다. raw 의 다른 컬럼(_file 등)은 그대로 둔다.
+    """
+    fallback = _unicode_fallback_mask(raw)
+    rank, model_name, sales, share, mom, yoy = (
+        pc.utf8_trim_whitespace(raw.column(name)) for name in RAW_FIELDS
+    )
+
+    sales_units = _digits_joined(sales)
+    share_ratio = pc.fill_null(
+        pc.struct_field(
+            pc.extract_regex(pc.replace_substring(share, ",", ""), SHARE_EXTRACT_RE), "share"
+        ),
+        "",
+    )
+
+    columns = {
+        "순위": rank,
+        "모델명": model_name,
+        "판매량": sales_units,
+        "점유율": share_ratio,
+        "전월대비": _parse_change_column(mom),
+        "전년대비": _parse_change_column(yoy),
+    }
+    keep = pc.and_(
+        pc.and_(pc.greater_equal(raw.column("_ncols"), 6), pc.not_equal(rank, "")),
+        pc.and_(pc.not_equal(model_name, ""), pc.not_equal(sales_units, "")),
+    )
+    if fallback is not None:
+        columns, keep = _apply_row_fallback(raw, fallback, columns, keep)
+
+    for name in raw.column_names:
+        if name not in RAW_FIELDS and name != "_ncols":
+            columns[name] = raw.column(name)
+    return pa.table(columns).filter(keep)
+
+
+def _unicode_fallback_mask(raw: pa.Table) -> Optional[pa.Array]:
+    """
+    정규화에 쓰는 셀 중 UNICODE_FALLBACK_RE 글자가 있는 행 마스크. 그런 행이 없으면 None.
+    (예: '9118\xa0697▲' → 행 단위는 697, '１２대' → 12)
+    """
+    mask = None
+    for name in RAW_FIELDS:
+        hit = pc.match_substring_regex(raw.column(name), UNICODE_FALLBACK_RE)
+        mask = hit if mask is None else pc.or_(mask, hit)
+    mask = pc.fill_null(mask, False)
+    if not pc.any(mask).as_py():
+        return None
+    return mask.combine_chunks() if isinstance(mask, pa.ChunkedArray) else mask
+
+
+def _apply_row_fallback(
+    raw: pa.Table, fallback: pa.Array, columns: dict, keep
+) -> Tuple[dict, pa.Array]:
+    """
+    fallback 행만 normalize_row 로 다시 계산해서 columns / keep 의 해당 위치를 덮어쓴다.
+    """
+    picked = raw.filter(fallback)
+    ncols = picked.column("_ncols").to_pylist()
+    cells = [picked.column(name).to_pylist() for name in RAW_FIELDS]
+
+    results = []
+    for i, n in enumerate(ncols):
+        rank, model_name, sales, share, mom, yoy = (c[i] for c in cells)
+        # normalize_row 의 7컬럼 형식 (두 번째 빈칸 포함) 으로 넘긴다
+        row = normalize_row([rank, "", model_name, sales, share, mom, yoy]) if n >= 6 else None
+        results.append(row)
+
+    replaced = {}
+    for idx, name in enumerate(NORMALIZED_HEADER):
+        values = pa.array([r[idx] if r is not None else "" for r in results], pa.string())
+        column = columns[name]
+        column = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+        replaced[name] = pc.replace_with_mask(column, fallback, values)
+
+    keep = keep.combine_chunks() if isinstance(keep, pa.ChunkedArray) else keep
+    row_keep = pa.array([r is not None for r in results], pa.bool_())
+    return replaced, pc.replace_with_mask(keep, fallback, row_keep)
+
+
+def _csv_field(arr: pa.ChunkedArray) -> pa.ChunkedArray:
+    """csv.writer(QUOTE_MINIMAL) 와 같은 셀 표현 (구분자/따옴표/개행이 있으면 "..." + 따옴표 두 번)"""
+    quoted = pc.binary_join_element_wise('"', pc.replace_substring(arr, '"', '""'), '"', "")
+    return pc.if_else(pc.match_substring_regex(arr, NEEDS_QUOTE_RE), quoted, arr)
+
+
+def csv_body_bytes(table: pa.Table) -> bytes:
+    """
+    정규화 테이블(NORMALIZED_HEADER 컬럼) → CSV 본문 바이트 (헤더 제외, 행 끝 \\r\\n)
+    줄마다 문자열을 만들지 않고 Arrow 문자열 배열의 데이터 버퍼를 그대로 쓴다.
+    """
+    if table.num_rows == 0:
+        return b""
+    fields = [_csv_field(table.column(name)) for name in NORMALIZED_HEADER]
+    lines = pc.binary_join_element_wise(*fields, ",")
+    lines = pc.binary_join_element_wise(lines, "", "\r\n")
+    lines = lines.combine_chunks() if isinstance(lines, pa.ChunkedArray) else lines
+
+    offsets = np.frombuffer(lines.buffers()[1], dtype=np.int32)[lines.offset : lines.offset + len(lines) + 1]
+    return lines.buffers()[2].to_pybytes()[offsets[0] : offsets[-1]]
+
+
+def _write_normalized(table: pa.Table, output_path: Path) -> None:
+    """
+    행 단위 경로(csv.writer, utf-8-sig)와 바이트 단위로 같은 파일을 한 번에 쓴다.
+    """
+    output_path.write_bytes(UTF8_BOM + HEADER_LINE + csv_body_bytes(table))
+
+
+def normalize_file_vectorized(
+    input_path: Path,
+    output_path: Optional[Path] = None,
+    write_csv: bool = True,
+    stage: bool = True,
+) -> bool:
+    """
+    normalize_file 의 벡터화 버전. 저장했으면 True.
+    """
+    return normalize_files_vectorized([(input_path, output_path)], write_csv, stage)[0]
+
+
+def normalize_files_vectorized(
+    jobs: List[Tuple[Path, Optional[Path]]],
+    write_csv: bool = True,
+    stage: bool = True,
+) -> List[bool]:
+    """
+    여러 판매량 CSV를 하나의 Arrow 테이블로 합쳐 한 번에 정규화한 뒤
+    파일별로 나눠 저장한다. (CSV + Parquet staging, write_csv=False 면 Parquet 만,
+    stage=False 면 CSV 만)
+
+    jobs: [(input_path, output_path or None), ...]
+          같은 출력 파일로 가는 job 이 여러 개면 안 된다 (normalize_folder 는 출력 경로당 원본 하나만 고른다 - source_priority)
+    반환: jobs 순서대로 저장 여부 리스트
+    """
+    tables: List[pa.Table] = []
+    outputs: List[Path] = []
+
+    for i, (input_path, output_path) in enumerate(jobs):
+        outputs.append(output_path or normalized_output_path(input_path))
+        print(f"[INFO] 파일 처리: {input_path} -> {outputs[i]}")
+
+        raw = read_raw_table(input_path)
+        if raw is None or raw.num_rows == 0:
+            continue
+        tables.append(raw.append_column("_file", pa.array(np.full(raw.num_rows, i, dtype=np.int32))))
+
+    saved = [False] * len(jobs)
+    if tables:
+        normalized = normalize_table(pa.concat_tables(tables))
+
+        # 파일 순서대로 이어 붙였으므로 _file 은 정렬되어 있다 → 경계만 찾아서 slice
+        file_ids = normalized.column("_file").to_numpy()
+        normalized = normalized.drop_columns(["_file"])
+        for i in np.unique(file_ids):
+            start, end = np.searchsorted(file_ids, [i, i + 1])
+            part = normalized.slice(start, end - start)
+            if write_csv:
+                _write_normalized(part, outputs[i])
+                print(f"[INFO] 저장 완료: {outputs[i]}")
+            if stage:
+                stage_sales_frame(jobs[i][0], part.to_pandas())
+            saved[i] = True
+
+    for i, (input_path, _) in enumerate(jobs):
+        if not saved[i]:
+            print(f"[WARN] 정규화 결과가 비어 있음: {input_path}")
+
+    return saved
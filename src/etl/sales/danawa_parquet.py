@@ -0,0 +1,388 @@
+# src/etl/sales/danawa_parquet.py
+
+from __future__ import annotations
+
+import argparse
+import csv
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+DANAWA_RAW_BASE = BASE_DIR / "data" / "raw" / "danawa"
+
+# 정규화 결과 staging 데이터셋 (run_id / brand / month 파티션, hive 형식)
+#   data/staging/danawa/sales/run_id=25_11_16/brand=kia/month=2023-01-01/part-0.parquet
+#   data/staging/danawa/meta/run_id=25_11_16/brand=kia/month=2023-01-01/part-0.parquet
+DANAWA_STAGING_BASE = BASE_DIR / "data" / "staging" / "danawa"
+SALES_DATASET = DANAWA_STAGING_BASE / "sales"
+META_DATASET = DANAWA_STAGING_BASE / "meta"
+
+PARTITION_SCHEMA = pa.schema(
+    [
+        ("run_id", pa.string()),
+        ("brand", pa.string()),
+        ("month", pa.string()),  # 'YYYY-MM-01'
+    ]
+)
+
+SALES_SCHEMA = pa.schema(
+    [
+        ("rank", pa.int32()),
+        ("model_name", pa.string()),
+        ("sales_units", pa.int64()),
+        ("share_pct", pa.float64()),  # 점유율(%) 값 그대로, 예: 17.7
+        ("mom_diff", pa.int64()),  # 전월대비 증감량
+        ("yoy_diff", pa.int64()),  # 전년대비 증감량
+    ]
+)
+
+META_SCHEMA = pa.schema(
+    [
+        ("rank", pa.int32()),
+        ("model_name", pa.string()),
+        ("detail_url", pa.string()),
+        ("image_url", pa.string()),
+    ]
+)
+
+MONTH_IN_FILENAME_RE = re.compile(r"(\d{4})_(\d{2})_00")
+
+
+# ----------------------------------------
+# 경로 / 파티션 유틸
+# ----------------------------------------
+
+
+def month_date_from_filename(filename: str) -> Optional[str]:
+    """
+    예: kia_model_sales_2023_01_00_normalized.csv → '2023-01-01'
+    """
+    m = MONTH_IN_FILENAME_RE.search(filename)
+    if not m:
+        return None
+    return f"{m.group(1)}-{m.group(2)}-01"
+
+
+def staging_context_from_path(path: Path) -> Optional[Tuple[str, str, str]]:
+    """
+    data/raw/danawa/<run_id>/<brand>/<brand>_model_*_YYYY_MM_00*.csv
+    경로에서 (run_id, brand, month_date) 를 꺼낸다.
+    DANAWA_RAW_BASE 아래가 아니거나 형식이 다르면 None.
+    (임시 디렉토리 등 다른 곳의 CSV 가 실제 staging 데이터셋에 섞이지 않게)
+    """
+    month = month_date_from_filename(path.name)
+    if month is None:
+        return None
+    try:
+        rel = path.resolve().relative_to(DANAWA_RAW_BASE.resolve())
+    except ValueError:
+        return None
+    if len(rel.parts) != 3:
+        return None
+    run_id, brand, _ = rel.parts
+    return run_id, brand.lower(), month
+
+
+def partition_dir(dataset: Path, run_id: str, brand: str, month: str) -> Path:
+    return dataset / f"run_id={run_id}" / f"brand={brand}" / f"month={month}"
+
+
+def partition_file(dataset: Path, run_id: str, brand: str, month: str) -> Path:
+    return partition_dir(dataset, run_id, brand, month) / "part-0.parquet"
+
+
+def staged_path_for(csv_path: Path) -> Optional[Path]:
+    """
+    raw/normalized/meta CSV 경로 → 대응하는 staging Parquet 파일 경로.
+    """
+    ctx = staging_context_from_path(csv_path)
+    if ctx is None:
+        return None
+    dataset = META_DATASET if "_meta_" in csv_path.name else SALES_DATASET
+    return partition_file(dataset, *ctx)
+
+
+def _write_partition(table: pa.Table, dataset: Path, run_id: str, brand: str, month: str) -> Path:
+    """
+    파티션 하나를 통째로 덮어쓴다. (같은 run/brand/month 재정규화 시 중복 방지)
+    """
+    out_dir = partition_dir(dataset, run_id, brand, month)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for old in out_dir.glob("*.parquet"):
+        old.unlink()
+
+    out_path = out_dir / "part-0.parquet"
+    pq.write_table(table, out_path)
+    return out_path
+
+
+# ----------------------------------------
+# 타입 변환
+# ----------------------------------------
+
+
+def _to_int(s: pd.Series) -> pd.Series:
+    # 빈 문자열/파싱 불가 값은 NULL
+    return pd.to_numeric(s, errors="coerce").astype("Int64")
+
+
+def _to_float(s: pd.Series) -> pd.Series:
+    return pd.to_numeric(s, errors="coerce").astype("Float64")
+
+
+def sales_table_from_normalized(frame: pd.DataFrame) -> pa.Table:
+    """
+    정규화된 문자열 컬럼(순위,모델명,판매량,점유율,전월대비,전년대비)을
+    SALES_SCHEMA 타입의 Arrow 테이블로 변환한다.
+    """
+    frame = frame.astype(object)
+    typed = pd.DataFrame(
+        {
+            "rank": _to_int(frame["순위"]),
+            "model_name": frame["모델명"].astype(str),
+            "sales_units": _to_int(frame["판매량"]),
+            "share_pct": _to_float(frame["점유율"]),
+            "mom_diff": _to_int(frame["전월대비"]),
+            "yoy_diff": _to_int(frame["전년대비"]),
+        }
+    )
+    return pa.Table.from_pandas(typed, schema=SALES_SCHEMA, preserve_index=False)
+
+
+# ----------------------------------------
+# staging 쓰기
+# ----------------------------------------
+
+
+def stage_sales_frame(input_path: Path, frame: pd.DataFrame) -> Optional[Path]:
+    """
+    정규화 결과(문자열 DataFrame)를 sales 데이터셋의 해당 파티션에 저장.
+    경로에서 run_id/brand/month 를 알 수 없으면 저장하지 않고 None.
+    """
+    ctx = staging_context_from_path(input_path)
+    if ctx is None:
+        print(f"[WARN] run_id/brand/month 를 알 수 없어 Parquet staging 생략: {input_path}")
+        return None
+
+    run_id, brand, month = ctx
+    out_path = _write_partition(
+        sales_table_from_normalized(frame), SALES_DATASET, run_id, brand, month
+    )
+    print(f"[INFO] Parquet staging 저장: {out_path}")
+    return out_path
+
+
+def stage_meta_csv(meta_path: Path) -> Optional[Path]:
+    """
+    크롤러가 저장한 *_model_meta_*.csv 를 meta 데이터셋 파티션으로 저장.
+    """
+    ctx = staging_context_from_path(meta_path)
+    if ctx is None:
+        print(f"[WARN] run_id/brand/month 를 알 수 없어 Parquet staging 생략: {meta_path}")
+        return None
+
+    run_id, brand, month = ctx
+
+    rows: List[dict] = []
+    with meta_path.open("r", encoding="utf-8-sig", newline="") as f:
+        for r in csv.DictReader(f):
+            model_name = (r.get("model_name") or "").strip()
+            if not model_name:
+                continue
+            rows.append(
+                {
+                    "rank": (r.get("rank") or "").strip(),
+                    "model_name": model_name,
+                    "detail_url": (r.get("detail_url") or "").strip() or None,
+                    "image_url": (r.get("image_url") or "").strip() or None,
+                }
+            )
+
+    frame = pd.DataFrame(rows, columns=["rank", "model_name", "detail_url", "image_url"])
+    frame["rank"] = _to_int(frame["rank"].astype(object))
+    table = pa.Table.from_pandas(frame, schema=META_SCHEMA, preserve_index=False)
+
+    out_path = _write_partition(table, META_DATASET, run_id, brand, month)
+    print(f"[INFO] Parquet staging 저장: {out_path}")
+    return out_path
+
+
+# ----------------------------------------
+# staging 읽기 (컬럼 projection + 파티션 필터)
+# ----------------------------------------
+
+
+def _partition_filter(
+    run_ids: Optional[Sequence[str]],
+    brands: Optional[Sequence[str]],
+    months: Optional[Sequence[str]],
+) -> Optional[ds.Expression]:
+    expr: Optional[ds.Expression] = None
+    for name, values in (("run_id", run_ids), ("brand", brands), ("month", months)):
+        if values is None:
+            continue
+        cond = ds.field(name).isin(list(values))
+        expr = cond if expr is None else expr & cond
+    return expr
+
+
+def read_dataset(
+    dataset: Path,
+    schema: pa.Schema,
+    columns: Optional[Iterable[str]] = None,
+    run_ids: Optional[Sequence[str]] = None,
+    brands: Optional[Sequence[str]] = None,
+    months: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    staging 데이터셋에서 필요한 컬럼/파티션만 읽어서 DataFrame으로 반환.
+    데이터셋이 없으면 빈 DataFrame.
+    """
+    full_schema = pa.schema(list(schema) + list(PARTITION_SCHEMA))
+    cols = list(columns) if columns is not None else full_schema.names
+
+    if not dataset.exists():
+        return pd.DataFrame({c: pd.Series(dtype=object) for c in cols})
+
+    data = ds.dataset(
+        str(dataset),
+        format="parquet",
+        schema=full_schema,
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+    )
+    table = data.to_table(
+        columns=cols, filter=_partition_filter(run_ids, brands, months)
+    )
+    return table.to_pandas()
+
+
+def read_sales(
+    columns: Optional[Iterable[str]] = None,
+    run_ids: Optional[Sequence[str]] = None,
+    brands: Optional[Sequence[str]] = None,
+    months: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    return read_dataset(SALES_DATASET, SALES_SCHEMA, columns, run_ids, brands, months)
+
+
+def read_meta(
+    columns: Optional[Iterable[str]] = None,
+    run_ids: Optional[Sequence[str]] = None,
+    brands: Optional[Sequence[str]] = None,
+    months: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    return read_dataset(META_DATASET, META_SCHEMA, columns, run_ids, brands, months)
+
+
+def list_partitions(dataset: Optional[Path] = None) -> List[Tuple[str, str, str, Path]]:
+    """
+    데이터셋(기본: sales)의 파티션 파일 목록: [(run_id, brand, month, parquet_path), ...]
+    파일을 열지 않고 디렉토리 이름만 본다.
+    """
+    dataset = dataset or SALES_DATASET
+    if not dataset.exists():
+        return []
+
+    parts: List[Tuple[str, str, str, Path]] = []
+    for path in sorted(dataset.glob("run_id=*/brand=*/month=*/*.parquet")):
+        month_dir = path.parent
+        brand_dir = month_dir.parent
+        run_dir = brand_dir.parent
+        parts.append(
+            (
+                run_dir.name.split("=", 1)[1],
+                brand_dir.name.split("=", 1)[1],
+                month_dir.name.split("=", 1)[1],
+                path,
+            )
+        )
+    return parts
+
+
+def read_partition_file(path: Path, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    파티션 파일 하나만 필요한 컬럼으로 읽는다.
+    """
+    return pq.read_table(path, columns=list(columns) if columns is not None else None).to_pandas()
+
+
+# ----------------------------------------
+# CSV export
+# ----------------------------------------
+
+
+def _fmt(v) -> str:
+    if v is None or v is pd.NA or (isinstance(v, float) and pd.isna(v)):
+        return ""
+    return str(v)
+
+
+def export_sales_csv(run_id: str, brands: List[str], out_dir: Path) -> int:
+    """
+    sales 데이터셋을 파티션(brand, month)별 normalized CSV 형식으로 내보낸다.
+    반환: 저장한 파일 수
+    """
+    df = read_sales(run_ids=[run_id], brands=brands)
+    if df.empty:
+        print(f"[WARN] staging 데이터 없음: run_id={run_id}, brands={brands}")
+        return 0
+
+    saved = 0
+    for (brand, month), part in df.groupby(["brand", "month"], sort=True):
+        brand_dir = out_dir / brand
+        brand_dir.mkdir(parents=True, exist_ok=True)
+        out_path = brand_dir / f"{brand}_model_sales_{month[:7].replace('-', '_')}_00_normalized.csv"
+
+        with out_path.open("w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(["순위", "모델명", "판매량", "점유율", "전월대비", "전년대비"])
+            for r in part.itertuples(index=False):
+                writer.writerow(
+                    [
+                        _fmt(r.rank),
+                        r.model_name,
+                        _fmt(r.sales_units),
+                        _fmt(r.share_pct),
+                        _fmt(r.mom_diff),
+                        _fmt(r.yoy_diff),
+                    ]
+                )
+        saved += 1
+        print(f"[INFO] CSV export: {out_path}")
+
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="다나와 Parquet staging 데이터셋 → normalized CSV export"
+    )
+    parser.add_argument("--run-id", required=True, help="다나와 수집 실행 ID (예: 25_11_14)")
+    parser.add_argument(
+        "--brands",
+        nargs="+",
+        default=["hyundai", "kia"],
+        help="대상 브랜드 코드 (예: hyundai kia)",
+    )
+    parser.add_argument(
+        "--export-csv",
+        type=str,
+        default=None,
+        required=True,
+        help="staging 데이터셋을 normalized CSV 로 내보낼 디렉토리",
+    )
+    args = parser.parse_args()
+
+    saved = export_sales_csv(args.run_id, args.brands, Path(args.export_csv))
+    print(f"[INFO] CSV export 완료: {saved}개 파일")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,48 @@
 # src/etl/sales/extract_car_model_candidates.py
 
+import argparse
 import csv
-import re
+import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
+import pandas as pd
+
+from src.etl.sales.danawa_parquet import (
+    DANAWA_STAGING_BASE,
+    list_partitions,
+    read_partition_file,
+)
+
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
-DANAWA_BASE = BASE_DIR / "data" / "raw" / "danawa" / "25_11_14"
+BRAND_NAME_MAP = {"hyundai": "현대", "kia": "기아"}
 OUTPUT_PATH = BASE_DIR / "data" / "raw" / "car_model_candidates.csv"
 
+# 증분 집계 상태 파일 (모든 run_id 를 훑으면서 반영한 파티션/모델 집계)
+STATE_PATH = DANAWA_STAGING_BASE / "car_model_candidates_state.json"
+STATE_VERSION = 1
+
+# 월 bitmask 기준: bit i = MASK_BASE_YEAR년 1월부터 i개월 뒤
+MASK_BASE_YEAR = 2000
+
+
+def month_to_bit(month: str) -> int:
+    """
+    'YYYY-MM' 또는 'YYYY-MM-01' → bitmask 위치
+    """
+    year, mon = int(month[:4]), int(month[5:7])
+    return (year - MASK_BASE_YEAR) * 12 + (mon - 1)
+
+
+def bit_to_month(bit: int) -> str:
+    """
+    bitmask 위치 → 'YYYY-MM'
+    """
+    year, mon = divmod(bit, 12)
+    return f"{year + MASK_BASE_YEAR:04d}-{mon + 1:02d}"
+
 
 @dataclass
 class ModelStat:
@@ -17,16 +50,30 @@ class ModelStat:
     model_name_kr: str
     first_month: str | None  # 'YYYY-MM'
     last_month: str | None  # 'YYYY-MM'
-    months: set
+    months_mask: int  # 판매 기록이 있는 월 bitmask
     total_sales: int
 
+    def _refresh_range(self):
+        if not self.months_mask:
+            self.first_month = None
+            self.last_month = None
+            return
+        lowest = (self.months_mask & -self.months_mask).bit_length() - 1
+        self.first_month = bit_to_month(lowest)
+        self.last_month = bit_to_month(self.months_mask.bit_length() - 1)
+
     def update(self, month: str, sales: int):
-        if self.first_month is None or month < self.first_month:
-            self.first_month = month
-        if self.last_month is None or month > self.last_month:
-            self.last_month = month
-        self.months.add(month)
+        self.months_mask |= 1 << month_to_bit(month)
         self.total_sales += sales
+        self._refresh_range()
+
+    def retract(self, month: str, sales: int):
+        """
+        update 의 반대. 같은 (brand, month) 파티션이 새 run 으로 교체될 때 사용.
+        """
+        self.months_mask &= ~(1 << month_to_bit(month))
+        self.total_sales -= sales
+        self._refresh_range()
 
     def to_row(self) -> dict:
         return {
@@ -34,66 +81,194 @@ class ModelStat:
             "model_name_kr": self.model_name_kr,
             "first_month": self.first_month or "",
             "last_month": self.last_month or "",
-            "months_count": len(self.months),
+            "months_count": self.months_mask.bit_count(),
             "total_sales": self.total_sales,
         }
 
+    def to_state(self) -> dict:
+        return {
+            "first_month": self.first_month,
+            "last_month": self.last_month,
+            "months_mask": self.months_mask,
+            "total_sales": self.total_sales,
+        }
+
+
+# ----------------------------------------
+# 상태 파일
+# ----------------------------------------
+
+
+def empty_state() -> dict:
+    # partitions: "brand|YYYY-MM-01" → 반영한 파티션 {"run_id", "mtime"}
+    # models: "브랜드|모델명" → ModelStat.to_state()
+    return {"version": STATE_VERSION, "partitions": {}, "models": {}}
+
+
+def load_state() -> dict:
+    if not STATE_PATH.exists():
+        return empty_state()
+
+    with STATE_PATH.open("r", encoding="utf-8") as f:
+        state = json.load(f)
+
+    if state.get("version") != STATE_VERSION:
+        print(f"[WARN] 상태 파일 버전이 달라 전체 재집계: {STATE_PATH}")
+        return empty_state()
+    return state
+
 
-def parse_month_from_filename(filename: str) -> str:
+def save_state(state: dict) -> None:
     """
-    예: hyundai_model_sales_2024_06_00_normalized.csv → '2024-06'
+    임시 파일에 쓴 뒤 교체 (danawa_manifest.save_manifest 와 같은 방식)
     """
-    m = re.search(r"(\d{4})_(\d{2})_00", filename)
-    if not m:
-        raise ValueError(f"파일명에서 연월을 찾을 수 없음: {filename}")
-    year, month = m.group(1), m.group(2)
-    return f"{year}-{month}"
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = STATE_PATH.with_suffix(".json.tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, STATE_PATH)
 
 
-def iter_normalized_files():
+def stats_from_state(state: dict) -> dict[tuple[str, str], ModelStat]:
+    stats: dict[tuple[str, str], ModelStat] = {}
+    for key, v in state["models"].items():
+        brand_name, model_name = key.split("|", 1)
+        stats[(brand_name, model_name)] = ModelStat(
+            brand_name=brand_name,
+            model_name_kr=model_name,
+            first_month=v["first_month"],
+            last_month=v["last_month"],
+            months_mask=v["months_mask"],
+            total_sales=v["total_sales"],
+        )
+    return stats
+
+
+def state_from_stats(
+    partitions: dict, stats: dict[tuple[str, str], ModelStat]
+) -> dict:
+    return {
+        "version": STATE_VERSION,
+        "partitions": partitions,
+        "models": {
+            f"{brand}|{model}": stat.to_state()
+            for (brand, model), stat in stats.items()
+        },
+    }
+
+
+# ----------------------------------------
+# 증분 집계
+# ----------------------------------------
+
+
+def latest_partitions(
+    all_parts: dict[tuple[str, str, str], Path],
+) -> dict[str, dict]:
     """
-    현대/기아 normalized CSV 전체 경로 + 브랜드 이름을 yield
+    모든 run_id 파티션 중 (brand, month) 별로 가장 최근에 staging 된 것 하나씩 고른다.
+    반환: "brand|YYYY-MM-01" → {"run_id", "mtime", "path"}
     """
-    for brand_name, subdir in [("현대", "hyundai"), ("기아", "kia")]:
-        brand_dir = DANAWA_BASE / subdir
-        for path in sorted(brand_dir.glob("*_normalized.csv")):
-            yield brand_name, path
+    latest: dict[str, dict] = {}
+    for (run_id, brand, month), path in all_parts.items():
+        if brand not in BRAND_NAME_MAP:
+            continue
+        mtime = path.stat().st_mtime
+        key = f"{brand}|{month}"
+        if key not in latest or mtime > latest[key]["mtime"]:
+            latest[key] = {"run_id": run_id, "mtime": mtime, "path": path}
+    return latest
 
 
-def build_model_candidates() -> dict[tuple[str, str], ModelStat]:
-    stats: dict[tuple[str, str], ModelStat] = {}
+def iter_partition_sales(path: Path):
+    """
+    파티션 하나에서 (모델명, 판매량) 을 yield. 판매량 NULL 은 0.
+    """
+    df = read_partition_file(path, columns=["model_name", "sales_units"])
+    for model_name, sales_units in zip(df["model_name"], df["sales_units"]):
+        if not model_name:
+            continue
+        yield model_name, 0 if pd.isna(sales_units) else int(sales_units)
+
+
+def fold_partition(
+    stats: dict[tuple[str, str], ModelStat],
+    brand: str,
+    month: str,
+    path: Path,
+    retract: bool = False,
+) -> None:
+    brand_name = BRAND_NAME_MAP[brand]
+    for model_name, sales in iter_partition_sales(path):
+        key = (brand_name, model_name)
+        if key not in stats:
+            stats[key] = ModelStat(
+                brand_name=brand_name,
+                model_name_kr=model_name,
+                first_month=None,
+                last_month=None,
+                months_mask=0,
+                total_sales=0,
+            )
 
-    for brand_name, path in iter_normalized_files():
-        month = parse_month_from_filename(path.name)
-
-        with path.open("r", encoding="utf-8-sig", newline="") as f:
-            reader = csv.DictReader(f)
-            # 기대 컬럼: 순위,모델명,판매량,점유율,전월대비,전년대비
-            for row in reader:
-                model_name = row.get("모델명")
-                sales_str = row.get("판매량")
-
-                if not model_name:
-                    continue
-
-                try:
-                    sales = int(sales_str.replace(",", "")) if sales_str else 0
-                except ValueError:
-                    sales = 0
-
-                key = (brand_name, model_name)
-                if key not in stats:
-                    stats[key] = ModelStat(
-                        brand_name=brand_name,
-                        model_name_kr=model_name,
-                        first_month=None,
-                        last_month=None,
-                        months=set(),
-                        total_sales=0,
-                    )
-
-                stats[key].update(month, sales)
+        if retract:
+            stats[key].retract(month, sales)
+            if not stats[key].months_mask and not stats[key].total_sales:
+                del stats[key]
+        else:
+            stats[key].update(month, sales)
 
+
+def build_model_candidates(rebuild: bool = False) -> dict[tuple[str, str], ModelStat]:
+    """
+    상태 파일에 이미 반영된 파티션은 건너뛰고 새 파티션만 접어 넣는다.
+    - 같은 (brand, month) 가 새 run 으로 다시 수집되면
+      이전 run 파티션의 기여분을 빼고 새 파티션을 더한다.
+    - 이전 파티션이 없어져서 뺄 수 없으면 전체 재집계로 전환한다.
+    """
+    state = empty_state() if rebuild else load_state()
+    all_parts = {(r, b, m): p for r, b, m, p in list_partitions()}
+    latest = latest_partitions(all_parts)
+
+    removed = set(state["partitions"]) - set(latest)
+    if removed and not rebuild:
+        print(f"[INFO] 반영했던 파티션 {len(removed)}개가 사라져서 전체 재집계")
+        return build_model_candidates(rebuild=True)
+
+    pending = []
+    for key, part in sorted(latest.items()):
+        seen = state["partitions"].get(key)
+        if seen and seen["run_id"] == part["run_id"] and seen["mtime"] == part["mtime"]:
+            continue
+
+        old_path = None
+        if seen:
+            brand, month = key.split("|", 1)
+            old_path = all_parts.get((seen["run_id"], brand, month))
+            # 같은 run 파티션이 덮어써졌거나 이전 run 파티션이 지워졌으면
+            # 기여분을 뺄 수 없으므로 전체 재집계
+            if seen["run_id"] == part["run_id"] or old_path is None:
+                print(f"[INFO] 이전 파티션을 되돌릴 수 없어 전체 재집계: {key}")
+                return build_model_candidates(rebuild=True)
+
+        pending.append((key, part, old_path))
+
+    stats = stats_from_state(state)
+    partitions = dict(state["partitions"])
+
+    for key, part, old_path in pending:
+        brand, month = key.split("|", 1)
+        if old_path is not None:
+            fold_partition(stats, brand, month, old_path, retract=True)
+        fold_partition(stats, brand, month, part["path"])
+        partitions[key] = {"run_id": part["run_id"], "mtime": part["mtime"]}
+
+    save_state(state_from_stats(partitions, stats))
+
+    print(
+        f"[INFO] 파티션 {len(latest)}개 중 새로 반영 {len(pending)}개 "
+        f"(rebuild={rebuild}) → 상태 파일: {STATE_PATH}"
+    )
     return stats
 
 
@@ -116,7 +291,22 @@ def save_candidates_to_csv(stats: dict[tuple[str, str], ModelStat]):
 
 
 def main():
-    stats = build_model_candidates()
+    parser = argparse.ArgumentParser(
+        description="다나와 staging 판매량에서 car_model 후보 리스트 증분 집계"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="상태 파일을 무시하고 모든 run_id 파티션을 처음부터 다시 집계",
+    )
+    args = parser.parse_args()
+
+    stats = build_model_candidates(rebuild=args.rebuild)
+    if not stats:
+        print(
+            "[WARN] staging 판매량 데이터 없음 "
+            "(python -m src.etl.sales.danawa_normalizer --run-id <run_id> 로 먼저 staging)"
+        )
     save_candidates_to_csv(stats)
     print(f"총 모델 수: {len(stats)}개")
     print(f"→ {OUTPUT_PATH} 에 후보 리스트 저장 완료")
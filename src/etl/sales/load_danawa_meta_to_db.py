@@ -3,19 +3,16 @@
 from __future__ import annotations
 
 import argparse
-import csv
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse, parse_qs
 
+import pandas as pd
 from sqlalchemy import text
 
 from src.db.connection import get_engine
-
-
-BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
-DANAWA_RAW_BASE = BASE_DIR / "data" / "raw" / "danawa"
+from src.etl.sales.danawa_manifest import load_unchanged_jobs
+from src.etl.sales.danawa_parquet import read_meta
 
 # 크롤러에서 쓰는 브랜드 코드 → DB의 brand_name 매핑
 BRAND_KR_MAP: Dict[str, str] = {
@@ -52,33 +49,32 @@ def extract_model_id_from_url(url: str | None) -> Optional[int]:
         return None
 
 
-def load_meta_csv(path: Path, brand_code_from_dir: str) -> List[MetaRow]:
-    rows: List[MetaRow] = []
-
-    with path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            brand_code = (r.get("brand") or "").strip() or brand_code_from_dir
-            month = (r.get("month") or "").strip()
-            rank = (r.get("rank") or "").strip()
-            model_name = (r.get("model_name") or "").strip()
-            detail_url = (r.get("detail_url") or "").strip()
-            image_url = (r.get("image_url") or "").strip()
-
-            if not model_name:
-                continue
+def load_staged_meta(run_id: str, brand_code: str) -> List[MetaRow]:
+    """
+    Parquet staging 메타 데이터셋에서 run_id / brand 파티션만,
+    필요한 컬럼만 읽어서 MetaRow 리스트로 반환.
+    """
+    df = read_meta(
+        columns=["month", "rank", "model_name", "detail_url", "image_url"],
+        run_ids=[run_id],
+        brands=[brand_code.lower()],
+    )
+    df = df[df["model_name"] != ""]
 
-            rows.append(
-                MetaRow(
-                    brand_code=brand_code.lower(),
-                    month=month,
-                    rank=rank,
-                    model_name=model_name,
-                    detail_url=detail_url or None,
-                    image_url=image_url or None,
-                )
+    rows: List[MetaRow] = []
+    for month, rank, model_name, detail_url, image_url in zip(
+        df["month"], df["rank"], df["model_name"], df["detail_url"], df["image_url"]
+    ):
+        rows.append(
+            MetaRow(
+                brand_code=brand_code.lower(),
+                month=month,
+                rank="" if pd.isna(rank) else str(int(rank)),
+                model_name=model_name,
+                detail_url=detail_url or None,
+                image_url=image_url or None,
             )
-
+        )
     return rows
 
 
@@ -87,33 +83,38 @@ def process_meta_for_brand(
     run_id: str,
     brand_code: str,
     stats: Dict[str, int],
+    skip_jobs: Optional[Set[Tuple[str, str]]] = None,
 ) -> None:
     """
     특정 run_id / brand 에 대해:
-      data/raw/danawa/<run_id>/<brand>/*_model_meta_*.csv 를 모두 처리
+      Parquet staging 메타 데이터셋의 run_id=<run_id>/brand=<brand> 파티션을 월별로 처리
     """
-    brand_dir = DANAWA_RAW_BASE / run_id / brand_code
-    if not brand_dir.exists():
-        print(f"[WARN] 브랜드 디렉토리 없음: {brand_dir}")
-        return
-
-    print(
-        f"\n[INFO] 메타 처리 시작: run_id={run_id}, brand={brand_code}, dir={brand_dir}"
-    )
+    print(f"\n[INFO] 메타 처리 시작: run_id={run_id}, brand={brand_code}")
 
     brand_name_kr = BRAND_KR_MAP.get(brand_code.lower())
     if not brand_name_kr:
         print(f"[WARN] BRAND_KR_MAP에 없는 브랜드 코드: {brand_code}")
         return
 
-    meta_files = sorted(brand_dir.glob("*_model_meta_*.csv"))
-    if not meta_files:
-        print(f"[WARN] 메타 CSV 없음: {brand_dir}")
+    rows_by_month: Dict[str, List[MetaRow]] = {}
+    for mr in load_staged_meta(run_id, brand_code):
+        rows_by_month.setdefault(mr.month, []).append(mr)
+
+    if not rows_by_month:
+        print(
+            f"[WARN] staging 메타 데이터 없음: run_id={run_id}, brand={brand_code} "
+            f"(python -m src.etl.sales.danawa_normalizer --run-id {run_id} 로 먼저 staging)"
+        )
         return
 
-    for path in meta_files:
-        print(f"[INFO] 메타 파일 처리: {path}")
-        meta_rows = load_meta_csv(path, brand_code_from_dir=brand_code)
+    for month in sorted(rows_by_month):
+        if skip_jobs and (brand_code.lower(), month) in skip_jobs:
+            stats["skipped_unchanged_months"] += 1
+            print(f"[INFO] unchanged 월 스킵: brand={brand_code}, month={month}")
+            continue
+
+        print(f"[INFO] 메타 처리: brand={brand_code}, month={month}")
+        meta_rows = rows_by_month[month]
 
         for mr in meta_rows:
             stats["total_rows"] += 1
@@ -250,7 +251,7 @@ def process_meta_for_brand(
                     stats["image_skipped_duplicate"] += 1
 
 
-def run_loader(run_id: str, brands: List[str]) -> None:
+def run_loader(run_id: str, brands: List[str], skip_unchanged: bool = False) -> None:
     engine = get_engine(echo=False)
 
     stats = {
@@ -260,11 +261,21 @@ def run_loader(run_id: str, brands: List[str]) -> None:
         "image_inserted": 0,
         "image_skipped_duplicate": 0,
         "danawa_id_conflict": 0,
+        "skipped_unchanged_months": 0,
     }
 
+    # manifest에서 이전 run과 내용이 같다고 표시된 월/브랜드는 적재 생략
+    skip_jobs = load_unchanged_jobs(run_id) if skip_unchanged else set()
+
     with engine.begin() as conn:
         for brand in brands:
-            process_meta_for_brand(conn, run_id=run_id, brand_code=brand, stats=stats)
+            process_meta_for_brand(
+                conn,
+                run_id=run_id,
+                brand_code=brand,
+                stats=stats,
+                skip_jobs=skip_jobs,
+            )
 
     print("\n[SUMMARY] 다나와 메타 로더 결과")
     for k, v in stats.items():
@@ -283,8 +294,16 @@ def main():
         help="대상 브랜드 코드 목록 (예: hyundai kia)",
     )
 
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="manifest에서 이전 run과 내용이 같은(unchanged) 월/브랜드는 건너뜀",
+    )
+
     args = parser.parse_args()
-    run_loader(run_id=args.run_id, brands=args.brands)
+    run_loader(
+        run_id=args.run_id, brands=args.brands, skip_unchanged=args.skip_unchanged
+    )
 
 
 if __name__ == "__main__":
@@ -1,20 +1,18 @@
 # src/etl/sales/load_danawa_sales_from_normalized.py
 
-import csv
-import re
-from pathlib import Path
-
+import pandas as pd
 from sqlalchemy import text
 
 from src.db.connection import get_engine
+from src.etl.sales.danawa_parquet import read_sales
 
 
 # ----------------------------------------
-# 경로 설정
+# 데이터셋 설정
 # ----------------------------------------
 
-BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
-DANAWA_BASE = BASE_DIR / "data" / "raw" / "danawa" / "25_11_14"
+DANAWA_RUN_ID = "25_11_14"
+BRAND_NAME_MAP = {"hyundai": "현대", "kia": "기아"}
 
 
 # ----------------------------------------
@@ -22,27 +20,16 @@ DANAWA_BASE = BASE_DIR / "data" / "raw" / "danawa" / "25_11_14"
 # ----------------------------------------
 
 
-def parse_month_from_filename(filename: str) -> str:
-    """
-    예: hyundai_model_sales_2024_06_00_normalized.csv → '2024-06-01'
-    """
-    m = re.search(r"(\d{4})_(\d{2})_00", filename)
-    if not m:
-        raise ValueError(f"파일명에서 연월을 찾을 수 없음: {filename}")
-    year, month = m.group(1), m.group(2)
-    return f"{year}-{month}-01"
-
-
-def iter_normalized_files():
+def load_staged_sales_frame() -> pd.DataFrame:
     """
-    현대/기아 normalized CSV 전체 경로 + 브랜드 이름을 yield
+    staging 데이터셋에서 DANAWA_RUN_ID 의 현대/기아 파티션,
+    적재에 필요한 컬럼만 읽는다.
     """
-    for brand_name, subdir in [("현대", "hyundai"), ("기아", "kia")]:
-        brand_dir = DANAWA_BASE / subdir
-        if not brand_dir.exists():
-            continue
-        for path in sorted(brand_dir.glob("*_normalized.csv")):
-            yield brand_name, path
+    return read_sales(
+        columns=["brand", "month", "model_name", "sales_units"],
+        run_ids=[DANAWA_RUN_ID],
+        brands=list(BRAND_NAME_MAP),
+    )
 
 
 def build_model_id_map(conn):
@@ -80,73 +67,70 @@ def load_sales():
         inserted_rows = 0
         skipped_no_model = 0
 
-        for brand_name, path in iter_normalized_files():
-            month_date = parse_month_from_filename(path.name)
-            print(f"[INFO] 처리 중: {brand_name} / {path.name} (month={month_date})")
-
-            with path.open("r", encoding="utf-8-sig", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    total_rows += 1
-
-                    model_name = (row.get("모델명") or "").strip()
-                    sales_str = (row.get("판매량") or "").strip()
-
-                    if not model_name:
-                        continue
-
-                    try:
-                        sales_units = (
-                            int(sales_str.replace(",", "")) if sales_str else 0
+        df = load_staged_sales_frame()
+        if df.empty:
+            print(
+                f"[WARN] staging 판매량 데이터 없음: run_id={DANAWA_RUN_ID} "
+                f"(python -m src.etl.sales.danawa_normalizer --run-id {DANAWA_RUN_ID} 로 먼저 staging)"
+            )
+
+        for (brand, month_date), part in df.groupby(["brand", "month"], sort=True):
+            brand_name = BRAND_NAME_MAP[brand]
+            print(f"[INFO] 처리 중: {brand_name} / month={month_date}")
+
+            for model_name, sales in zip(part["model_name"], part["sales_units"]):
+                total_rows += 1
+
+                if not model_name:
+                    continue
+
+                sales_units = 0 if pd.isna(sales) else int(sales)
+
+                key = (brand_name, model_name)
+                model_id = model_id_map.get(key)
+
+                if model_id is None:
+                    skipped_no_model += 1
+                    # 필요하면 경고 로그를 남길 수도 있다.
+                    # print(f"[WARN] car_model에 없는 모델: {brand_name} / {model_name}")
+                    continue
+
+                conn.execute(
+                    text(
+                        """
+                        INSERT INTO model_monthly_sales (
+                            model_id,
+                            month,
+                            sales_units,
+                            market_total_units,
+                            adoption_rate,
+                            source
+                        )
+                        VALUES (
+                            :model_id,
+                            :month,
+                            :sales_units,
+                            :market_total_units,
+                            :adoption_rate,
+                            :source
                         )
-                    except ValueError:
-                        sales_units = 0
-
-                    key = (brand_name, model_name)
-                    model_id = model_id_map.get(key)
-
-                    if model_id is None:
-                        skipped_no_model += 1
-                        # 필요하면 경고 로그를 남길 수도 있다.
-                        # print(f"[WARN] car_model에 없는 모델: {brand_name} / {model_name}")
-                        continue
-
-                    conn.execute(
-                        text(
-                            """
-                            INSERT INTO model_monthly_sales (
-                                model_id,
-                                month,
-                                sales_units,
-                                market_total_units,
-                                adoption_rate,
-                                source
-                            )
-                            VALUES (
-                                :model_id,
-                                :month,
-                                :sales_units,
-                                :market_total_units,
-                                :adoption_rate,
-                                :source
-                            )
-                            ON DUPLICATE KEY UPDATE
-                                sales_units = VALUES(sales_units),
-                                market_total_units = VALUES(market_total_units),
-                                adoption_rate = VALUES(adoption_rate),
-                                source = VALUES(source)
-                            """
-                        ),
-                        {
-                            "model_id": model_id,
-                            "month": month_date,
-                            "sales_units": sales_units,
-                            "market_total_units": None,
-                            "adoption_rate": None,
-                            "source": "DANAWA",
-                        },
-                    )
-                    inserted_rows += 1
+                        ON DUPLICATE KEY UPDATE
+                            sales_units = VALUES(sales_units),
+                            market_total_units = VALUES(market_total_units),
+                            adoption_rate = VALUES(adoption_rate),
+                            source = VALUES(source)
+                        """
+                    ),
+                    {
+                        "model_id": model_id,
+                        "month": month_date,
+                        "sales_units": sales_units,
+                        "market_total_units": None,
+                        "adoption_rate": None,
+                        "source": "DANAWA",
+                    },
+                )
+                inserted_rows += 1
 
         print(f"[DONE] 총 행 수: {total_rows}")
         print(f"[DONE] 삽입/업데이트된 행 수: {inserted_rows}")
@@ -154,7 +138,7 @@ def load_sales():
 
 
 def main():
-    print(f"[INFO] DANAWA_BASE: {DANAWA_BASE}")
+    print(f"[INFO] DANAWA_RUN_ID: {DANAWA_RUN_ID}")
     load_sales()
 
 
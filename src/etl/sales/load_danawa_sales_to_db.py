@@ -3,19 +3,15 @@
 from __future__ import annotations
 
 import argparse
-import csv
-import re
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
+import pandas as pd
 from sqlalchemy import text
 
 from src.db.connection import get_engine
-
-
-BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
-DANAWA_RAW_BASE = BASE_DIR / "data" / "raw" / "danawa"
+from src.etl.sales.danawa_manifest import load_unchanged_jobs
+from src.etl.sales.danawa_parquet import read_sales
 
 # 크롤러에서 쓰는 브랜드 코드 → DB의 brand_name 매핑
 BRAND_KR_MAP: Dict[str, str] = {
@@ -34,124 +30,75 @@ class SalesRow:
     share_ratio: Optional[float]  # 0.1234 이런 형태 (점유율 % / 100)
 
 
-def parse_int_from_str(s: str) -> Optional[int]:
-    """
-    '12,345대' 같은 문자열에서 숫자만 추출해 int로 변환.
-    숫자가 하나도 없으면 None.
+def load_staged_sales(run_id: str, brand_code: str) -> List[SalesRow]:
     """
-    if s is None:
-        return None
-    digits = re.findall(r"\d+", s.replace(",", ""))
-    if not digits:
-        return None
-    return int("".join(digits))
-
-
-def parse_share_ratio(s: str) -> Optional[float]:
+    Parquet staging 데이터셋에서 run_id / brand 파티션만,
+    적재에 필요한 컬럼만 읽어서 SalesRow 리스트로 반환.
+    (판매량이 NULL 인 행은 스킵)
     """
-    '12.3%', '12.3 %', '12.3' 같은 문자열에서
-    첫 번째 실수 값을 찾아서 100으로 나눈 비율(0.xxxx)로 반환.
-    """
-    if not s:
-        return None
-
-    s = s.replace(",", "")
-    m = re.search(r"(-?\d+(?:\.\d+)?)", s)
-    if not m:
-        return None
-    try:
-        val = float(m.group(1))
-    except ValueError:
-        return None
-    return val / 100.0
-
-
-def extract_month_date_from_filename(stem: str) -> str:
-    """
-    예: 'kia_model_sales_2023_01_00_normalized' 에서
-        '2023-01-01' 로 변환.
-    """
-    m = re.search(r"(\d{4})_(\d{2})_00", stem)
-    if not m:
-        raise ValueError(f"파일명에서 월 정보를 찾을 수 없음: {stem}")
-    year, month = m.group(1), m.group(2)
-    return f"{year}-{month}-01"
-
+    df = read_sales(
+        columns=["month", "rank", "model_name", "sales_units", "share_pct"],
+        run_ids=[run_id],
+        brands=[brand_code.lower()],
+    )
+    df = df[df["sales_units"].notna() & (df["model_name"] != "")]
 
-def load_normalized_sales_csv(path: Path, brand_code_from_dir: str) -> List[SalesRow]:
-    """
-    *_model_sales_*_normalized.csv 파일 하나를 읽어서 SalesRow 리스트로 반환.
-    정규화된 CSV 헤더: 순위,모델명,판매량,점유율,전월대비,전년대비
-    """
-    month_date = extract_month_date_from_filename(path.stem)
     rows: List[SalesRow] = []
-
-    with path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            rank_str = (r.get("순위") or "").strip()
-            model_name = (r.get("모델명") or "").strip()
-            sales_str = (r.get("판매량") or "").strip()
-            share_str = (r.get("점유율") or "").strip()
-
-            if not model_name:
-                continue
-
-            rank = parse_int_from_str(rank_str) or 0
-            sales_units = parse_int_from_str(sales_str)
-            if sales_units is None:
-                # 판매량이 숫자로 파싱 안되면 스킵
-                continue
-
-            share_ratio = parse_share_ratio(share_str)
-
-            rows.append(
-                SalesRow(
-                    brand_code=brand_code_from_dir.lower(),
-                    month=month_date,
-                    rank=rank,
-                    model_name=model_name,
-                    sales_units=sales_units,
-                    share_ratio=share_ratio,
-                )
+    for month, rank, model_name, sales_units, share_pct in zip(
+        df["month"], df["rank"], df["model_name"], df["sales_units"], df["share_pct"]
+    ):
+        rows.append(
+            SalesRow(
+                brand_code=brand_code.lower(),
+                month=month,
+                rank=0 if pd.isna(rank) else int(rank),
+                model_name=model_name,
+                sales_units=int(sales_units),
+                share_ratio=None if pd.isna(share_pct) else float(share_pct) / 100.0,
             )
-
+        )
     return rows
 
 
 def process_sales_for_brand(
-    conn, run_id: str, brand_code: str, stats: Dict[str, int]
+    conn,
+    run_id: str,
+    brand_code: str,
+    stats: Dict[str, int],
+    skip_jobs: Optional[Set[Tuple[str, str]]] = None,
 ) -> None:
     """
     특정 run_id / brand 에 대해:
-      data/raw/danawa/<run_id>/<brand>/*_model_sales_*_normalized.csv 를 모두 처리
+      Parquet staging 데이터셋의 run_id=<run_id>/brand=<brand> 파티션을 월별로 처리
     """
-    brand_dir = DANAWA_RAW_BASE / run_id / brand_code
-    if not brand_dir.exists():
-        print(f"[WARN] 브랜드 디렉토리 없음: {brand_dir}")
-        return
-
-    print(
-        f"\n[INFO] 판매량 로더 시작: run_id={run_id}, brand={brand_code}, dir={brand_dir}"
-    )
+    print(f"\n[INFO] 판매량 로더 시작: run_id={run_id}, brand={brand_code}")
 
     brand_name_kr = BRAND_KR_MAP.get(brand_code.lower())
     if not brand_name_kr:
         print(f"[WARN] BRAND_KR_MAP에 없는 브랜드 코드: {brand_code}")
         return
 
-    sales_files = sorted(brand_dir.glob("*_model_sales_*_normalized.csv"))
-    if not sales_files:
-        print(f"[WARN] 정규화된 판매량 CSV 없음: {brand_dir}")
+    rows_by_month: Dict[str, List[SalesRow]] = {}
+    for sr in load_staged_sales(run_id, brand_code):
+        rows_by_month.setdefault(sr.month, []).append(sr)
+
+    if not rows_by_month:
+        print(
+            f"[WARN] staging 판매량 데이터 없음: run_id={run_id}, brand={brand_code} "
+            f"(python -m src.etl.sales.danawa_normalizer --run-id {run_id} 로 먼저 staging)"
+        )
         return
 
-    for path in sales_files:
-        print(f"[INFO] 판매량 파일 처리: {path}")
-        sales_rows = load_normalized_sales_csv(path, brand_code_from_dir=brand_code)
-        if not sales_rows:
+    for month in sorted(rows_by_month):
+        if skip_jobs and (brand_code.lower(), month) in skip_jobs:
+            stats["skipped_unchanged_months"] += 1
+            print(f"[INFO] unchanged 월 스킵: brand={brand_code}, month={month}")
             continue
 
-        # 같은 파일(=같은 month, 같은 brand) 내에서 total_units 계산
+        print(f"[INFO] 판매량 처리: brand={brand_code}, month={month}")
+        sales_rows = rows_by_month[month]
+
+        # 같은 파티션(=같은 month, 같은 brand) 내에서 total_units 계산
         total_units_by_month: Dict[str, int] = {}
         for sr in sales_rows:
             total_units_by_month.setdefault(sr.month, 0)
@@ -235,18 +182,28 @@ def process_sales_for_brand(
             stats["insert_or_update"] += 1
 
 
-def run_loader(run_id: str, brands: List[str]) -> None:
+def run_loader(run_id: str, brands: List[str], skip_unchanged: bool = False) -> None:
     engine = get_engine(echo=False)
 
     stats: Dict[str, int] = {
         "total_rows": 0,
         "no_model_match": 0,
         "insert_or_update": 0,
+        "skipped_unchanged_months": 0,
     }
 
+    # manifest에서 이전 run과 내용이 같다고 표시된 월/브랜드는 적재 생략
+    skip_jobs = load_unchanged_jobs(run_id) if skip_unchanged else set()
+
     with engine.begin() as conn:
         for brand in brands:
-            process_sales_for_brand(conn, run_id=run_id, brand_code=brand, stats=stats)
+            process_sales_for_brand(
+                conn,
+                run_id=run_id,
+                brand_code=brand,
+                stats=stats,
+                skip_jobs=skip_jobs,
+            )
 
     print("\n[SUMMARY] 다나와 판매량 로더 결과")
     for k, v in stats.items():
@@ -264,9 +221,16 @@ def main():
         default=["hyundai", "kia"],
         help="대상 브랜드 코드 (예: hyundai kia)",
     )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="manifest에서 이전 run과 내용이 같은(unchanged) 월/브랜드는 건너뜀",
+    )
     args = parser.parse_args()
 
-    run_loader(run_id=args.run_id, brands=args.brands)
+    run_loader(
+        run_id=args.run_id, brands=args.brands, skip_unchanged=args.skip_unchanged
+    )
 
 
 if __name__ == "__main__":
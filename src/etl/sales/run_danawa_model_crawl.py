@@ -13,7 +13,13 @@ from src.etl.sales.danawa_scraper import (
     save_meta_csv,
     Brand,
 )
-from src.etl.sales.danawa_normalizer import normalize_folder
+from src.etl.sales.danawa_normalizer import normalize_file
+from src.etl.sales.danawa_parquet import stage_meta_csv
+from src.etl.sales.danawa_manifest import (
+    load_manifest,
+    is_job_completed,
+    record_job,
+)
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
@@ -33,34 +39,68 @@ def run_crawl(
     end_month: int,
     brands: List[Brand],
     headless: bool = True,
+    force: bool = False,
 ) -> None:
+    """
+    (month, brand) 단위로 크롤링한다.
+    완료된 작업은 data/raw/danawa/<run_id>/manifest.json 에 기록되므로,
+    중간에 죽은 run을 같은 run_id로 다시 실행하면 남은 작업부터 이어서 수집한다.
+    force=True 면 manifest를 무시하고 전부 다시 수집한다.
+    """
     months = build_month_list(year, start_month, end_month)
     base_raw = BASE_DIR / "data" / "raw" / "danawa" / run_id
 
+    manifest = load_manifest(run_id)
+
+    pending = [
+        (month, brand)
+        for month in months
+        for brand in brands
+        if force or not is_job_completed(manifest, month, brand)
+    ]
+    skipped = len(months) * len(brands) - len(pending)
+    if skipped:
+        print(f"[INFO] manifest 기준 완료된 작업 {skipped}개 스킵")
+    if not pending:
+        print(f"[INFO] 수집할 작업이 없습니다: run_id={run_id}")
+        return
+
     driver = get_driver(headless=headless)
     try:
-        for month in months:
-            for brand in brands:
-                rows = scrape_month_for_brand(driver, brand=brand, month=month)
-
-                if not rows:
-                    continue
-
-                brand_dir = base_raw / brand
-                brand_dir.mkdir(parents=True, exist_ok=True)
-
-                # raw 판매량 CSV: 기존 팀원 명명 규칙 유지
-                sales_filename = f"{brand}_model_sales_{month.replace('-', '_')}.csv"
-                sales_path = brand_dir / sales_filename
-                save_sales_csv(rows, sales_path)
-
-                # 메타 CSV: 모델 상세 URL / 이미지 URL
-                meta_filename = f"{brand}_model_meta_{month.replace('-', '_')}.csv"
-                meta_path = brand_dir / meta_filename
-                save_meta_csv(rows, meta_path)
-
-                # 바로 이 폴더에 대해 normalized CSV 생성
-                normalize_folder(brand_dir)
+        for month, brand in pending:
+            rows = scrape_month_for_brand(driver, brand=brand, month=month)
+
+            if not rows:
+                continue
+
+            brand_dir = base_raw / brand
+            brand_dir.mkdir(parents=True, exist_ok=True)
+
+            # raw 판매량 CSV: 기존 팀원 명명 규칙 유지
+            sales_filename = f"{brand}_model_sales_{month.replace('-', '_')}.csv"
+            sales_path = brand_dir / sales_filename
+            save_sales_csv(rows, sales_path)
+
+            # 메타 CSV: 모델 상세 URL / 이미지 URL
+            meta_filename = f"{brand}_model_meta_{month.replace('-', '_')}.csv"
+            meta_path = brand_dir / meta_filename
+            save_meta_csv(rows, meta_path)
+            stage_meta_csv(meta_path)
+
+            # 방금 저장한 판매량 CSV만 normalized CSV + Parquet staging 으로 변환
+            # (폴더 전체 재정규화는 danawa_normalizer --full 로 따로 실행)
+            normalize_file(sales_path)
+
+            job = record_job(
+                manifest,
+                month=month,
+                brand=brand,
+                rows=rows,
+                sales_file=sales_filename,
+                meta_file=meta_filename,
+            )
+            if job["unchanged"]:
+                print(f"[INFO] 이전 run과 내용 동일 (unchanged): {month} / {brand}")
 
     finally:
         driver.quit()
@@ -84,6 +124,12 @@ def main():
         help="지정하면 브라우저 창을 실제로 띄움",
     )
 
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="manifest에 완료로 기록된 작업도 다시 수집",
+    )
+
     args = parser.parse_args()
 
     brands: List[Brand] = [b for b in args.brands]  # 간단 캐스팅
@@ -95,6 +141,7 @@ def main():
         end_month=args.end_month,
         brands=brands,
         headless=not args.no_headless,
+        force=args.force,
     )
 
 
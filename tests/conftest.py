@@ -0,0 +1,11 @@
+# tests/conftest.py
+"""
+pytest 공통 설정.
+프로젝트 루트를 sys.path 에 넣어서 `src.` 로 import 한다. (스크립트를 python -m src... 로 실행하는 것과 같은 기준)
+"""
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]  # 프로젝트 루트
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
@@ -0,0 +1,138 @@
+# tests/datalab_stub_server.py
+"""
+네이버 데이터랩 검색 API stub 서버 (로컬 스레드 HTTP 서버)
+
+AsyncNaverDatalabClient(base_url=server.url) 로 붙여서 호출 속도 / 재시도 / 한도를 확인한다.
+
+    with DatalabStubServer(statuses=[503, 429]) as server:
+        ... 처음 두 요청은 503, 429 → 이후는 200
+
+- statuses: 앞에서부터 차례로 쓸 HTTP 상태 목록 (다 쓰면 default_status)
+- retry_after: 429 응답에 붙일 Retry-After 헤더 값(초)
+- delay_sec: 응답 전 대기 (동시 요청 수 확인용)
+- requests: 받은 요청 (monotonic 시각, body) 목록 / sent_statuses: 돌려준 상태 목록
+- max_in_flight: 최대 동시 처리 수
+
+200 응답은 실제 API 처럼 요청 안의 최고값 = 100 으로 정규화된 ratio 를 돌려준다.
+(그룹 검색량 = groupName 길이 × 10, 기간 내 월마다 같은 값)
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def month_periods(start_date: str, end_date: str) -> List[str]:
+    """'YYYY-MM-DD' 두 개 → 그 사이 월 시작일 목록"""
+    year, month = int(start_date[:4]), int(start_date[5:7])
+    periods = []
+    while f"{year:04d}-{month:02d}" <= end_date[:7]:
+        periods.append(f"{year:04d}-{month:02d}-01")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return periods
+
+
+def datalab_response(body: Dict[str, Any]) -> Dict[str, Any]:
+    """요청 body → 데이터랩 응답 형식 JSON"""
+    groups = body["keywordGroups"]
+    volumes = {g["groupName"]: len(g["groupName"]) * 10 for g in groups}
+    top = max(volumes.values())
+    periods = month_periods(body["startDate"], body["endDate"])
+    return {
+        "startDate": body["startDate"],
+        "endDate": body["endDate"],
+        "timeUnit": body["timeUnit"],
+        "results": [
+            {
+                "title": g["groupName"],
+                "keywords": g["keywords"],
+                "data": [
+                    {"period": p, "ratio": round(volumes[g["groupName"]] * 100 / top, 5)}
+                    for p in periods
+                ],
+            }
+            for g in groups
+        ],
+    }
+
+
+class DatalabStubServer:
+    def __init__(
+        self,
+        statuses: Optional[List[int]] = None,
+        default_status: int = 200,
+        retry_after: Optional[int] = None,
+        delay_sec: float = 0.0,
+    ):
+        self.statuses = list(statuses or [])
+        self.default_status = default_status
+        self.retry_after = retry_after
+        self.delay_sec = delay_sec
+
+        self.requests: List[Tuple[float, Dict[str, Any]]] = []
+        self.sent_statuses: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/v1/datalab/search"
+
+    def __enter__(self) -> "DatalabStubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next_status(self, body: Dict[str, Any]) -> int:
+        with self._lock:
+            self.requests.append((time.monotonic(), body))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            status = self.statuses.pop(0) if self.statuses else self.default_status
+            self.sent_statuses.append(status)
+            return status
+
+    def _done(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length))
+                status = stub._next_status(body)
+                try:
+                    if stub.delay_sec:
+                        time.sleep(stub.delay_sec)
+                    if status == 200:
+                        payload = json.dumps(datalab_response(body)).encode("utf-8")
+                    else:
+                        payload = json.dumps({"errorCode": str(status)}).encode("utf-8")
+                finally:
+                    stub._done()
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                if status == 429 and stub.retry_after is not None:
+                    self.send_header("Retry-After", str(stub.retry_after))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
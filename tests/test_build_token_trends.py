@@ -0,0 +1,84 @@
+# tests/test_build_token_trends.py
+"""
+build_token_trends.main 을 sqlite engine 으로 끝까지 실행 (읽기 → 계산 → blog_token_trend 교체)
+"""
+import datetime
+import sys
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import src.etl.blog.build_token_trends as trends
+
+OCT = datetime.date(2025, 10, 1)
+NOV = datetime.date(2025, 11, 1)
+
+# (model_id, month, token, total_count)
+TOKEN_ROWS = [
+    (1, OCT, "연비", 10), (1, OCT, "디자인", 8), (1, OCT, "가격", 4),
+    (1, NOV, "연비", 3), (1, NOV, "디자인", 6), (1, NOV, "가격", 12),
+    (2, OCT, "연비", 5), (2, OCT, "승차감", 9), (2, OCT, "소음", 2),
+    (2, NOV, "연비", 6), (2, NOV, "승차감", 4), (2, NOV, "소음", 8),
+]
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'trend.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text("CREATE TABLE blog_token_monthly (model_id INT, month DATE, token TEXT, total_count INT)")
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE blog_token_trend ("
+                " model_id INT, month DATE, kind TEXT, token_rank INT, token TEXT,"
+                " score REAL, share REAL, prev_share REAL,"
+                " PRIMARY KEY (model_id, month, kind, token_rank))"
+            )
+        )
+        conn.execute(
+            text("INSERT INTO blog_token_monthly VALUES (:m, :month, :t, :c)"),
+            [{"m": m, "month": month, "t": t, "c": c} for m, month, t, c in TOKEN_ROWS],
+        )
+    monkeypatch.setattr(trends, "get_engine", lambda echo=False: engine)
+    return engine
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["build_token_trends", "--run-id", "t", "--min-count", "1", *args])
+    trends.main()
+
+
+def fetch_trends(engine):
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT model_id, month, kind, token_rank, token FROM blog_token_trend ORDER BY 1, 2, 3, 4")
+        ).fetchall()
+
+
+def test_main_writes_trends(engine, monkeypatch):
+    run_main(monkeypatch)
+    rows = fetch_trends(engine)
+
+    kinds = {(r.model_id, r.month, r.kind) for r in rows}
+    assert (1, "2025-11-01", "rising") in kinds
+    assert (2, "2025-10-01", "tfidf") in kinds
+    rising = [r.token for r in rows if (r.model_id, r.month, r.kind) == (1, "2025-11-01", "rising")]
+    assert rising[0] == "가격"
+
+
+def test_main_replaces_single_month(engine, monkeypatch):
+    run_main(monkeypatch)
+    before = fetch_trends(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO blog_token_trend VALUES (9, '2025-11-01', 'tfidf', 1, '낡은값', 1, 1, NULL)")
+        )
+
+    # --month 로 다시 돌리면 그 달만 지우고 다시 채운다 (다른 달은 그대로)
+    run_main(monkeypatch, "--month", "2025-11")
+    after = fetch_trends(engine)
+
+    assert all(r.token != "낡은값" for r in after)
+    assert after == before
@@ -0,0 +1,174 @@
+# tests/test_google_trends.py
+"""
+구글 트렌드 수집 테스트 (pytrends 대신 StubTrendsBackend 사용, 네트워크/DB 없음)
+
+- rescale_group: 앵커 최고값 = 100 기준 스케일
+- write_wide_csv: 구글 트렌드 내보내기 형식
+- run_google_trend_crawl: 캐시 + 재개 (실패한 그룹만 다시 요청)
+"""
+import csv
+import threading
+from typing import Dict, List, Optional, Set
+
+import pandas as pd
+import pytest
+
+import src.api.google_trends as google_trends
+import src.etl.interest.run_google_trend_crawl as crawl
+from src.etl.interest.run_google_trend_crawl import rescale_group, write_wide_csv
+
+ANCHOR = "자동차"
+
+MODELS = [
+    {"model_id": 1, "brand_name": "현대", "model_name_kr": "아반떼"},
+    {"model_id": 2, "brand_name": "현대", "model_name_kr": "캐스퍼"},
+    {"model_id": 3, "brand_name": "현대", "model_name_kr": "그랜저"},
+    {"model_id": 4, "brand_name": "기아", "model_name_kr": "EV3"},
+    {"model_id": 5, "brand_name": "기아", "model_name_kr": "쏘렌토"},
+    {"model_id": 6, "brand_name": "기아", "model_name_kr": "레이"},
+]
+
+# 키워드별 "실제" 검색량 (그룹 안 최고값 = 100 으로 잘라서 돌려준다)
+VOLUMES = {ANCHOR: 50, "아반떼": 40, "캐스퍼": 20, "그랜저": 30, "EV3": 10, "쏘렌토": 25, "레이": 15}
+
+
+class StubTrendsBackend:
+    """
+    TrendsBackend stub. pytrends interest_over_time 과 같은 형태(주 단위 인덱스 + isPartial)를 돌려준다.
+    fail_keywords 가 들어간 요청은 항상 실패한다.
+    """
+
+    def __init__(self, fail_keywords: Optional[Set[str]] = None):
+        self.fail_keywords = fail_keywords or set()
+        self.requests: List[List[str]] = []
+        self._lock = threading.Lock()
+
+    def interest_over_time(
+        self, keywords: List[str], timeframe: str, geo: str, cat: int
+    ) -> pd.DataFrame:
+        with self._lock:
+            self.requests.append(list(keywords))
+        if self.fail_keywords & set(keywords):
+            raise RuntimeError("The request failed: Google returned a response with code 400")
+
+        start, end = timeframe.split()
+        index = pd.date_range(start, end, freq="W-SUN")
+        group_max = max(VOLUMES[kw] for kw in keywords)
+        frame = {kw: [round(VOLUMES[kw] * 100 / group_max)] * len(index) for kw in keywords}
+        frame["isPartial"] = [False] * len(index)
+        return pd.DataFrame(frame, index=index)
+
+
+@pytest.fixture
+def crawl_env(tmp_path, monkeypatch):
+    """
+    출력/캐시 경로를 tmp_path 로 돌리고, DB 조회와 요청 간격 jitter 를 없앤다.
+    """
+    monkeypatch.setattr(crawl, "GOOGLE_DIR", tmp_path / "raw")
+    monkeypatch.setattr(crawl, "GOOGLE_TRENDS_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(crawl, "fetch_target_models", lambda brands: list(MODELS))
+    monkeypatch.setattr(google_trends.random, "uniform", lambda a, b: a)
+    return tmp_path
+
+
+def run_crawl(backend: StubTrendsBackend, **kwargs):
+    return crawl.run_google_trend_crawl(
+        "t",
+        "2024-01-01",
+        "2024-02-29",
+        min_interval_sec=0.0,
+        max_retries=0,
+        backend=backend,
+        **kwargs,
+    )
+
+
+def read_wide_csv(path) -> Dict[str, Dict[str, str]]:
+    """wide CSV → {키워드: {날짜: 값}}"""
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        assert f.readline().startswith("카테고리:")
+        rows = list(csv.reader(f))
+    header, body = rows[0], rows[1:]
+    keywords = [h.split(":")[0] for h in header[1:]]
+    return {kw: {row[0]: row[i + 1] for row in body} for i, kw in enumerate(keywords)}
+
+
+def test_pytrends_tz_is_kst():
+    # pytrends 는 UTC 오프셋 부호를 뒤집어 받는다 (KST = -540)
+    assert google_trends.KST_TZ == -540
+
+
+def test_rescale_group_uses_anchor_max():
+    data = {
+        "dates": ["2024-01-07", "2024-01-14", "2024-01-21"],
+        "values": {ANCHOR: [50.0, 25.0, None], "아반떼": [100.0, 40.0, 10.0], "캐스퍼": [None, 5.0, 0.0]},
+    }
+    scaled = rescale_group(data, ANCHOR)
+
+    assert set(scaled) == {"아반떼", "캐스퍼"}
+    assert scaled["아반떼"] == {"2024-01-07": 200.0, "2024-01-14": 80.0, "2024-01-21": 20.0}
+    assert scaled["캐스퍼"] == {"2024-01-14": 10.0, "2024-01-21": 0.0}
+
+
+def test_rescale_group_without_anchor_data():
+    assert rescale_group({"dates": ["2024-01-07"], "values": {ANCHOR: [0.0], "레이": [3.0]}}, ANCHOR) is None
+    assert rescale_group({"dates": ["2024-01-07"], "values": {"레이": [3.0]}}, ANCHOR) is None
+
+
+def test_write_wide_csv_format(tmp_path):
+    path = tmp_path / "wide.csv"
+    scaled = {"아반떼": {"2024-01-07": 80.0, "2024-01-14": 60.5}, "캐스퍼": {"2024-01-14": 40.0}}
+
+    n_cols = write_wide_csv(path, ["아반떼", "캐스퍼", "그랜저"], scaled, "KR", "자동차")
+
+    assert n_cols == 2
+    lines = path.read_text(encoding="utf-8-sig").splitlines()
+    assert lines == [
+        "카테고리: 자동차",
+        "주,아반떼: (대한민국),캐스퍼: (대한민국)",
+        "2024-01-07,80.0,",
+        "2024-01-14,60.5,40.0",
+    ]
+
+
+def test_crawl_rescales_across_groups(crawl_env):
+    backend = StubTrendsBackend()
+    out_paths = run_crawl(backend)
+
+    # 모델 6개 → 그룹 2개 (4 + 2), 요청마다 앵커 포함
+    assert len(backend.requests) == 2
+    assert all(req[-1] == ANCHOR and len(req) <= google_trends.MAX_KEYWORDS for req in backend.requests)
+
+    values = {}
+    for path in out_paths:
+        values.update(read_wide_csv(path))
+    # 어느 그룹에 들어갔든 앵커(50) 대비 비율로 맞춰진다
+    for keyword in ["아반떼", "캐스퍼", "그랜저", "EV3", "쏘렌토", "레이"]:
+        assert set(values[keyword].values()) == {str(VOLUMES[keyword] * 100 / VOLUMES[ANCHOR])}
+
+
+def test_crawl_resumes_from_cache(crawl_env):
+    # 1회차: 레이가 들어간 그룹만 실패
+    first = StubTrendsBackend(fail_keywords={"레이"})
+    out_paths = run_crawl(first)
+    assert len(first.requests) == 2
+    kia = read_wide_csv(next(p for p in out_paths if p.name.endswith("_KIA_all.csv")))
+    assert "레이" not in kia
+
+    # 2회차: 끝난 그룹은 캐시에서, 실패한 그룹만 다시 요청
+    second = StubTrendsBackend()
+    out_paths = run_crawl(second)
+    assert len(second.requests) == 1
+    assert "레이" in second.requests[0]
+    kia = read_wide_csv(next(p for p in out_paths if p.name.endswith("_KIA_all.csv")))
+    assert set(kia) == {"EV3", "쏘렌토", "레이"}
+
+    # 3회차: 전부 캐시 (지난 기간 → TTL 과 무관하게 만료 없음)
+    third = StubTrendsBackend()
+    run_crawl(third, cache_ttl_hours=0)
+    assert third.requests == []
+
+    # refresh=True 면 캐시를 읽지 않는다
+    fourth = StubTrendsBackend()
+    run_crawl(fourth, refresh=True)
+    assert len(fourth.requests) == 2
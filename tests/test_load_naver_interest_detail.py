@@ -0,0 +1,82 @@
+# tests/test_load_naver_interest_detail.py
+"""
+네이버 detail 적재: 같은 (model, month, device, gender, age_group) 을 두 번 upsert 하면 한 행만 남아야 한다.
+
+MySQL 이 없는 환경이라 UPSERT_SQL 을 받아서 uk_model_month_filter 기준으로 적용하는 stub 연결을 쓴다.
+(MySQL UNIQUE KEY 와 같이 키에 NULL 이 있으면 어떤 행과도 같지 않다고 보고 새 행을 추가)
+"""
+from typing import Any, Dict, List
+
+from src.etl.interest.load_naver_interest_detail import (
+    UPSERT_SQL,
+    StreamingDetailLoader,
+    load_executemany,
+    parse_detail_row,
+)
+
+UNIQUE_KEY = ("model_id", "month", "device", "gender", "age_group")
+
+
+class StubMySQLConnection:
+    """model_monthly_interest_detail 에 대한 INSERT ... ON DUPLICATE KEY UPDATE ratio 만 흉내낸다."""
+
+    def __init__(self):
+        self.rows: List[Dict[str, Any]] = []
+        self.commits = 0
+
+    def execute(self, sql, params):
+        assert sql is UPSERT_SQL
+        for p in params:
+            key = tuple(p[c] for c in UNIQUE_KEY)
+            match = None
+            if None not in key:
+                match = next(
+                    (r for r in self.rows if tuple(r[c] for c in UNIQUE_KEY) == key), None
+                )
+            if match is None:
+                self.rows.append(dict(p))
+            else:
+                match["ratio"] = p["ratio"]
+
+    def commit(self):
+        self.commits += 1
+
+
+def raw_row(ratio: float, age_group: str = "") -> Dict[str, str]:
+    return {
+        "model_id": "7",
+        "month": "2025-10-01",
+        "device": "mobile",
+        "gender": "female",
+        "age_group": age_group,
+        "ratio": str(ratio),
+    }
+
+
+def test_filter_columns_are_never_null():
+    parsed = parse_detail_row({**raw_row(1.0), "device": "", "gender": " "})
+    assert (parsed["device"], parsed["gender"], parsed["age_group"]) == ("", "", "")
+
+
+def test_streaming_upsert_twice_keeps_one_row():
+    conn = StubMySQLConnection()
+
+    # 1회차: 부분 집계 값, 2회차: 다음 실행에서 다시 받은 값
+    for ratio in (12.5, 40.0):
+        loader = StreamingDetailLoader(conn, chunk_size=10)
+        loader.add(raw_row(ratio))
+        loader.add(raw_row(55.0, age_group="19-24"))
+        loader.flush()
+
+    assert len(conn.rows) == 2
+    no_age = [r for r in conn.rows if r["age_group"] == ""]
+    assert len(no_age) == 1
+    assert no_age[0]["ratio"] == 40.0
+
+
+def test_executemany_upsert_twice_keeps_one_row():
+    conn = StubMySQLConnection()
+    load_executemany(conn, [parse_detail_row(raw_row(10.0))])
+    load_executemany(conn, [parse_detail_row(raw_row(20.0))])
+
+    assert [r["ratio"] for r in conn.rows] == [20.0]
@@ -0,0 +1,154 @@
+# tests/test_naver_datalab_async.py
+"""
+AsyncNaverDatalabClient 테스트 (tests/datalab_stub_server 상대, 실제 API 키/네트워크 없음)
+
+- 토큰 버킷: 초당 호출 수 / 동시 요청 수
+- 429 / 5xx 재시도 + 백오프 (Retry-After 우선), 재시도 초과 / 4xx 는 예외
+- 일일 한도: QuotaExceededError (재시도도 한도에 포함)
+"""
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+import requests
+
+from datalab_stub_server import DatalabStubServer
+from src.api.naver_datalab_async import AsyncNaverDatalabClient, QuotaExceededError
+from src.api.naver_datalab_cache import DatalabCache
+
+ANCHOR = "자동차"
+
+
+def make_client(server: DatalabStubServer, **kwargs) -> AsyncNaverDatalabClient:
+    options: Dict[str, Any] = {
+        "client_id": "test-id",
+        "client_secret": "test-secret",
+        "base_url": server.url,
+        "backoff_base": 0.01,
+        "backoff_max": 0.05,
+        "timeout": 5.0,
+    }
+    options.update(kwargs)
+    return AsyncNaverDatalabClient(**options)
+
+
+async def fetch_months(client: AsyncNaverDatalabClient, months: List[int]):
+    """월마다 다른 기간으로 요청 (body 가 달라서 캐시/중복 없이 각각 한 번씩)"""
+    async with client:
+        return await asyncio.gather(
+            *[
+                client.fetch_trend_anchored(
+                    ["아반떼", "EV3"], ANCHOR, f"2024-{m:02d}-01", f"2024-{m:02d}-28"
+                )
+                for m in months
+            ]
+        )
+
+
+def test_anchored_results_are_rescaled():
+    with DatalabStubServer() as server:
+        (results,) = asyncio.run(fetch_months(make_client(server), [1]))
+
+    # stub 검색량 = groupName 길이 × 10 → 아반떼 30, EV3 30, 자동차 30
+    assert set(results) == {"아반떼", "EV3"}
+    assert results["아반떼"] == [{"period": "2024-01-01", "ratio": 100.0}]
+
+
+def test_token_bucket_paces_requests():
+    rate = 10.0
+    with DatalabStubServer() as server:
+        client = make_client(server, concurrency=2, rate_per_sec=rate)
+        asyncio.run(fetch_months(client, list(range(1, 9))))
+        times = sorted(t for t, _ in server.requests)
+
+    assert len(times) == 8
+    # burst(= concurrency) 2개는 바로, 그 뒤로는 1/rate 초마다 한 개
+    for i in range(2, len(times)):
+        assert times[i] - times[0] >= (i - 1) / rate - 0.02
+
+
+def test_concurrency_limit():
+    with DatalabStubServer(delay_sec=0.2) as server:
+        client = make_client(server, concurrency=2, rate_per_sec=100.0)
+        asyncio.run(fetch_months(client, list(range(1, 7))))
+
+    assert len(server.requests) == 6
+    assert server.max_in_flight == 2
+
+
+def test_retries_429_and_5xx_then_succeeds():
+    with DatalabStubServer(statuses=[503, 500, 429]) as server:
+        client = make_client(server, concurrency=1, rate_per_sec=100.0, max_retries=4)
+        (results,) = asyncio.run(fetch_months(client, [1]))
+
+    assert server.sent_statuses == [503, 500, 429, 200]
+    assert client.call_count == 4
+    assert client.retry_count == 3
+    assert results["EV3"][0]["ratio"] == 100.0
+
+
+def test_retry_after_header_overrides_backoff():
+    with DatalabStubServer(statuses=[429], retry_after=1) as server:
+        client = make_client(server, concurrency=1, rate_per_sec=100.0, backoff_max=5.0)
+        asyncio.run(fetch_months(client, [1]))
+        (first, _), (second, _) = server.requests
+
+    assert second - first >= 0.9
+
+
+def test_gives_up_after_max_retries():
+    with DatalabStubServer(default_status=503) as server:
+        client = make_client(server, concurrency=1, rate_per_sec=100.0, max_retries=2)
+        with pytest.raises(requests.HTTPError):
+            asyncio.run(fetch_months(client, [1]))
+
+    assert server.sent_statuses == [503, 503, 503]
+    assert client.retry_count == 2
+
+
+def test_client_error_is_not_retried():
+    with DatalabStubServer(statuses=[400]) as server:
+        client = make_client(server, concurrency=1, rate_per_sec=100.0)
+        with pytest.raises(requests.HTTPError):
+            asyncio.run(fetch_months(client, [1]))
+
+    assert client.call_count == 1
+
+
+def test_daily_quota_exceeded():
+    with DatalabStubServer() as server:
+        client = make_client(server, concurrency=1, rate_per_sec=100.0, daily_quota=3)
+        for month in range(1, 4):
+            asyncio.run(fetch_months(client, [month]))
+        with pytest.raises(QuotaExceededError):
+            asyncio.run(fetch_months(client, [4]))
+
+    assert len(server.requests) == 3
+    assert client.bucket.used_today == 3
+
+
+def test_retries_count_against_daily_quota():
+    with DatalabStubServer(statuses=[503]) as server:
+        client = make_client(server, concurrency=1, rate_per_sec=100.0, daily_quota=2)
+
+        async def _run():
+            async with client:
+                await client.fetch_trend_anchored(["EV3"], ANCHOR, "2024-01-01", "2024-01-31")
+                with pytest.raises(QuotaExceededError):
+                    await client.fetch_trend_anchored(["EV3"], ANCHOR, "2024-02-01", "2024-02-29")
+
+        asyncio.run(_run())
+
+    assert server.sent_statuses == [503, 200]
+
+
+def test_cache_hit_skips_request_and_token(tmp_path):
+    with DatalabStubServer() as server:
+        cache = DatalabCache(cache_dir=tmp_path)
+        client = make_client(server, concurrency=1, rate_per_sec=100.0, daily_quota=1, cache=cache)
+        (first,) = asyncio.run(fetch_months(client, [1]))
+        (second,) = asyncio.run(fetch_months(client, [1]))
+
+    assert first == second
+    assert len(server.requests) == 1
+    assert (cache.hits, cache.misses) == (1, 1)